@@ -1,28 +1,119 @@
-from sqlalchemy import create_engine
+from typing import Optional
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from db_metrics import StatementMetrics
 import os
 
-
 SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL")
 
-# 엔진 생성
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    echo=True,  # SQL 쿼리 로깅 활성화 (개발 환경에서 유용)
-    pool_pre_ping=True,  # 연결 확인 기능 추가
-)
+# 비동기 드라이버 (DATABASE_URL의 동기 드라이버를 대응하는 비동기 드라이버로 교체)
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+# 환경별 엔진 프로필 (DB_PROFILE=dev|prod)
+# dev는 SQL/파라미터를 모두 로깅하고, prod는 로깅 없이 더 큰 풀을 사용한다.
+# 요청마다 세션 하나를 쓰므로 pool_size + max_overflow가 동시에 DB를 사용하는 요청 수 상한
+# pool_recycle은 방화벽/DB의 유휴 커넥션 정리보다 먼저 재연결하기 위한 값
+DB_PROFILES = {
+    "dev": {
+        "echo": True,
+        "pool_size": 5,
+        "max_overflow": 10,
+        "pool_timeout": 30,
+        "pool_recycle": 1800,
+    },
+    "prod": {
+        "echo": False,
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_timeout": 30,
+        "pool_recycle": 1800,
+    },
+}
+
+DB_PROFILE = os.getenv("DB_PROFILE", "dev")
+if DB_PROFILE not in DB_PROFILES:
+    raise ValueError(
+        f"알 수 없는 DB_PROFILE입니다: {DB_PROFILE} ({', '.join(DB_PROFILES)})"
+    )
+
+# 프로필 값은 개별 환경 변수로 덮어쓸 수 있음
+_profile = DB_PROFILES[DB_PROFILE]
+DB_ECHO = os.getenv("DB_ECHO", str(_profile["echo"])).lower() in ("1", "true", "yes")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", _profile["pool_size"]))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", _profile["max_overflow"]))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", _profile["pool_timeout"]))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", _profile["pool_recycle"]))
+
+
+def to_async_url(url: str) -> str:
+    """postgresql://, postgresql+psycopg2:// 등을 비동기 드라이버 URL로 변환"""
+    parsed = make_url(url)
+    parsed = parsed.set(drivername=ASYNC_DRIVERS[parsed.get_backend_name()])
+    return parsed.render_as_string(hide_password=False)
+
+
+# 쿼리별 실행 시간 히스토그램 수집 (/api/db/metrics)
+statement_metrics = StatementMetrics()
+
+# 엔진/세션 팩토리는 첫 DB 사용 시점에 생성 (import 시점에는 드라이버 로딩, 커넥션 모두 없음)
+# 테이블 생성/변경은 앱이 아니라 Alembic 마이그레이션(alembic upgrade head)이 담당
+_async_engine: Optional[AsyncEngine] = None
+_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+
+
+def get_async_engine() -> AsyncEngine:
+    """요청 처리용 비동기 엔진 (쿼리 대기 중에도 이벤트 루프가 다른 요청/웹소켓을 처리)"""
+    global _async_engine
+    if _async_engine is None:
+        # 시계열 upsert(INSERT ... ON CONFLICT)는 PostgreSQL/SQLite 방언으로만 작성되어
+        # 다른 DB는 요청 처리 중이 아니라 엔진 생성 시점에 설정 오류로 거부
+        url = os.getenv("ASYNC_DATABASE_URL") or SQLALCHEMY_DATABASE_URL
+        backend = make_url(url).get_backend_name()
+        if backend not in ASYNC_DRIVERS:
+            raise ValueError(
+                f"지원하지 않는 DB입니다: {backend} ({', '.join(ASYNC_DRIVERS)})"
+            )
+
+        options = {"echo": DB_ECHO, "pool_pre_ping": True}
+        if backend != "sqlite":
+            options.update(
+                pool_size=DB_POOL_SIZE,
+                max_overflow=DB_MAX_OVERFLOW,
+                pool_timeout=DB_POOL_TIMEOUT,
+                pool_recycle=DB_POOL_RECYCLE,
+            )
+
+        _async_engine = create_async_engine(
+            os.getenv("ASYNC_DATABASE_URL") or to_async_url(SQLALCHEMY_DATABASE_URL),
+            **options,
+        )
+        statement_metrics.instrument(_async_engine.sync_engine)
+    return _async_engine
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """세션 팩토리 (커밋 후 속성 재조회(지연 로딩)가 일어나지 않도록 expire_on_commit=False)"""
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = async_sessionmaker(
+            bind=get_async_engine(), autoflush=False, expire_on_commit=False
+        )
+    return _session_factory
 
-# 세션 팩토리 생성
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Base 객체 생성
 Base = declarative_base()
 
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with get_session_factory()() as db:  # 예외 발생 여부와 상관없이 커넥션 정리
         yield db
-    finally:  # 예외 발생 여부와 상관없이 항상 실행
-        db.close()  # 커넥션 정리
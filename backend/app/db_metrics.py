@@ -0,0 +1,173 @@
+import bisect
+import logging
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# 실행 시간 히스토그램 버킷 상한 (ms), 마지막 버킷은 그 이상 전부
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# 이 시간 이상 걸린 쿼리는 파라미터 없이 SQL만 경고 로그로 남김
+DB_SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", "500"))
+
+# 서로 다른 SQL이 무한히 늘어나지 않도록 집계할 최대 쿼리 종류 수
+MAX_STATEMENTS = 500
+MAX_STATEMENT_LENGTH = 300
+
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|%s")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_VALUES_ROWS = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """
+    파라미터 개수만 다른 SQL을 같은 키로 묶기 위해 정규화
+
+    드라이버별 자리표시자($1, %(name)s, ?)를 ?로 통일하고,
+    IN (?, ?, ...) 목록과 다중 행 VALUES (...), (...)를 (?) 하나로 줄인다.
+    """
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    statement = _PLACEHOLDER.sub("?", statement)
+    statement = _PLACEHOLDER_LIST.sub("(?)", statement)
+    statement = _VALUES_ROWS.sub("(?)", statement)
+    return statement[:MAX_STATEMENT_LENGTH]
+
+
+class LatencyHistogram:
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, elapsed_ms: float):
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """q 분위수가 속한 버킷의 상한 (ms, 마지막 버킷이면 최대값)"""
+        if not self.count:
+            return None
+        target = q * self.count
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= target:
+                if index < len(LATENCY_BUCKETS_MS):
+                    return float(LATENCY_BUCKETS_MS[index])
+                break
+        return round(self.max_ms, 3)
+
+    def to_dict(self) -> Dict[str, Any]:
+        labels = [f"le_{bound}" for bound in LATENCY_BUCKETS_MS] + ["gt_5000"]
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "buckets_ms": dict(zip(labels, self.counts)),
+        }
+
+
+class StatementMetrics:
+    """엔진 이벤트 훅으로 쿼리 종류별 실행 시간 히스토그램을 수집"""
+
+    def __init__(self, slow_query_ms: float = DB_SLOW_QUERY_MS):
+        self.slow_query_ms = slow_query_ms
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._total = LatencyHistogram()
+        self._lock = threading.Lock()
+        self.errors = 0
+        self.slow_queries = 0
+        self.dropped = 0
+        self.started_at = time.time()
+
+    def instrument(self, engine: Engine):
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(engine, "handle_error", self._handle_error)
+
+    def _before_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    def _after_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        started = conn.info["query_started_at"].pop()
+        self.observe(statement, (time.perf_counter() - started) * 1000)
+
+    def _handle_error(self, exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("query_started_at"):
+            connection.info["query_started_at"].pop()
+        with self._lock:
+            self.errors += 1
+
+    def observe(self, statement: str, elapsed_ms: float):
+        key = normalize_statement(statement)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                if len(self._histograms) >= MAX_STATEMENTS:
+                    self.dropped += 1
+                    histogram = None
+                else:
+                    histogram = self._histograms[key] = LatencyHistogram()
+            if histogram is not None:
+                histogram.observe(elapsed_ms)
+            self._total.observe(elapsed_ms)
+            if elapsed_ms >= self.slow_query_ms:
+                self.slow_queries += 1
+
+        if elapsed_ms >= self.slow_query_ms:
+            logger.warning(f"느린 쿼리 {elapsed_ms:.1f}ms: {key}")
+
+    def snapshot(self, top: int = 20, order_by: str = "total_ms") -> Dict[str, Any]:
+        """
+        수집한 실행 시간 통계를 반환
+
+        Args:
+            top (int): 반환할 쿼리 종류 수
+            order_by (str): 정렬 기준 (total_ms, max_ms, count, avg_ms)
+        """
+        with self._lock:
+            statements: List[Dict[str, Any]] = [
+                {"statement": statement, **histogram.to_dict()}
+                for statement, histogram in self._histograms.items()
+            ]
+            summary = {
+                "uptime_seconds": round(time.time() - self.started_at, 1),
+                "slow_query_ms": self.slow_query_ms,
+                "slow_queries": self.slow_queries,
+                "errors": self.errors,
+                "statement_kinds": len(self._histograms),
+                "dropped": self.dropped,
+                "all": self._total.to_dict(),
+            }
+
+        statements.sort(key=lambda item: item[order_by], reverse=True)
+        return {**summary, "statements": statements[:top]}
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._total = LatencyHistogram()
+            self.errors = 0
+            self.slow_queries = 0
+            self.dropped = 0
+            self.started_at = time.time()
@@ -0,0 +1,145 @@
+import hashlib
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+
+from fastapi import Request, Response
+
+# 지표 행은 타임프레임별로 최대 한 시간에 한 번 바뀌고, 쓰기 시 즉시 무효화되므로
+# TTL은 다른 워커 프로세스의 쓰기를 놓쳤을 때의 최대 지연 시간 역할만 한다.
+# 캐시는 프로세스마다 따로 있으므로 uvicorn 워커가 여러 개면 쓰기를 처리하지 않은
+# 워커는 최대 TTL 동안 이전 응답을 돌려줄 수 있다.
+INDICATOR_CACHE_TTL_SEC = float(os.getenv("INDICATOR_CACHE_TTL_SEC", "600"))
+
+
+@dataclass
+class CacheEntry:
+    body: bytes
+    etag: str
+    last_modified: datetime
+    expires_at: float
+
+
+class IndicatorResponseCache:
+    """
+    (지표, 타임프레임) 단위로 직렬화된 GET 응답을 보관하는 프로세스 내 캐시
+
+    키마다 세대 번호를 두고 invalidate에서 올린다. GET은 DB를 읽기 전에 generation()을
+    받아 set에 넘기고, 그 사이 쓰기가 무효화했다면 읽은 응답을 저장하지 않는다.
+    (무효화 이후에 이전 데이터가 TTL 동안 캐시되는 것을 방지)
+    """
+
+    def __init__(self, ttl_seconds: float = INDICATOR_CACHE_TTL_SEC):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Tuple[str, str], CacheEntry] = {}
+        self._generations: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _key(indicator: str, type) -> Tuple[str, str]:
+        # TimeFrameType(str, Enum)과 일반 문자열을 같은 키로 취급
+        return indicator, getattr(type, "value", type)
+
+    def get(self, indicator: str, type: str) -> Optional[CacheEntry]:
+        key = self._key(indicator, type)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at < time.monotonic():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return entry
+
+    def generation(self, indicator: str, type: str) -> int:
+        """DB를 읽기 전에 받아 set에 넘기는 키의 현재 세대 번호"""
+        with self._lock:
+            return self._generations.get(self._key(indicator, type), 0)
+
+    def set(
+        self,
+        indicator: str,
+        type: str,
+        body: bytes,
+        last_modified: datetime,
+        generation: int,
+    ) -> CacheEntry:
+        """응답 항목을 만들고, generation 이후 무효화되지 않았을 때만 캐시에 저장"""
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+
+        entry = CacheEntry(
+            body=body,
+            etag=f'"{hashlib.sha1(body).hexdigest()}"',
+            last_modified=last_modified.astimezone(timezone.utc).replace(microsecond=0),
+            expires_at=time.monotonic() + self.ttl_seconds,
+        )
+        key = self._key(indicator, type)
+        with self._lock:
+            if self._generations.get(key, 0) == generation:
+                self._entries[key] = entry
+        return entry
+
+    def invalidate(self, indicator: str, type: str):
+        key = self._key(indicator, type)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._generations[key] = self._generations.get(key, 0) + 1
+            self.invalidations += 1
+
+    def is_not_modified(self, entry: CacheEntry, request: Request) -> bool:
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            etags = [tag.strip() for tag in if_none_match.split(",")]
+            return "*" in etags or entry.etag in etags
+
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            return entry.last_modified <= since
+
+        return False
+
+    def build_response(self, entry: CacheEntry, request: Request) -> Response:
+        """조건부 요청 헤더를 확인하여 200 또는 304 응답 생성"""
+        headers = {
+            "ETag": entry.etag,
+            "Last-Modified": format_datetime(entry.last_modified, usegmt=True),
+            "Cache-Control": "no-cache",
+        }
+
+        if self.is_not_modified(entry, request):
+            with self._lock:
+                self.not_modified += 1
+            return Response(status_code=304, headers=headers)
+
+        return Response(
+            content=entry.body, media_type="application/json", headers=headers
+        )
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "not_modified": self.not_modified,
+                "invalidations": self.invalidations,
+                "ttl_seconds": self.ttl_seconds,
+            }
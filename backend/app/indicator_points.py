@@ -0,0 +1,324 @@
+import re
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import IndicatorPoint
+
+# 시리즈 이름: 이동평균은 기간별 ma_<기간>, RSI/MACD는 시리즈가 하나이므로 지표 이름
+# (indicator_archive.series와 같은 이름, period 컬럼은 이동평균에만 채움)
+RSI_SERIES = "rsi"
+MACD_SERIES = "macd"
+
+# SQLite 바인드 변수 제한을 넘지 않도록 나눠서 upsert
+UPSERT_CHUNK_SIZE = 500
+
+Series = Dict[str, List[Dict[str, Any]]]
+
+
+def _to_utc_naive(value) -> datetime:
+    """
+    포인트 시각을 타임존 없는 UTC datetime으로 통일
+
+    캔들 시각(candle_date_time_utc)이 타임존 없는 문자열이므로 같은 형식으로 저장해야
+    호환 응답의 timestamp 문자열이 기존 JSON 컬럼 값과 같아진다.
+    """
+    if not isinstance(value, datetime):
+        value = datetime.fromisoformat(str(value))
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def series_period(name: str) -> Optional[int]:
+    """이동평균 시리즈(ma_<기간>)의 기간, RSI/MACD 시리즈는 None"""
+    match = re.fullmatch(r"ma_(\d+)", name)
+    return int(match.group(1)) if match else None
+
+
+def ma_series(ma_values: Dict[str, List[Dict[str, Any]]]) -> Series:
+    """ma_values JSON ({'ma_7': [{timestamp, value, price}]})을 시리즈별 포인트로 변환"""
+    series = {}
+    for ma_key, values in ma_values.items():
+        points = [
+            {
+                "timestamp": _to_utc_naive(item["timestamp"]),
+                "value": item["value"],
+                "price": item.get("price"),
+            }
+            for item in values
+        ]
+        series[ma_key] = sorted(points, key=lambda point: point["timestamp"])
+    return series
+
+
+def rsi_series(rsi_values: List[float], timestamps: Iterable) -> Series:
+    return {
+        RSI_SERIES: [
+            {"timestamp": _to_utc_naive(timestamp), "value": value}
+            for timestamp, value in zip(timestamps, rsi_values)
+        ]
+    }
+
+
+def macd_series(dates, macd_line, signal_line, histogram) -> Series:
+    return {
+        MACD_SERIES: [
+            {
+                "timestamp": _to_utc_naive(date),
+                "value": macd_value,
+                "signal": signal_value,
+                "histogram": histogram_value,
+            }
+            for date, macd_value, signal_value, histogram_value in zip(
+                dates, macd_line, signal_line, histogram
+            )
+        ]
+    }
+
+
+def dialect_insert(db: AsyncSession):
+    """
+    DB 종류에 맞는 upsert(on_conflict_do_update) 지원 insert 생성자
+
+    PostgreSQL/SQLite 외의 DB는 엔진 생성 시(database.get_async_engine) 거부된다.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
+
+
+def _point_row(indicator: str, type: str, name: str, point: Dict[str, Any]):
+    return {
+        "indicator": indicator,
+        "type": type,
+        "series": name,
+        "period": series_period(name),
+        **point,
+    }
+
+
+async def upsert_points(db: AsyncSession, rows: List[Dict[str, Any]]):
+    """(indicator, type, series, timestamp)가 같으면 값을 덮어쓰는 INSERT ... ON CONFLICT"""
+    insert = dialect_insert(db)
+    for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+        stmt = insert(IndicatorPoint).values(rows[start : start + UPSERT_CHUNK_SIZE])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["indicator", "type", "series", "timestamp"],
+            set_={
+                "value": stmt.excluded.value,
+                "price": stmt.excluded.price,
+                "signal": stmt.excluded.signal,
+                "histogram": stmt.excluded.histogram,
+            },
+        )
+        await db.execute(stmt)
+
+
+async def write_series(
+    db: AsyncSession,
+    indicator: str,
+    type: str,
+    series: Series,
+    append_only: bool = True,
+) -> int:
+    """
+    요청 본문의 시계열을 indicator_points에 반영
+
+    요청 본문은 여전히 보관 기간 전체 시계열을 담고 있지만, 저장된 마지막 시각 이전의
+    포인트는 바뀌지 않으므로 append_only이면 마지막 시각 이후(진행 중 캔들 포함)만 upsert한다.
+    본문 첫 시각보다 오래된 포인트(보관 기간 밖으로 밀려난 포인트)와 본문에 없는 시리즈는
+    삭제하여 조회 결과가 본문과 같도록 유지한다.
+
+    Returns:
+        int: upsert한 포인트 수
+    """
+    type = getattr(type, "value", type)
+    same_type = (IndicatorPoint.indicator == indicator, IndicatorPoint.type == type)
+
+    latest = {}
+    if append_only:
+        result = await db.execute(
+            select(IndicatorPoint.series, func.max(IndicatorPoint.timestamp))
+            .where(*same_type)
+            .group_by(IndicatorPoint.series)
+        )
+        latest = dict(result.all())
+
+    await db.execute(
+        delete(IndicatorPoint)
+        .where(*same_type, IndicatorPoint.series.notin_(list(series)))
+        .execution_options(synchronize_session=False)
+    )
+
+    rows = []
+    for name, points in series.items():
+        if not points:
+            continue
+
+        await db.execute(
+            delete(IndicatorPoint)
+            .where(
+                *same_type,
+                IndicatorPoint.series == name,
+                IndicatorPoint.timestamp < points[0]["timestamp"],
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        last_timestamp = latest.get(name)
+        rows.extend(
+            _point_row(indicator, type, name, point)
+            for point in points
+            if last_timestamp is None or point["timestamp"] >= last_timestamp
+        )
+
+    await upsert_points(db, rows)
+    return len(rows)
+
+
+async def append_points(
+    db: AsyncSession,
+    indicator: str,
+    type: str,
+    series: Series,
+    retain_from: Optional[Dict[str, Any]] = None,
+) -> int:
+    """
+    델타 요청으로 받은 새 포인트만 upsert하고 보관 시작 시각 이전 포인트를 삭제
+
+    Returns:
+        int: upsert한 포인트 수
+    """
+    type = getattr(type, "value", type)
+
+    for name, timestamp in (retain_from or {}).items():
+        await db.execute(
+            delete(IndicatorPoint)
+            .where(
+                IndicatorPoint.indicator == indicator,
+                IndicatorPoint.type == type,
+                IndicatorPoint.series == name,
+                IndicatorPoint.timestamp < _to_utc_naive(timestamp),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    rows = [
+        _point_row(indicator, type, name, point)
+        for name, points in series.items()
+        for point in points
+    ]
+    await upsert_points(db, rows)
+    return len(rows)
+
+
+async def has_points(db: AsyncSession, indicator: str, type: str) -> bool:
+    type = getattr(type, "value", type)
+    result = await db.execute(
+        select(IndicatorPoint.id)
+        .where(IndicatorPoint.indicator == indicator, IndicatorPoint.type == type)
+        .limit(1)
+    )
+    return result.first() is not None
+
+
+def series_query(
+    indicator: str,
+    types: List[str],
+    series: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+):
+    """(indicator, type, series, timestamp) 인덱스 범위 조회 SELECT 문"""
+    query = select(
+        IndicatorPoint.type,
+        IndicatorPoint.series,
+        IndicatorPoint.period,
+        IndicatorPoint.timestamp,
+        IndicatorPoint.value,
+        IndicatorPoint.price,
+        IndicatorPoint.signal,
+        IndicatorPoint.histogram,
+    ).where(
+        IndicatorPoint.indicator == indicator,
+        IndicatorPoint.type.in_([getattr(type, "value", type) for type in types]),
+    )
+    if series is not None:
+        query = query.where(IndicatorPoint.series == series)
+    if start is not None:
+        query = query.where(IndicatorPoint.timestamp >= _to_utc_naive(start))
+    if end is not None:
+        query = query.where(IndicatorPoint.timestamp <= _to_utc_naive(end))
+
+    return query.order_by(
+        IndicatorPoint.type, IndicatorPoint.series, IndicatorPoint.timestamp
+    )
+
+
+def group_series(rows) -> Dict[str, Dict[str, list]]:
+    result = defaultdict(lambda: defaultdict(list))
+    for row in rows:
+        result[row.type][row.series].append(row)
+    return result
+
+
+def sorted_series_names(series) -> List[str]:
+    """시리즈 이름을 이동평균 기간순으로 정렬 (ma_100이 ma_25보다 뒤)"""
+    return sorted(series, key=lambda name: (series_period(name) or 0, name))
+
+
+async def load_series(
+    db: AsyncSession,
+    indicator: str,
+    types: List[str],
+    series: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> Dict[str, Dict[str, list]]:
+    """
+    (indicator, type, series, timestamp) 인덱스 범위 조회로 시계열 포인트 로드
+
+    Returns:
+        dict: {type: {series: [시각순 포인트 행]}} (포인트가 없는 type은 포함되지 않음)
+    """
+    result = await db.execute(series_query(indicator, types, series, start, end))
+    return group_series(result.all())
+
+
+def ma_values_from_points(series) -> Dict[str, List[Dict[str, Any]]]:
+    """시리즈별 포인트를 기존 ma_values JSON 형식으로 재조립"""
+    return {
+        name: [
+            {
+                "timestamp": point.timestamp.isoformat(),
+                "value": point.value,
+                "price": point.price,
+            }
+            for point in series[name]
+        ]
+        for name in sorted_series_names(series)
+    }
+
+
+def rsi_fields_from_points(series) -> Dict[str, list]:
+    points = series.get(RSI_SERIES, [])
+    return {
+        "rsi_values": [point.value for point in points],
+        "timestamps": [point.timestamp for point in points],
+    }
+
+
+def macd_fields_from_points(series) -> Dict[str, list]:
+    points = series.get(MACD_SERIES, [])
+    return {
+        "dates": [point.timestamp for point in points],
+        "macd_line": [point.value for point in points],
+        "signal_line": [point.signal for point in points],
+        "histogram": [point.histogram for point in points],
+    }
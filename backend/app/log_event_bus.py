@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import os
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 구독자별 링 버퍼 크기, 처리가 밀려 가득 차면 가장 오래된 이벤트부터 버림
+LOG_BUS_CAPACITY = int(os.getenv("LOG_BUS_CAPACITY", "1000"))
+
+# 구독자 핸들러 한 번에 넘기는 최대 이벤트 수
+LOG_BUS_BATCH_SIZE = int(os.getenv("LOG_BUS_BATCH_SIZE", "200"))
+
+Handler = Callable[[List[Dict[str, Any]]], Awaitable[None]]
+
+
+class Subscriber:
+    """링 버퍼 하나와 그 버퍼를 배치 단위로 비우는 백그라운드 태스크"""
+
+    def __init__(self, name: str, handler: Handler, capacity: int, batch_size: int):
+        self.name = name
+        self.handler = handler
+        self.batch_size = batch_size
+        self.buffer: deque = deque(maxlen=capacity)
+        self.wakeup: Optional[asyncio.Event] = None
+        self.task: Optional[asyncio.Task] = None
+        self.processed = 0
+        self.batches = 0
+        self.dropped = 0
+        self.errors = 0
+
+    def push(self, event: Dict[str, Any]):
+        if len(self.buffer) == self.buffer.maxlen:
+            self.dropped += 1
+        self.buffer.append(event)
+        if self.wakeup is not None:
+            self.wakeup.set()
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        batch = []
+        while self.buffer and len(batch) < self.batch_size:
+            batch.append(self.buffer.popleft())
+        return batch
+
+    async def run(self, stopping: asyncio.Event):
+        while True:
+            await self.wakeup.wait()
+            self.wakeup.clear()
+            while self.buffer:
+                batch = self._drain()
+                try:
+                    await self.handler(batch)
+                    self.processed += len(batch)
+                    self.batches += 1
+                except Exception as e:
+                    # 실패한 배치는 버리고 다음 이벤트를 계속 처리
+                    self.errors += 1
+                    logger.error(f"로그 이벤트 처리 실패 ({self.name}): {e!r}")
+            if stopping.is_set():
+                return
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "depth": len(self.buffer),
+            "capacity": self.buffer.maxlen,
+            "processed": self.processed,
+            "batches": self.batches,
+            "dropped": self.dropped,
+            "errors": self.errors,
+        }
+
+
+class LogEventBus:
+    """
+    /api/logs 수신과 후속 처리(DB 저장, WebSocket 전송)를 분리하는 프로세스 내 이벤트 버스
+
+    publish는 구독자별 링 버퍼에 이벤트를 넣고 바로 반환한다.
+    각 구독자는 백그라운드 태스크에서 쌓인 이벤트를 배치로 받아 처리하며,
+    처리가 밀리면 버퍼 크기를 넘는 오래된 이벤트부터 버린다.
+    """
+
+    def __init__(
+        self, capacity: int = LOG_BUS_CAPACITY, batch_size: int = LOG_BUS_BATCH_SIZE
+    ):
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.subscribers: Dict[str, Subscriber] = {}
+        self.published = 0
+        self._stopping: Optional[asyncio.Event] = None
+
+    def subscribe(self, name: str, handler: Handler):
+        self.subscribers[name] = Subscriber(
+            name, handler, self.capacity, self.batch_size
+        )
+
+    def publish(self, event: Dict[str, Any]):
+        self.published += 1
+        for subscriber in self.subscribers.values():
+            subscriber.push(event)
+
+    async def start(self):
+        """현재 이벤트 루프에서 구독자 태스크 시작 (앱 시작 시)"""
+        self._stopping = asyncio.Event()
+        for subscriber in self.subscribers.values():
+            subscriber.wakeup = asyncio.Event()
+            if subscriber.buffer:
+                subscriber.wakeup.set()
+            subscriber.task = asyncio.create_task(subscriber.run(self._stopping))
+
+    async def stop(self):
+        """남은 이벤트를 모두 처리한 뒤 구독자 태스크 종료 (앱 종료 시)"""
+        if self._stopping is None:
+            return
+        self._stopping.set()
+        for subscriber in self.subscribers.values():
+            subscriber.wakeup.set()
+        await asyncio.gather(
+            *(subscriber.task for subscriber in self.subscribers.values()),
+            return_exceptions=True,
+        )
+        for subscriber in self.subscribers.values():
+            subscriber.wakeup = None
+            subscriber.task = None
+        self._stopping = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self._stopping is not None,
+            "published": self.published,
+            "subscribers": {
+                name: subscriber.stats()
+                for name, subscriber in self.subscribers.items()
+            },
+        }
@@ -1,24 +1,61 @@
-from fastapi.responses import RedirectResponse
+from contextlib import asynccontextmanager
+from fastapi.responses import ORJSONResponse, RedirectResponse
 from pydantic import BaseModel
-from fastapi import FastAPI, Depends, HTTPException, WebSocket
+from fastapi import FastAPI, Depends, HTTPException, Query, Request, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 from ws_connection_manager import WsConnectionManager
+from log_event_bus import LogEventBus
 from schemas import (
+    IndicatorArchiveRequest,
+    IndicatorArchiveResponse,
+    IndicatorName,
+    IndicatorPointResponse,
     LogResponse,
+    MacdDelta,
     MacdRequest,
     MacdResponse,
+    MovingAverageDelta,
     MovingAverageRequest,
     MovingAverageResponse,
+    RsiDelta,
     RsiRequest,
     RsiResponse,
     TimeFrameType,
+    TimeframeIndicatorSnapshot,
 )
-from database import get_db, engine, Base
-from models import LatestLog, Macd, MovingAverage, Rsi
-from typing import List, Dict, Any, Optional
+from database import (
+    DB_PROFILE,
+    get_async_engine,
+    get_db,
+    get_session_factory,
+    statement_metrics,
+)
+from indicator_cache import IndicatorResponseCache
+from indicator_points import (
+    MACD_SERIES,
+    RSI_SERIES,
+    append_points,
+    dialect_insert,
+    has_points,
+    load_series,
+    ma_series,
+    ma_values_from_points,
+    macd_fields_from_points,
+    macd_series,
+    rsi_fields_from_points,
+    rsi_series,
+    sorted_series_names,
+    write_series,
+)
+from models import IndicatorArchive, LatestLog, Macd, MovingAverage, Rsi
+from typing import List, Dict, Any, Literal, Optional
+from datetime import datetime, timezone
 
 
+import re
 import traceback
 import logging
 
@@ -29,10 +66,19 @@ class ContentInput(BaseModel):
     content: str
 
 
-# 애플리케이션 객체 생성 전에 테이블 생성 로직을 추가합니다
-Base.metadata.create_all(bind=engine)  # 여기서 테이블을 생성합니다!
+# 테이블 생성/변경은 Alembic 마이그레이션(alembic upgrade head)으로 배포 전에 적용합니다
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 로그 이벤트 버스 구독자 태스크 시작, 종료 시 남은 로그를 모두 처리
+    await log_bus.start()
+    yield
+    await log_bus.stop()
 
-app = FastAPI()
+
+# 응답 본문은 표준 json 모듈 대신 orjson으로 직렬화
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -46,6 +92,8 @@ app.add_middleware(
 )
 
 manager = WsConnectionManager()
+indicator_cache = IndicatorResponseCache()
+log_bus = LogEventBus()
 
 
 @app.get("/")
@@ -53,29 +101,87 @@ async def redirect_root_to_docs():
     return RedirectResponse(url="/docs", status_code=303)
 
 
+def _row_to_dict(row, exclude=()) -> Dict[str, Any]:
+    return {
+        column.name: getattr(row, column.name)
+        for column in row.__table__.columns
+        if column.name not in exclude
+    }
+
+
+async def _latest_row(db: AsyncSession, model, type: TimeFrameType):
+    """type별 가장 최근(last_updated 기준) 헤더 행을 조회합니다."""
+    result = await db.execute(
+        select(model)
+        .where(model.type == type)
+        .order_by(model.last_updated.desc())
+        .limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
+async def _load_type_series(db: AsyncSession, indicator: str, type: TimeFrameType):
+    """
+    indicator_points에서 한 타임프레임의 시계열을 로드합니다.
+    포인트가 없으면 (indicator_points 도입 이전 데이터) None을 반환하여
+    헤더 행의 JSON 컬럼 값을 그대로 사용하도록 합니다.
+    """
+    return (await load_series(db, indicator, [type])).get(type.value)
+
+
+async def _update_header_in_place(
+    db: AsyncSession, model, type: TimeFrameType, values: Dict
+):
+    """
+    type별 헤더 행(최신 지표 값)을 삭제 후 재생성하지 않고 제자리에서 갱신합니다.
+    이전 방식으로 쌓인 중복 행은 정리합니다.
+    """
+    result = await db.execute(
+        select(model).where(model.type == type).order_by(model.last_updated.desc())
+    )
+    rows = result.scalars().all()
+    if not rows:
+        db.add(model(type=type, **values))
+        return
+
+    for name, value in values.items():
+        setattr(rows[0], name, value)
+    for row in rows[1:]:
+        await db.delete(row)
+
+
 @app.get("/api/moving-averages/{type}", response_model=MovingAverageResponse)
 async def get_moving_average_by_type(
-    type: TimeFrameType, db: Session = Depends(get_db)
+    type: TimeFrameType, request: Request, db: AsyncSession = Depends(get_db)
 ):
     """
     이동평균 데이터를 조회합니다.
     type 파라미터를 사용하여 특정 타임프레임의 데이터만 필터링할 수 있습니다.
     """
     try:
-        result = (
-            db.query(MovingAverage)
-            .filter(MovingAverage.type == type)
-            .order_by(MovingAverage.last_updated.desc())
-            .first()
-        )
-
-        # 결과가 없으면 빈 리스트 반환
-        if not result:
-            raise HTTPException(
-                status_code=404, detail=f"ma {type} 타입의 데이터를 찾을 수 없습니다."
+        entry = indicator_cache.get("ma", type)
+        if entry is None:
+            generation = indicator_cache.generation("ma", type)
+            result = await _latest_row(db, MovingAverage, type)
+
+            # 결과가 없으면 빈 리스트 반환
+            if not result:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"ma {type} 타입의 데이터를 찾을 수 없습니다.",
+                )
+
+            data = _row_to_dict(result)
+            series = await _load_type_series(db, "moving_average", type)
+            if series:
+                data["ma_values"] = ma_values_from_points(series)
+
+            body = MovingAverageResponse.model_validate(data).model_dump_json().encode()
+            entry = indicator_cache.set(
+                "ma", type, body, result.last_updated, generation
             )
 
-        return result
+        return indicator_cache.build_response(entry, request)
     except Exception as e:
         logger.error(traceback.format_exc())
         raise HTTPException(
@@ -85,54 +191,53 @@ async def get_moving_average_by_type(
 
 @app.post("/api/moving-averages")
 async def create_moving_average(
-    body: MovingAverageRequest, db: Session = Depends(get_db)
+    body: MovingAverageRequest, db: AsyncSession = Depends(get_db)
 ):
     try:
-        # 입력 데이터를 DB 모델로 변환
+        # 입력 데이터를 DB 모델로 변환 (시계열은 indicator_points에 저장)
         db_item = MovingAverage(
-            type=body.type,
-            ma=body.ma,
-            ma_3=body.ma_3,
-            ma_7=body.ma_7,
-            ma_10=body.ma_10,
-            ma_12=body.ma_12,
-            ma_14=body.ma_14,
-            ma_24=body.ma_24,
-            ma_25=body.ma_25,
-            ma_26=body.ma_26,
-            ma_30=body.ma_30,
-            ma_36=body.ma_36,
-            ma_45=body.ma_45,
-            ma_48=body.ma_48,
-            ma_50=body.ma_50,
-            ma_52=body.ma_52,
-            ma_60=body.ma_60,
-            ma_90=body.ma_90,
-            ma_100=body.ma_100,
-            ma_200=body.ma_200,
-            macd_short_period=body.macd_short_period,
-            macd_long_period=body.macd_long_period,
-            signal_period=body.signal_period,
-            ma_values=body.ma_values,
-            last_updated=body.last_updated,
+            **body.model_dump(exclude={"ma_values"}),
+            ma_values={},
         )
 
         # DB에 저장
         db.add(db_item)
-        db.commit()
+        await write_series(
+            db,
+            "moving_average",
+            body.type,
+            ma_series(body.ma_values),
+            append_only=False,
+        )
+        await db.commit()
+        indicator_cache.invalidate("ma", body.type)
 
         return {"success": True}
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(traceback.format_exc())
         raise HTTPException(
             status_code=500, detail=f"ma {type} 데이터 저장 실패: {str(e)}"
         )
 
 
+async def _delta_header(
+    db: AsyncSession, model, indicator: str, type: TimeFrameType, to_series
+):
+    """
+    델타 병합 대상 헤더 행을 반환합니다.
+    indicator_points 도입 이전 데이터는 JSON 컬럼의 시계열을 먼저 포인트로 옮겨서
+    병합 후 델타 포인트만 남는 일이 없도록 합니다.
+    """
+    header = await _latest_row(db, model, type)
+    if header is not None and not await has_points(db, indicator, type):
+        await write_series(db, indicator, type, to_series(header), append_only=False)
+    return header
+
+
 @app.put("/api/moving-averages/{type}")
 async def update_moving_average_by_type(
-    type: TimeFrameType, body: MovingAverageRequest, db: Session = Depends(get_db)
+    type: TimeFrameType, body: MovingAverageRequest, db: AsyncSession = Depends(get_db)
 ):
     """
     특정 타입의 이동평균 데이터를 업데이트합니다.
@@ -146,50 +251,17 @@ async def update_moving_average_by_type(
                 detail=f"ma 경로의 type:{type}과 요청 본문의 type:{body.type}이 일치해야 합니다.",
             )
 
-        # 동일한 type의 기존 데이터 찾기
-        existing_records = (
-            db.query(MovingAverage).filter(MovingAverage.type == type).all()
-        )
-
-        # 트랜잭션 시작
-        db.begin_nested()  # savepoint 생성
-
-        # 기존 레코드가 있으면 모두 삭제
-        if existing_records:
-            for record in existing_records:
-                db.delete(record)
-
-        # 새 데이터 생성 및 저장
-        new_record = MovingAverage(
-            type=type,
-            ma=body.ma,
-            ma_3=body.ma_3,
-            ma_7=body.ma_7,
-            ma_10=body.ma_10,
-            ma_12=body.ma_12,
-            ma_14=body.ma_14,
-            ma_24=body.ma_24,
-            ma_25=body.ma_25,
-            ma_26=body.ma_26,
-            ma_30=body.ma_30,
-            ma_36=body.ma_36,
-            ma_45=body.ma_45,
-            ma_48=body.ma_48,
-            ma_50=body.ma_50,
-            ma_52=body.ma_52,
-            ma_60=body.ma_60,
-            ma_90=body.ma_90,
-            ma_100=body.ma_100,
-            ma_200=body.ma_200,
-            macd_short_period=body.macd_short_period,
-            macd_long_period=body.macd_long_period,
-            signal_period=body.signal_period,
-            ma_values=body.ma_values,
-            last_updated=body.last_updated,
+        # 헤더 행(최신 값)은 제자리에서 갱신하고 시계열은 새 포인트만 upsert
+        await _update_header_in_place(
+            db,
+            MovingAverage,
+            type,
+            {**body.model_dump(exclude={"type", "ma_values"}), "ma_values": {}},
         )
+        await write_series(db, "moving_average", type, ma_series(body.ma_values))
 
-        db.add(new_record)
-        db.commit()
+        await db.commit()
+        indicator_cache.invalidate("ma", type)
 
         # 처리 결과 반환
         return {
@@ -198,32 +270,114 @@ async def update_moving_average_by_type(
 
     except Exception as e:
         # 오류 발생 시 롤백
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=500, detail=f"ma {type} 데이터 업데이트 실패: {str(e)}"
         )
 
 
+@app.patch("/api/moving-averages/{type}")
+async def patch_moving_average_by_type(
+    type: TimeFrameType, body: MovingAverageDelta, db: AsyncSession = Depends(get_db)
+):
+    """
+    새로 추가된 이동평균 포인트만 받아 기존 시계열에 병합합니다.
+    헤더 행의 최신 값 갱신, 포인트 upsert, 보관 기간 밖 포인트 삭제를 한 트랜잭션으로 처리합니다.
+    """
+    try:
+        if type != body.type:
+            raise HTTPException(
+                status_code=400,
+                detail=f"ma 경로의 type:{type}과 요청 본문의 type:{body.type}이 일치해야 합니다.",
+            )
+
+        series_keys = set(body.points) | set(body.retain_from)
+        invalid_keys = [
+            key for key in series_keys if not re.fullmatch(r"ma_\d+", key)
+        ] + [key for key in body.values if not re.fullmatch(r"ma(_\d+)?", key)]
+        if invalid_keys:
+            raise HTTPException(
+                status_code=400, detail=f"잘못된 이동평균 키: {sorted(invalid_keys)}"
+            )
+
+        # PUT과 마찬가지로 헤더 컬럼이 없는 기간(ma_84 등)의 최신 값은 시계열에만 저장
+        header_values = {
+            key: value
+            for key, value in body.values.items()
+            if key in MovingAverage.__table__.columns
+        }
+
+        header = await _delta_header(
+            db,
+            MovingAverage,
+            "moving_average",
+            type,
+            lambda row: ma_series(row.ma_values),
+        )
+        if header is None:
+            raise HTTPException(
+                status_code=404, detail=f"ma {type} 데이터가 없어 병합할 수 없습니다."
+            )
+
+        await _update_header_in_place(
+            db,
+            MovingAverage,
+            type,
+            {**header_values, "last_updated": body.last_updated},
+        )
+        merged_count = await append_points(
+            db,
+            "moving_average",
+            type,
+            ma_series(
+                {key: [point.model_dump()] for key, point in body.points.items()}
+            ),
+            retain_from=body.retain_from,
+        )
+
+        await db.commit()
+        indicator_cache.invalidate("ma", type)
+
+        return {"success": True, "merged_points": merged_count}
+    except HTTPException:
+        await db.rollback()
+        raise
+    except Exception as e:
+        await db.rollback()
+        logger.error(traceback.format_exc())
+        raise HTTPException(
+            status_code=500, detail=f"ma {type} 데이터 병합 실패: {str(e)}"
+        )
+
+
 @app.post("/api/rsi")
-async def create_rsi(body: RsiRequest, db: Session = Depends(get_db)):
+async def create_rsi(body: RsiRequest, db: AsyncSession = Depends(get_db)):
     try:
-        timestamps_json = [ts.isoformat() for ts in body.timestamps]
-        # 입력 데이터를 DB 모델로 변환
+        # 입력 데이터를 DB 모델로 변환 (시계열은 indicator_points에 저장)
         db_item = Rsi(
             type=body.type,
-            rsi_values=body.rsi_values,
-            timestamps=timestamps_json,
+            rsi_values=[],
+            timestamps=[],
             current_rsi=body.current_rsi,
             last_updated=body.last_updated,
+            state=body.state.model_dump() if body.state else None,
         )
 
         # DB에 저장
         db.add(db_item)
-        db.commit()
+        await write_series(
+            db,
+            "rsi",
+            body.type,
+            rsi_series(body.rsi_values, body.timestamps),
+            append_only=False,
+        )
+        await db.commit()
+        indicator_cache.invalidate("rsi", body.type)
 
         return {"success": True}
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(traceback.format_exc())
         raise HTTPException(
             status_code=500, detail=f"rsi {body.type} 데이터 저장 실패: {str(e)}"
@@ -232,7 +386,7 @@ async def create_rsi(body: RsiRequest, db: Session = Depends(get_db)):
 
 @app.put("/api/rsi/{type}")
 async def update_rsi_by_type(
-    type: TimeFrameType, body: RsiRequest, db: Session = Depends(get_db)
+    type: TimeFrameType, body: RsiRequest, db: AsyncSession = Depends(get_db)
 ):
     try:
         if type != body.type:
@@ -241,59 +395,118 @@ async def update_rsi_by_type(
                 detail="경로의 type과 요청 본문의 type이 일치해야 합니다.",
             )
 
-        # 동일한 type의 기존 데이터 찾기
-        existing_records = db.query(Rsi).filter(Rsi.type == type).all()
+        # 헤더 행(최신 값)은 제자리에서 갱신하고 시계열은 새 포인트만 upsert
+        await _update_header_in_place(
+            db,
+            Rsi,
+            type,
+            {
+                "rsi_values": [],
+                "timestamps": [],
+                "current_rsi": body.current_rsi,
+                "last_updated": body.last_updated,
+                "state": body.state.model_dump() if body.state else None,
+            },
+        )
+        await write_series(
+            db, "rsi", type, rsi_series(body.rsi_values, body.timestamps)
+        )
 
-        db.begin_nested()  # savepoint 생성
+        await db.commit()
+        indicator_cache.invalidate("rsi", type)
 
-        # 기존 레코드가 있으면 모두 삭제
-        if existing_records:
-            for record in existing_records:
-                db.delete(record)
+        return {"success": True}
+    except Exception as e:
+        await db.rollback()
+        logger.error(traceback.format_exc())
+        raise HTTPException(
+            status_code=500, detail=f"rsi {type} 데이터 업데이트 실패: {str(e)}"
+        )
 
-        # 트랜잭션 시작
 
-        timestamps_json = [ts.isoformat() for ts in body.timestamps]
-        # 입력 데이터를 DB 모델로 변환
-        new_record = Rsi(
-            type=body.type,
-            rsi_values=body.rsi_values,
-            timestamps=timestamps_json,
-            current_rsi=body.current_rsi,
-            last_updated=body.last_updated,
+@app.patch("/api/rsi/{type}")
+async def patch_rsi_by_type(
+    type: TimeFrameType, body: RsiDelta, db: AsyncSession = Depends(get_db)
+):
+    """새로 추가된 RSI 포인트만 받아 기존 시계열에 병합합니다."""
+    try:
+        if type != body.type:
+            raise HTTPException(
+                status_code=400,
+                detail="경로의 type과 요청 본문의 type이 일치해야 합니다.",
+            )
+
+        header = await _delta_header(
+            db,
+            Rsi,
+            "rsi",
+            type,
+            lambda row: rsi_series(row.rsi_values, row.timestamps),
         )
+        if header is None:
+            raise HTTPException(
+                status_code=404, detail=f"rsi {type} 데이터가 없어 병합할 수 없습니다."
+            )
 
-        # DB에 저장
-        db.add(new_record)
-        db.commit()
+        header_values = {
+            "current_rsi": body.current_rsi,
+            "last_updated": body.last_updated,
+        }
+        if body.state is not None:
+            header_values["state"] = body.state.model_dump()
+        await _update_header_in_place(db, Rsi, type, header_values)
+        merged_count = await append_points(
+            db,
+            "rsi",
+            type,
+            rsi_series([body.point.value], [body.point.timestamp]),
+            retain_from={RSI_SERIES: body.retain_from} if body.retain_from else None,
+        )
 
-        return {"success": True}
+        await db.commit()
+        indicator_cache.invalidate("rsi", type)
+
+        return {"success": True, "merged_points": merged_count}
+    except HTTPException:
+        await db.rollback()
+        raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(traceback.format_exc())
         raise HTTPException(
-            status_code=500, detail=f"rsi {type} 데이터 업데이트 실패: {str(e)}"
+            status_code=500, detail=f"rsi {type} 데이터 병합 실패: {str(e)}"
         )
 
 
 @app.get("/api/rsi/{type}", response_model=RsiResponse)
-async def get_rsi_by_type(type: TimeFrameType, db: Session = Depends(get_db)):
+async def get_rsi_by_type(
+    type: TimeFrameType, request: Request, db: AsyncSession = Depends(get_db)
+):
     try:
-        result = (
-            db.query(Rsi)
-            .filter(Rsi.type == type)
-            .order_by(Rsi.last_updated.desc())
-            .first()
-        )
-        # 결과가 없으면 빈 리스트 반환
-        if not result:
-            raise HTTPException(
-                status_code=404, detail=f"rsi {type} 타입의 데이터를 찾을 수 없습니다."
+        entry = indicator_cache.get("rsi", type)
+        if entry is None:
+            generation = indicator_cache.generation("rsi", type)
+            result = await _latest_row(db, Rsi, type)
+            # 결과가 없으면 빈 리스트 반환
+            if not result:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"rsi {type} 타입의 데이터를 찾을 수 없습니다.",
+                )
+
+            data = _row_to_dict(result)
+            series = await _load_type_series(db, "rsi", type)
+            if series:
+                data.update(rsi_fields_from_points(series))
+
+            body = RsiResponse.model_validate(data).model_dump_json().encode()
+            entry = indicator_cache.set(
+                "rsi", type, body, result.last_updated, generation
             )
 
-        return result
+        return indicator_cache.build_response(entry, request)
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(traceback.format_exc())
         raise HTTPException(
             status_code=500, detail=f"rsi {type} 데이터 조회 실패: {str(e)}"
@@ -301,25 +514,33 @@ async def get_rsi_by_type(type: TimeFrameType, db: Session = Depends(get_db)):
 
 
 @app.post("/api/macd")
-async def create_macd(body: MacdRequest, db: Session = Depends(get_db)):
+async def create_macd(body: MacdRequest, db: AsyncSession = Depends(get_db)):
     try:
-        dates_json = [date.isoformat() for date in body.dates]
+        # 시계열은 indicator_points에 저장
         db_item = Macd(
             type=body.type,
-            dates=dates_json,
-            macd_line=body.macd_line,
-            signal_line=body.signal_line,
-            histogram=body.histogram,
+            dates=[],
+            macd_line=[],
+            signal_line=[],
+            histogram=[],
             last_updated=body.last_updated,
         )
 
         # DB에 저장
         db.add(db_item)
-        db.commit()
+        await write_series(
+            db,
+            "macd",
+            body.type,
+            macd_series(body.dates, body.macd_line, body.signal_line, body.histogram),
+            append_only=False,
+        )
+        await db.commit()
+        indicator_cache.invalidate("macd", body.type)
 
         return {"success": True}
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(traceback.format_exc())
         raise HTTPException(
             status_code=500, detail=f"madc {body.type} 데이터 저장 실패: {str(e)}"
@@ -327,26 +548,37 @@ async def create_macd(body: MacdRequest, db: Session = Depends(get_db)):
 
 
 @app.get("/api/macd/{type}", response_model=MacdResponse)
-async def get_macd_by_type(type: TimeFrameType, db: Session = Depends(get_db)):
+async def get_macd_by_type(
+    type: TimeFrameType, request: Request, db: AsyncSession = Depends(get_db)
+):
     """
     이동평균 데이터를 조회합니다.
     type 파라미터를 사용하여 특정 타임프레임의 데이터만 필터링할 수 있습니다.
     """
     try:
-        result = (
-            db.query(Macd)
-            .filter(Macd.type == type)
-            .order_by(Macd.last_updated.desc())
-            .first()
-        )
-
-        # 결과가 없으면 빈 리스트 반환
-        if not result:
-            raise HTTPException(
-                status_code=404, detail=f"Macd {type} 타입의 데이터를 찾을 수 없습니다."
+        entry = indicator_cache.get("macd", type)
+        if entry is None:
+            generation = indicator_cache.generation("macd", type)
+            result = await _latest_row(db, Macd, type)
+
+            # 결과가 없으면 빈 리스트 반환
+            if not result:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Macd {type} 타입의 데이터를 찾을 수 없습니다.",
+                )
+
+            data = _row_to_dict(result)
+            series = await _load_type_series(db, "macd", type)
+            if series:
+                data.update(macd_fields_from_points(series))
+
+            body = MacdResponse.model_validate(data).model_dump_json().encode()
+            entry = indicator_cache.set(
+                "macd", type, body, result.last_updated, generation
             )
 
-        return result
+        return indicator_cache.build_response(entry, request)
     except Exception as e:
         logger.error(traceback.format_exc())
         raise HTTPException(
@@ -356,7 +588,7 @@ async def get_macd_by_type(type: TimeFrameType, db: Session = Depends(get_db)):
 
 @app.put("/api/macd/{type}")
 async def update_macd_by_type(
-    type: TimeFrameType, body: MacdRequest, db: Session = Depends(get_db)
+    type: TimeFrameType, body: MacdRequest, db: AsyncSession = Depends(get_db)
 ):
     """
     특정 타입의 이동평균 데이터를 업데이트합니다.
@@ -370,71 +602,456 @@ async def update_macd_by_type(
                 detail=f"Macd 경로의 type:{type}과 요청 본문의 type:{body.type}이 일치해야 합니다.",
             )
 
-        # 동일한 type의 기존 데이터 찾기
-        existing_records = db.query(Macd).filter(Macd.type == type).all()
-
-        # 트랜잭션 시작
-        db.begin_nested()  # savepoint 생성
-
-        # 기존 레코드가 있으면 모두 삭제
-        if existing_records:
-            for record in existing_records:
-                db.delete(record)
-
-        # 새 데이터 생성 및 저장
-        dates_json = [date.isoformat() for date in body.dates]
-        new_record = Macd(
-            type=body.type,
-            dates=dates_json,
-            macd_line=body.macd_line,
-            signal_line=body.signal_line,
-            histogram=body.histogram,
-            last_updated=body.last_updated,
+        # 헤더 행(최신 값)은 제자리에서 갱신하고 시계열은 새 포인트만 upsert
+        await _update_header_in_place(
+            db,
+            Macd,
+            type,
+            {
+                "dates": [],
+                "macd_line": [],
+                "signal_line": [],
+                "histogram": [],
+                "last_updated": body.last_updated,
+            },
+        )
+        await write_series(
+            db,
+            "macd",
+            type,
+            macd_series(body.dates, body.macd_line, body.signal_line, body.histogram),
         )
 
-        db.add(new_record)
-        db.commit()
+        await db.commit()
+        indicator_cache.invalidate("macd", type)
 
         # 처리 결과 반환
         return {"success": True}
 
     except Exception as e:
         # 오류 발생 시 롤백
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=500, detail=f"Macd {type} 데이터 업데이트 실패: {str(e)}"
         )
 
 
+@app.patch("/api/macd/{type}")
+async def patch_macd_by_type(
+    type: TimeFrameType, body: MacdDelta, db: AsyncSession = Depends(get_db)
+):
+    """새로 추가된 MACD 포인트만 받아 기존 시계열에 병합합니다."""
+    try:
+        if type != body.type:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Macd 경로의 type:{type}과 요청 본문의 type:{body.type}이 일치해야 합니다.",
+            )
+
+        header = await _delta_header(
+            db,
+            Macd,
+            "macd",
+            type,
+            lambda row: macd_series(
+                row.dates, row.macd_line, row.signal_line, row.histogram
+            ),
+        )
+        if header is None:
+            raise HTTPException(
+                status_code=404, detail=f"Macd {type} 데이터가 없어 병합할 수 없습니다."
+            )
+
+        await _update_header_in_place(
+            db, Macd, type, {"last_updated": body.last_updated}
+        )
+        merged_count = await append_points(
+            db,
+            "macd",
+            type,
+            macd_series(
+                [point.timestamp for point in body.points],
+                [point.macd for point in body.points],
+                [point.signal for point in body.points],
+                [point.histogram for point in body.points],
+            ),
+            retain_from={MACD_SERIES: body.retain_from} if body.retain_from else None,
+        )
+
+        await db.commit()
+        indicator_cache.invalidate("macd", type)
+
+        return {"success": True, "merged_points": merged_count}
+    except HTTPException:
+        await db.rollback()
+        raise
+    except Exception as e:
+        await db.rollback()
+        logger.error(traceback.format_exc())
+        raise HTTPException(
+            status_code=500, detail=f"Macd {type} 데이터 병합 실패: {str(e)}"
+        )
+
+
+async def _latest_rows_by_type(db: AsyncSession, model, types: List[str], deferred=()):
+    """
+    type별 가장 최근(last_updated 기준) 레코드를 한 번의 쿼리로 조회합니다.
+    type마다 (type, last_updated DESC) 인덱스의 첫 항목만 읽는 서브쿼리를 사용하고,
+    deferred로 지정한 컬럼은 DB에서 읽지 않습니다.
+    """
+    latest_ids = [
+        select(model.id)
+        .where(model.type == type)
+        .order_by(model.last_updated.desc())
+        .limit(1)
+        .scalar_subquery()
+        for type in types
+    ]
+    if not latest_ids:
+        return {}
+
+    result = await db.execute(
+        select(model)
+        .options(*(defer(column) for column in deferred))
+        .where(model.id.in_(latest_ids))
+    )
+    return {row.type: row for row in result.scalars()}
+
+
+@app.get(
+    "/api/indicators/snapshot",
+    response_model=Dict[TimeFrameType, TimeframeIndicatorSnapshot],
+)
+async def get_indicator_snapshot(
+    timeframes: List[TimeFrameType] = Query(default=list(TimeFrameType)),
+    include_ma_values: bool = True,
+    include_rsi_values: bool = True,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    여러 타임프레임의 최신 이동평균, RSI, MACD 데이터를 한 번에 조회합니다.
+    include_ma_values / include_rsi_values를 false로 주면 무거운 시계열 배열
+    (ma_values, rsi_values/timestamps)을 DB에서 읽지 않고 빈 값으로 반환합니다.
+    """
+    try:
+        types = [timeframe.value for timeframe in timeframes]
+
+        ma_excluded = () if include_ma_values else ("ma_values",)
+        rsi_excluded = () if include_rsi_values else ("rsi_values", "timestamps")
+
+        moving_averages = await _latest_rows_by_type(
+            db,
+            MovingAverage,
+            types,
+            deferred=[getattr(MovingAverage, name) for name in ma_excluded],
+        )
+        rsis = await _latest_rows_by_type(
+            db, Rsi, types, deferred=[getattr(Rsi, name) for name in rsi_excluded]
+        )
+        macds = await _latest_rows_by_type(db, Macd, types)
+
+        # 시계열은 indicator_points에서 지표별 한 번의 범위 조회로 로드
+        ma_points = {}
+        if include_ma_values:
+            ma_points = await load_series(db, "moving_average", types)
+        rsi_points = {}
+        if include_rsi_values:
+            rsi_points = await load_series(db, "rsi", types)
+        macd_points = await load_series(db, "macd", types)
+
+        snapshot = {}
+        for type in types:
+            ma_row = moving_averages.get(type)
+            rsi_row = rsis.get(type)
+            macd_row = macds.get(type)
+
+            moving_average = None
+            if ma_row:
+                moving_average = _row_to_dict(ma_row, exclude=ma_excluded)
+                moving_average.setdefault("ma_values", {})
+                if type in ma_points:
+                    moving_average["ma_values"] = ma_values_from_points(ma_points[type])
+
+            rsi = None
+            if rsi_row:
+                rsi = _row_to_dict(rsi_row, exclude=rsi_excluded)
+                rsi.setdefault("rsi_values", [])
+                rsi.setdefault("timestamps", [])
+                if type in rsi_points:
+                    rsi.update(rsi_fields_from_points(rsi_points[type]))
+
+            macd = None
+            if macd_row:
+                macd = _row_to_dict(macd_row)
+                if type in macd_points:
+                    macd.update(macd_fields_from_points(macd_points[type]))
+
+            snapshot[type] = {
+                "moving_average": moving_average,
+                "rsi": rsi,
+                "macd": macd,
+            }
+
+        return snapshot
+    except Exception as e:
+        logger.error(traceback.format_exc())
+        raise HTTPException(status_code=500, detail=f"지표 스냅샷 조회 실패: {str(e)}")
+
+
+def _parse_point_timestamp(value) -> datetime:
+    # 캔들 시각은 타임존 없는 UTC 문자열로 저장되어 있음
+    timestamp = datetime.fromisoformat(str(value))
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp
+
+
+@app.post("/api/indicator-archive")
+async def create_indicator_archive(
+    body: IndicatorArchiveRequest, db: AsyncSession = Depends(get_db)
+):
+    """
+    보관 기간이 지나 지표 JSON 컬럼에서 잘라낸 포인트를 시리즈별 한 행으로 저장합니다.
+
+    아카이브 후 지표 갱신이 실패하면 다음 주기에 같은 시작 시각부터 다시 보관하므로,
+    (indicator, type, series, start_timestamp)가 같은 행은 더 최근까지 담은 경우에만 덮어씁니다.
+    """
+    try:
+        rows = []
+        for series, points in body.series.items():
+            if not points:
+                continue
+
+            timestamps = [
+                _parse_point_timestamp(point["timestamp"]) for point in points
+            ]
+            rows.append(
+                {
+                    "indicator": body.indicator,
+                    "type": body.type,
+                    "series": series,
+                    "start_timestamp": min(timestamps),
+                    "end_timestamp": max(timestamps),
+                    "point_count": len(points),
+                    "points": points,
+                }
+            )
+
+        if rows:
+            insert = dialect_insert(db)
+            stmt = insert(IndicatorArchive).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["indicator", "type", "series", "start_timestamp"],
+                set_={
+                    "end_timestamp": stmt.excluded.end_timestamp,
+                    "point_count": stmt.excluded.point_count,
+                    "points": stmt.excluded.points,
+                },
+                where=stmt.excluded.end_timestamp > IndicatorArchive.end_timestamp,
+            )
+            await db.execute(stmt)
+        await db.commit()
+
+        archived_count = sum(row["point_count"] for row in rows)
+        return {"success": True, "archived_points": archived_count}
+    except Exception as e:
+        await db.rollback()
+        logger.error(traceback.format_exc())
+        raise HTTPException(
+            status_code=500,
+            detail=f"{body.indicator} {body.type} 이력 보관 실패: {str(e)}",
+        )
+
+
+@app.get(
+    "/api/indicator-archive/{indicator}/{type}",
+    response_model=List[IndicatorArchiveResponse],
+)
+async def get_indicator_archive(
+    indicator: IndicatorName,
+    type: TimeFrameType,
+    series: Optional[str] = Query(None, description="특정 시리즈 (예: ma_7)"),
+    include_points: bool = Query(False, description="포인트 목록 포함 여부"),
+    db: AsyncSession = Depends(get_db),
+):
+    """보관된 지표 이력을 오래된 순으로 조회합니다."""
+    try:
+        query = select(IndicatorArchive).where(
+            IndicatorArchive.indicator == indicator, IndicatorArchive.type == type
+        )
+        if series:
+            query = query.where(IndicatorArchive.series == series)
+        if not include_points:
+            query = query.options(defer(IndicatorArchive.points))
+
+        result = await db.execute(
+            query.order_by(IndicatorArchive.start_timestamp.asc())
+        )
+        rows = result.scalars().all()
+
+        return [
+            IndicatorArchiveResponse.model_validate(
+                _row_to_dict(row, exclude=() if include_points else ("points",))
+            )
+            for row in rows
+        ]
+    except Exception as e:
+        logger.error(traceback.format_exc())
+        raise HTTPException(
+            status_code=500, detail=f"{indicator} {type} 이력 조회 실패: {str(e)}"
+        )
+
+
+@app.get(
+    "/api/indicator-points/{indicator}/{type}",
+    response_model=List[IndicatorPointResponse],
+)
+async def get_indicator_points(
+    indicator: IndicatorName,
+    type: TimeFrameType,
+    series: Optional[str] = Query(None, description="시리즈 이름 (ma_7, rsi, macd)"),
+    start: Optional[datetime] = Query(None, description="시작 시각 (UTC, 포함)"),
+    end: Optional[datetime] = Query(None, description="종료 시각 (UTC, 포함)"),
+    db: AsyncSession = Depends(get_db),
+):
+    """지표 시계열 포인트를 (indicator, type, series, timestamp) 인덱스로 범위 조회합니다."""
+    try:
+        points = (
+            await load_series(
+                db, indicator.value, [type], series=series, start=start, end=end
+            )
+        ).get(type.value, {})
+
+        return [
+            IndicatorPointResponse.model_validate(point, from_attributes=True)
+            for name in sorted_series_names(points)
+            for point in points[name]
+        ]
+    except Exception as e:
+        logger.error(traceback.format_exc())
+        raise HTTPException(
+            status_code=500, detail=f"{indicator} {type} 포인트 조회 실패: {str(e)}"
+        )
+
+
+@app.get("/api/cache/stats")
+async def get_cache_stats():
+    """지표 GET 응답 캐시의 적중/미스 통계를 조회합니다."""
+    return indicator_cache.stats()
+
+
+def _pool_status(pool) -> Dict[str, Any]:
+    status = {"class": type(pool).__name__}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        if hasattr(pool, name):
+            status[name] = getattr(pool, name)()
+    return status
+
+
+@app.get("/api/db/metrics")
+async def get_db_metrics(
+    top: int = Query(20, ge=1, le=500, description="반환할 쿼리 종류 수"),
+    order_by: Literal["total_ms", "max_ms", "avg_ms", "count"] = "total_ms",
+):
+    """쿼리 종류별 실행 시간 히스토그램과 커넥션 풀 상태를 조회합니다."""
+    return {
+        "profile": DB_PROFILE,
+        "pool": _pool_status(get_async_engine().pool),
+        **statement_metrics.snapshot(top=top, order_by=order_by),
+    }
+
+
+@app.delete("/api/db/metrics")
+async def reset_db_metrics():
+    """쿼리 실행 시간 통계를 초기화합니다."""
+    statement_metrics.reset()
+    return {"success": True}
+
+
 @app.get("/api/logs", response_model=List[LogResponse])
-def get_all_latest_logs(db: Session = Depends(get_db)):
-    logs = db.query(LatestLog).order_by(LatestLog.timestamp.asc()).all()
-    return logs
+async def get_all_latest_logs(db: AsyncSession = Depends(get_db)):
+    result = await db.execute(select(LatestLog).order_by(LatestLog.timestamp.asc()))
+    return result.scalars().all()
+
+
+def _validate_log(log: Dict):
+    missing = [key for key in ("module", "message", "timestamp") if key not in log]
+    if missing:
+        raise HTTPException(status_code=400, detail=f"로그 필드 누락: {missing}")
+    try:
+        _parse_point_timestamp(log["timestamp"])
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400, detail=f"잘못된 로그 timestamp입니다: {log['timestamp']}"
+        ) from e
 
 
 @app.post("/api/logs")
-async def receive_logs(log: Dict, db: Session = Depends(get_db)):
-    existing_log = db.query(LatestLog).filter(LatestLog.module == log["module"]).first()
-
-    if existing_log:
-        # 기존 로그 업데이트
-        existing_log.message = log["message"]
-        existing_log.timestamp = log["timestamp"]
-        db.commit()
-        db.refresh(existing_log)
-        log_obj = existing_log
-    else:
-        # 새 로그 생성
-        log_obj = LatestLog(
-            module=log["module"], message=log["message"], timestamp=log["timestamp"]
-        )
-        db.add(log_obj)
-        db.commit()
-        db.refresh(log_obj)
+async def receive_logs(log: Dict):
+    # 형식만 확인하고 이벤트 버스에 넣은 뒤 바로 응답 (DB 저장/브로드캐스트는 백그라운드)
+    _validate_log(log)
+    log_bus.publish(log)
+    return {"success": True}
+
+
+@app.post("/api/logs/batch")
+async def receive_log_batch(logs: List[Dict]):
+    """여러 로그를 한 번에 받아 순서대로 이벤트 버스에 넣습니다. 하나라도 형식이 틀리면 모두 거부합니다."""
+    for log in logs:
+        _validate_log(log)
+    for log in logs:
+        log_bus.publish(log)
+    return {"success": True, "accepted": len(logs)}
 
+
+@app.get("/api/logs/stats")
+async def get_log_bus_stats():
+    """로그 이벤트 버스의 구독자별 대기 이벤트 수, 처리/버림 통계를 조회합니다."""
+    return log_bus.stats()
+
+
+async def _store_latest_logs(logs: List[Dict]):
+    """모듈별 최신 로그만 남겨 한 번의 upsert로 LatestLog에 저장"""
+    latest = {log["module"]: log for log in logs}
+    rows = [
+        {
+            "module": module,
+            "message": log["message"],
+            # asyncpg는 DateTime 컬럼에 문자열을 받지 않으므로 datetime으로 변환
+            "timestamp": _parse_point_timestamp(log["timestamp"]),
+        }
+        for module, log in latest.items()
+    ]
+
+    async with get_session_factory()() as db:
+        insert = dialect_insert(db)
+        stmt = insert(LatestLog).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[LatestLog.module],
+            set_={
+                "message": stmt.excluded.message,
+                "timestamp": stmt.excluded.timestamp,
+                "updated_at": func.now(),
+            },
+        )
+        await db.execute(stmt)
+        await db.commit()
+
+
+async def _broadcast_logs(logs: List[Dict]):
     # 로그 수신 후 WebSocket으로 브로드캐스트
-    await manager.broadcast(log)
-    return {"success": True}
+    for log in logs:
+        await manager.broadcast(log)
+
+
+log_bus.subscribe("latest_logs", _store_latest_logs)
+log_bus.subscribe("websocket", _broadcast_logs)
+
+
+@app.get("/api/ws/stats")
+async def get_ws_stats():
+    """WebSocket 연결 수, 전송 대기열, 버려진/제거된 메시지·연결 통계를 조회합니다."""
+    return manager.stats()
 
 
 @app.websocket("/ws/logs")
@@ -0,0 +1,227 @@
+"""initial schema
+
+Base.metadata.create_all로 만들던 테이블을 그대로 생성하는 기준 리비전.
+create_all로 이미 테이블이 만들어진 DB에서도 그대로 upgrade할 수 있도록
+존재하지 않는 테이블만 생성한다.
+
+Revision ID: 0001
+Revises:
+Create Date: 2025-03-10 00:00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 여러 테이블이 같은 Postgres ENUM 타입을 쓰므로 타입은 한 번만 생성
+timeframe_type = postgresql.ENUM(
+    "day", "week", "hour4", "hour1", name="timeframe_type", create_type=False
+)
+indicator_name = postgresql.ENUM(
+    "moving_average", "rsi", "macd", name="indicator_name", create_type=False
+)
+
+MA_PERIODS = [3, 7, 10, 12, 14, 24, 25, 26, 30, 36, 45, 48, 50, 52, 60, 90, 100, 200]
+
+
+def _created_at(name="created_at"):
+    return sa.Column(
+        name, sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+    )
+
+
+def _create_moving_averages():
+    op.create_table(
+        "moving_averages",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("type", timeframe_type, nullable=False),
+        sa.Column("ma", sa.Float(), nullable=False),
+        *[
+            sa.Column(f"ma_{period}", sa.Float(), nullable=True)
+            for period in MA_PERIODS
+        ],
+        sa.Column("macd_short_period", sa.Integer(), nullable=False),
+        sa.Column("macd_long_period", sa.Integer(), nullable=False),
+        sa.Column("signal_period", sa.Integer(), nullable=False),
+        sa.Column("ma_values", sa.JSON(), nullable=False),
+        sa.Column("last_updated", sa.DateTime(timezone=True), nullable=False),
+        _created_at(),
+    )
+    op.create_index("ix_moving_averages_id", "moving_averages", ["id"])
+    op.create_index("ix_moving_averages_type", "moving_averages", ["type"])
+
+
+def _create_rsi():
+    op.create_table(
+        "rsi",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("type", timeframe_type, nullable=False),
+        sa.Column("rsi_values", sa.JSON(), nullable=False, comment="RSI 값들의 리스트"),
+        sa.Column(
+            "timestamps",
+            sa.JSON(),
+            nullable=False,
+            comment="각 RSI 값에 해당하는 타임스탬프 리스트",
+        ),
+        sa.Column(
+            "current_rsi", sa.Float(), nullable=False, comment="현재 최신 RSI 값"
+        ),
+        sa.Column("last_updated", sa.DateTime(timezone=True), nullable=False),
+        _created_at(),
+    )
+    op.create_index("ix_rsi_id", "rsi", ["id"])
+    op.create_index("ix_rsi_type", "rsi", ["type"])
+
+
+def _create_macd():
+    op.create_table(
+        "macd",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("type", timeframe_type, nullable=False),
+        sa.Column(
+            "dates",
+            sa.JSON(),
+            nullable=False,
+            comment="각 값에 해당하는 타임스탬프 리스트",
+        ),
+        sa.Column(
+            "macd_line", sa.JSON(), nullable=False, comment="MACD 라인 값들의 리스트"
+        ),
+        sa.Column(
+            "signal_line",
+            sa.JSON(),
+            nullable=False,
+            comment="시그널 라인 값들의 리스트",
+        ),
+        sa.Column(
+            "histogram", sa.JSON(), nullable=False, comment="히스토그램 값들의 리스트"
+        ),
+        sa.Column("last_updated", sa.DateTime(timezone=True), nullable=False),
+        _created_at(),
+    )
+    op.create_index("ix_macd_id", "macd", ["id"])
+    op.create_index("ix_macd_type", "macd", ["type"])
+
+
+def _create_indicator_points():
+    op.create_table(
+        "indicator_points",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("indicator", indicator_name, nullable=False),
+        sa.Column("type", timeframe_type, nullable=False),
+        sa.Column(
+            "period",
+            sa.Integer(),
+            nullable=False,
+            comment="이동평균 기간 (RSI 14, MACD 26 고정)",
+        ),
+        sa.Column(
+            "timestamp", sa.DateTime(), nullable=False, comment="캔들 시각 (UTC)"
+        ),
+        sa.Column(
+            "value", sa.Float(), nullable=True, comment="이동평균/RSI/MACD 라인 값"
+        ),
+        sa.Column(
+            "price", sa.Float(), nullable=True, comment="이동평균 계산에 사용된 종가"
+        ),
+        sa.Column("signal", sa.Float(), nullable=True, comment="MACD 시그널 라인 값"),
+        sa.Column("histogram", sa.Float(), nullable=True, comment="MACD 히스토그램 값"),
+        sa.UniqueConstraint(
+            "indicator",
+            "type",
+            "period",
+            "timestamp",
+            name="uq_indicator_points_series_timestamp",
+        ),
+    )
+
+
+def _create_indicator_archive():
+    op.create_table(
+        "indicator_archive",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("indicator", indicator_name, nullable=False),
+        sa.Column("type", timeframe_type, nullable=False),
+        sa.Column(
+            "series", sa.String(), nullable=False, comment="시리즈 이름 (ma_7, rsi 등)"
+        ),
+        sa.Column(
+            "start_timestamp",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="가장 오래된 포인트 시각",
+        ),
+        sa.Column(
+            "end_timestamp",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="가장 최근 포인트 시각",
+        ),
+        sa.Column("point_count", sa.Integer(), nullable=False),
+        sa.Column(
+            "points",
+            sa.JSON(),
+            nullable=False,
+            comment="보관 기간이 지나 지표 JSON 컬럼에서 잘라낸 포인트 리스트",
+        ),
+        _created_at(),
+    )
+    op.create_index("ix_indicator_archive_id", "indicator_archive", ["id"])
+    op.create_index(
+        "ix_indicator_archive_indicator", "indicator_archive", ["indicator"]
+    )
+    op.create_index("ix_indicator_archive_type", "indicator_archive", ["type"])
+
+
+def _create_latest_logs():
+    op.create_table(
+        "latest_logs",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("module", sa.String(), nullable=False),
+        sa.Column("message", sa.String(), nullable=False),
+        sa.Column("timestamp", sa.DateTime(timezone=True), nullable=False),
+        _created_at("updated_at"),
+    )
+    op.create_index("ix_latest_logs_id", "latest_logs", ["id"])
+    op.create_index("ix_latest_logs_module", "latest_logs", ["module"], unique=True)
+
+
+TABLES = {
+    "moving_averages": _create_moving_averages,
+    "rsi": _create_rsi,
+    "macd": _create_macd,
+    "indicator_points": _create_indicator_points,
+    "indicator_archive": _create_indicator_archive,
+    "latest_logs": _create_latest_logs,
+}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    timeframe_type.create(bind, checkfirst=True)
+    indicator_name.create(bind, checkfirst=True)
+
+    existing_tables = set()
+    if not context.is_offline_mode():
+        existing_tables = set(sa.inspect(bind).get_table_names())
+    for table_name, create_table in TABLES.items():
+        if table_name not in existing_tables:
+            create_table()
+
+
+def downgrade() -> None:
+    for table_name in reversed(list(TABLES)):
+        op.drop_table(table_name)
+
+    bind = op.get_bind()
+    indicator_name.drop(bind, checkfirst=True)
+    timeframe_type.drop(bind, checkfirst=True)
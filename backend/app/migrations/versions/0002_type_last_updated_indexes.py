@@ -0,0 +1,40 @@
+"""(type, last_updated DESC) composite indexes
+
+모든 지표 조회가 type으로 거르고 last_updated 내림차순으로 최신 행 하나를 읽으므로
+두 컬럼의 복합 인덱스로 정렬 없이 첫 행만 읽도록 한다.
+복합 인덱스의 선두 컬럼이 type이므로 기존 type 단일 인덱스는 삭제한다.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-03-10 00:10:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ["moving_averages", "rsi", "macd"]
+
+
+def upgrade() -> None:
+    for table_name in TABLES:
+        op.create_index(
+            f"ix_{table_name}_type_last_updated",
+            table_name,
+            ["type", sa.text("last_updated DESC")],
+        )
+        op.drop_index(f"ix_{table_name}_type", table_name=table_name)
+
+
+def downgrade() -> None:
+    for table_name in TABLES:
+        op.create_index(f"ix_{table_name}_type", table_name, ["type"])
+        op.drop_index(f"ix_{table_name}_type_last_updated", table_name=table_name)
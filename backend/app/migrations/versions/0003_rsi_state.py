@@ -0,0 +1,39 @@
+"""rsi.state column
+
+RSI를 마지막 RSI 값에서 역산하지 않고 O(1)로 갱신할 수 있도록
+Wilder 평균 상승/하락폭과 마지막 종가를 헤더 행에 저장한다.
+기존 행은 NULL이며 다음 초기 계산(init_setting_data) 때 채워진다.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2025-03-12 00:00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "rsi",
+        sa.Column(
+            "state",
+            sa.JSON(),
+            nullable=True,
+            comment="Wilder RSI 증분 계산 상태 (avg_gain, avg_loss, 마지막 종가)",
+        ),
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("rsi") as batch_op:
+        batch_op.drop_column("state")
@@ -0,0 +1,51 @@
+"""indicator_archive (indicator, type, series, start_timestamp) unique constraint
+
+지표 갱신(PUT/PATCH)이 실패하면 같은 포인트가 다음 주기에 다시 보관되므로
+시리즈의 시작 시각 기준 유니크 제약을 두고 ON CONFLICT로 기존 행을 갱신한다.
+이미 중복된 행은 가장 최근까지 담은 행 하나만 남긴다.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2025-03-14 00:00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = ["indicator", "type", "series", "start_timestamp"]
+
+
+def upgrade() -> None:
+    op.execute(sa.text("""
+            DELETE FROM indicator_archive
+            WHERE EXISTS (
+                SELECT 1 FROM indicator_archive AS newer
+                WHERE newer.indicator = indicator_archive.indicator
+                  AND newer.type = indicator_archive.type
+                  AND newer.series = indicator_archive.series
+                  AND newer.start_timestamp = indicator_archive.start_timestamp
+                  AND (
+                      newer.end_timestamp > indicator_archive.end_timestamp
+                      OR (
+                          newer.end_timestamp = indicator_archive.end_timestamp
+                          AND newer.id > indicator_archive.id
+                      )
+                  )
+            )
+            """))
+    with op.batch_alter_table("indicator_archive") as batch_op:
+        batch_op.create_unique_constraint("uq_indicator_archive_series_start", COLUMNS)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("indicator_archive") as batch_op:
+        batch_op.drop_constraint("uq_indicator_archive_series_start", type_="unique")
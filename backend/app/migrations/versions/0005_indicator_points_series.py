@@ -0,0 +1,81 @@
+"""indicator_points series column
+
+RSI/MACD 포인트를 고정 기간 값(14, 26)을 period 키로 구분하던 방식 대신
+시리즈 이름 컬럼(ma_7 등, RSI/MACD는 rsi, macd)으로 구분한다.
+period는 이동평균에만 채우고 RSI/MACD는 NULL이며,
+upsert 대상 유니크 제약은 (indicator, type, series, timestamp)로 바꾼다.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2025-03-14 00:10:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CONSTRAINT_NAME = "uq_indicator_points_series_timestamp"
+
+
+def upgrade() -> None:
+    op.add_column(
+        "indicator_points",
+        sa.Column(
+            "series",
+            sa.String(),
+            nullable=True,
+            comment="시리즈 이름 (ma_7 등, RSI/MACD는 rsi, macd)",
+        ),
+    )
+    op.execute(
+        "UPDATE indicator_points "
+        "SET series = 'ma_' || CAST(period AS VARCHAR) "
+        "WHERE indicator = 'moving_average'"
+    )
+    op.execute(
+        "UPDATE indicator_points SET series = CAST(indicator AS VARCHAR) "
+        "WHERE indicator IN ('rsi', 'macd')"
+    )
+
+    with op.batch_alter_table("indicator_points") as batch_op:
+        batch_op.drop_constraint(CONSTRAINT_NAME, type_="unique")
+        batch_op.alter_column("series", existing_type=sa.String(), nullable=False)
+        batch_op.alter_column(
+            "period",
+            existing_type=sa.Integer(),
+            nullable=True,
+            comment="이동평균 기간 (RSI/MACD는 NULL)",
+        )
+        batch_op.create_unique_constraint(
+            CONSTRAINT_NAME, ["indicator", "type", "series", "timestamp"]
+        )
+
+    op.execute(
+        "UPDATE indicator_points SET period = NULL WHERE indicator IN ('rsi', 'macd')"
+    )
+
+
+def downgrade() -> None:
+    op.execute("UPDATE indicator_points SET period = 14 WHERE indicator = 'rsi'")
+    op.execute("UPDATE indicator_points SET period = 26 WHERE indicator = 'macd'")
+
+    with op.batch_alter_table("indicator_points") as batch_op:
+        batch_op.drop_constraint(CONSTRAINT_NAME, type_="unique")
+        batch_op.alter_column(
+            "period",
+            existing_type=sa.Integer(),
+            nullable=False,
+            comment="이동평균 기간 (RSI 14, MACD 26 고정)",
+        )
+        batch_op.create_unique_constraint(
+            CONSTRAINT_NAME, ["indicator", "type", "period", "timestamp"]
+        )
+        batch_op.drop_column("series")
@@ -1,5 +1,15 @@
 from database import Base
-from sqlalchemy import Column, Integer, Float, DateTime, Enum, JSON, String
+from sqlalchemy import (
+    Column,
+    Integer,
+    Float,
+    DateTime,
+    Enum,
+    Index,
+    JSON,
+    String,
+    UniqueConstraint,
+)
 from sqlalchemy.sql import func
 
 
@@ -9,7 +19,6 @@ class MovingAverage(Base):
     id = Column(Integer, primary_key=True, index=True)
     type = Column(
         Enum("day", "week", "hour4", "hour1", name="timeframe_type"),
-        index=True,
         nullable=False,
     )
 
@@ -50,6 +59,11 @@ class MovingAverage(Base):
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
+    # type별 최신 행 조회 (WHERE type = ? ORDER BY last_updated DESC LIMIT 1)
+    __table_args__ = (
+        Index("ix_moving_averages_type_last_updated", type, last_updated.desc()),
+    )
+
 
 class Rsi(Base):
     __tablename__ = "rsi"
@@ -57,7 +71,6 @@ class Rsi(Base):
     id = Column(Integer, primary_key=True, index=True)
     type = Column(
         Enum("day", "week", "hour4", "hour1", name="timeframe_type"),
-        index=True,
         nullable=False,
     )
     rsi_values = Column(
@@ -71,6 +84,11 @@ class Rsi(Base):
         comment="각 RSI 값에 해당하는 타임스탬프 리스트",
     )
     current_rsi = Column(Float, nullable=False, comment="현재 최신 RSI 값")
+    state = Column(
+        JSON,
+        nullable=True,
+        comment="Wilder RSI 증분 계산 상태 (avg_gain, avg_loss, 마지막 종가)",
+    )
     last_updated = Column(
         DateTime(timezone=True),
         nullable=False,
@@ -81,6 +99,9 @@ class Rsi(Base):
         nullable=False,
     )
 
+    # type별 최신 행 조회 (WHERE type = ? ORDER BY last_updated DESC LIMIT 1)
+    __table_args__ = (Index("ix_rsi_type_last_updated", type, last_updated.desc()),)
+
 
 class Macd(Base):
     __tablename__ = "macd"
@@ -88,7 +109,6 @@ class Macd(Base):
     id = Column(Integer, primary_key=True, index=True)
     type = Column(
         Enum("day", "week", "hour4", "hour1", name="timeframe_type"),
-        index=True,
         nullable=False,
     )
     dates = Column(
@@ -121,6 +141,87 @@ class Macd(Base):
         nullable=False,
     )
 
+    # type별 최신 행 조회 (WHERE type = ? ORDER BY last_updated DESC LIMIT 1)
+    __table_args__ = (Index("ix_macd_type_last_updated", type, last_updated.desc()),)
+
+
+class IndicatorPoint(Base):
+    __tablename__ = "indicator_points"
+    __table_args__ = (
+        # 시계열 범위 조회와 ON CONFLICT upsert 대상이 되는 복합 유니크 인덱스
+        UniqueConstraint(
+            "indicator",
+            "type",
+            "series",
+            "timestamp",
+            name="uq_indicator_points_series_timestamp",
+        ),
+    )
+
+    id = Column(Integer, primary_key=True)
+    indicator = Column(
+        Enum("moving_average", "rsi", "macd", name="indicator_name"),
+        nullable=False,
+    )
+    type = Column(
+        Enum("day", "week", "hour4", "hour1", name="timeframe_type"),
+        nullable=False,
+    )
+    series = Column(
+        String, nullable=False, comment="시리즈 이름 (ma_7 등, RSI/MACD는 rsi, macd)"
+    )
+    period = Column(Integer, nullable=True, comment="이동평균 기간 (RSI/MACD는 NULL)")
+    timestamp = Column(DateTime, nullable=False, comment="캔들 시각 (UTC)")
+    value = Column(Float, nullable=True, comment="이동평균/RSI/MACD 라인 값")
+    price = Column(Float, nullable=True, comment="이동평균 계산에 사용된 종가")
+    signal = Column(Float, nullable=True, comment="MACD 시그널 라인 값")
+    histogram = Column(Float, nullable=True, comment="MACD 히스토그램 값")
+
+
+class IndicatorArchive(Base):
+    __tablename__ = "indicator_archive"
+    __table_args__ = (
+        # 같은 시리즈를 같은 시작 시각부터 다시 보관하면 (PUT/PATCH 실패 후 재시도 등)
+        # 새 행을 추가하지 않고 ON CONFLICT로 기존 행을 갱신
+        UniqueConstraint(
+            "indicator",
+            "type",
+            "series",
+            "start_timestamp",
+            name="uq_indicator_archive_series_start",
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    indicator = Column(
+        Enum("moving_average", "rsi", "macd", name="indicator_name"),
+        index=True,
+        nullable=False,
+    )
+    type = Column(
+        Enum("day", "week", "hour4", "hour1", name="timeframe_type"),
+        index=True,
+        nullable=False,
+    )
+    series = Column(String, nullable=False, comment="시리즈 이름 (ma_7, rsi 등)")
+    start_timestamp = Column(
+        DateTime(timezone=True), nullable=False, comment="가장 오래된 포인트 시각"
+    )
+    end_timestamp = Column(
+        DateTime(timezone=True), nullable=False, comment="가장 최근 포인트 시각"
+    )
+    point_count = Column(Integer, nullable=False)
+    points = Column(
+        JSON,
+        nullable=False,
+        comment="보관 기간이 지나 지표 JSON 컬럼에서 잘라낸 포인트 리스트",
+    )
+    created_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
 
 class LatestLog(Base):
     __tablename__ = "latest_logs"
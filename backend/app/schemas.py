@@ -11,6 +11,12 @@ class TimeFrameType(str, Enum):
     HOUR1 = "hour1"
 
 
+class IndicatorName(str, Enum):
+    MOVING_AVERAGE = "moving_average"
+    RSI = "rsi"
+    MACD = "macd"
+
+
 class MovingAverageResponse(BaseModel):
     id: int
     type: TimeFrameType
@@ -112,12 +118,31 @@ class MovingAverageRequest(BaseModel):
         }
 
 
+class RsiState(BaseModel):
+    """
+    Wilder RSI 증분 계산 상태 (pandas ewm(com=period-1, adjust=True)와 같은 값)
+
+    avg_gain/avg_loss는 가중 평균, weight는 지금까지의 가중치 합이며
+    prev는 마지막 캔들을 반영하기 전 상태 (같은 캔들이 다시 들어오면 prev에서 재계산)
+    """
+
+    period: int = Field(14, description="RSI 기간")
+    avg_gain: float = Field(..., description="평균 상승폭")
+    avg_loss: float = Field(..., description="평균 하락폭")
+    weight: float = Field(..., description="지수 가중치 합")
+    count: int = Field(..., description="반영된 가격 변화 수")
+    last_close: float = Field(..., description="마지막 캔들 종가")
+    timestamp: str = Field(..., description="마지막 캔들 시각 (candle_date_time_utc)")
+    prev: Optional["RsiState"] = Field(None, description="마지막 캔들 반영 전 상태")
+
+
 class RsiRequest(BaseModel):
     type: TimeFrameType = Field(..., description="타임프레임 (day, week, hour4, hour1)")
     rsi_values: List[float] = Field(..., description="RSI 값들")
     timestamps: List[datetime] = Field(..., description="rsi 해당하는 타임스탬프")
     current_rsi: float = Field(..., description="현재 가장 최근 RSI")
     last_updated: datetime = Field(..., description="마지막 rsi 시간")
+    state: Optional[RsiState] = Field(None, description="증분 계산 상태")
 
     class Config:
         json_schema_extra = {
@@ -144,6 +169,7 @@ class RsiResponse(BaseModel):
     current_rsi: float
     last_updated: datetime
     created_at: datetime
+    state: Optional[RsiState] = None
 
     class Config:
         orm_mode = True  # ORM 모델을 Pydantic 모델로 변환하기 위한 설정
@@ -199,6 +225,126 @@ class MacdResponse(BaseModel):
         orm_mode = True  # ORM 모델을 Pydantic 모델로 변환하기 위한 설정
 
 
+class MovingAveragePoint(BaseModel):
+    timestamp: datetime
+    value: Optional[float] = None
+    price: Optional[float] = None
+
+
+class MovingAverageDelta(BaseModel):
+    type: TimeFrameType = Field(..., description="타임프레임 (day, week, hour4, hour1)")
+    values: Dict[str, Optional[float]] = Field(
+        ..., description="최신 이동평균 값 (ma, ma_7 등 헤더 컬럼)"
+    )
+    points: Dict[str, MovingAveragePoint] = Field(
+        ..., description="기간별로 새로 추가(또는 진행 중 캔들 교체)된 포인트"
+    )
+    retain_from: Dict[str, datetime] = Field(
+        default_factory=dict, description="기간별 보관 시작 시각 (이전 포인트 삭제)"
+    )
+    last_updated: datetime = Field(..., description="마지막 업데이트 시간")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "type": "hour1",
+                "values": {"ma": 143623561.11, "ma_7": 146615714.29},
+                "points": {
+                    "ma_7": {
+                        "timestamp": "2025-03-03T05:00:00",
+                        "value": 146615714.29,
+                        "price": 146500000.0,
+                    }
+                },
+                "retain_from": {"ma_7": "2025-02-01T06:00:00"},
+                "last_updated": "2025-03-03T05:01:02.158165+00:00",
+            }
+        }
+
+
+class RsiPoint(BaseModel):
+    timestamp: datetime
+    value: float
+
+
+class RsiDelta(BaseModel):
+    type: TimeFrameType = Field(..., description="타임프레임 (day, week, hour4, hour1)")
+    point: RsiPoint = Field(..., description="새로 추가(또는 교체)된 RSI 포인트")
+    current_rsi: float = Field(..., description="현재 가장 최근 RSI")
+    retain_from: Optional[datetime] = Field(None, description="보관 시작 시각")
+    last_updated: datetime = Field(..., description="마지막 rsi 시간")
+    state: Optional[RsiState] = Field(None, description="증분 계산 상태")
+
+
+class MacdPoint(BaseModel):
+    timestamp: datetime
+    macd: float
+    signal: float
+    histogram: float
+
+
+class MacdDelta(BaseModel):
+    type: TimeFrameType = Field(..., description="타임프레임 (day, week, hour4, hour1)")
+    points: List[MacdPoint] = Field(..., description="새로 추가(또는 교체)된 포인트")
+    retain_from: Optional[datetime] = Field(None, description="보관 시작 시각")
+    last_updated: datetime = Field(..., description="마지막 macd 시간")
+
+
+class TimeframeIndicatorSnapshot(BaseModel):
+    moving_average: Optional[MovingAverageResponse] = None
+    rsi: Optional[RsiResponse] = None
+    macd: Optional[MacdResponse] = None
+
+
+class IndicatorPointResponse(BaseModel):
+    series: str
+    period: Optional[int] = None
+    timestamp: datetime
+    value: Optional[float] = None
+    price: Optional[float] = None
+    signal: Optional[float] = None
+    histogram: Optional[float] = None
+
+
+class IndicatorArchiveRequest(BaseModel):
+    indicator: IndicatorName = Field(
+        ..., description="지표 이름 (moving_average, rsi, macd)"
+    )
+    type: TimeFrameType = Field(..., description="타임프레임 (day, week, hour4, hour1)")
+    series: Dict[str, List[Dict[str, Any]]] = Field(
+        ..., description="시리즈별로 보관 기간이 지나 잘라낸 포인트 (timestamp 필수)"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "indicator": "rsi",
+                "type": "hour1",
+                "series": {
+                    "rsi": [
+                        {"timestamp": "2025-02-01T00:00:00", "value": 42.5},
+                        {"timestamp": "2025-02-01T01:00:00", "value": 45.8},
+                    ]
+                },
+            }
+        }
+
+
+class IndicatorArchiveResponse(BaseModel):
+    id: int
+    indicator: IndicatorName
+    type: TimeFrameType
+    series: str
+    start_timestamp: datetime
+    end_timestamp: datetime
+    point_count: int
+    points: Optional[List[Dict[str, Any]]] = None
+    created_at: datetime
+
+    class Config:
+        orm_mode = True
+
+
 class LogBase(BaseModel):
     message: str
     module: str
@@ -1,30 +1,115 @@
+import asyncio
 import json
-from typing import Dict, List
+import logging
+import os
+from dataclasses import dataclass
+from typing import Dict, Optional
 from fastapi import WebSocket
 
+logger = logging.getLogger(__name__)
+
+# 클라이언트별 전송 대기열 크기, 가득 차면 가장 오래된 메시지부터 버림
+WS_SEND_QUEUE_SIZE = int(os.getenv("WS_SEND_QUEUE_SIZE", "100"))
+
+# 한 메시지 전송이 이 시간을 넘기면 느린 클라이언트로 보고 연결을 끊음
+WS_SEND_TIMEOUT_SEC = float(os.getenv("WS_SEND_TIMEOUT_SEC", "5"))
+
+
+@dataclass
+class ClientConnection:
+    websocket: WebSocket
+    queue: asyncio.Queue
+    sender: Optional[asyncio.Task] = None
+    sent: int = 0
+    dropped: int = 0
+
 
 class WsConnectionManager:
-    def __init__(self):
+    """
+    로그 브로드캐스트용 WebSocket 연결 관리자
+
+    broadcast는 메시지를 한 번만 직렬화해 클라이언트별 대기열에 넣고 바로 반환하며,
+    실제 전송은 클라이언트마다 하나씩 있는 전송 태스크가 동시에 처리한다.
+    느린 클라이언트는 자기 대기열에서 오래된 메시지를 잃을 뿐 다른 클라이언트나
+    브로드캐스트를 호출한 요청을 지연시키지 않는다.
+    """
+
+    def __init__(
+        self,
+        queue_size: int = WS_SEND_QUEUE_SIZE,
+        send_timeout: float = WS_SEND_TIMEOUT_SEC,
+    ):
+        self.queue_size = queue_size
+        self.send_timeout = send_timeout
         # 활성 WebSocket 연결 목록
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Dict[WebSocket, ClientConnection] = {}
+        self.broadcasts = 0
+        self.dropped = 0
+        self.pruned = 0
 
     async def connect(self, websocket: WebSocket):
         # 새 WebSocket 연결 수락
         await websocket.accept()
-        self.active_connections.append(websocket)
+        client = ClientConnection(
+            websocket=websocket, queue=asyncio.Queue(maxsize=self.queue_size)
+        )
+        client.sender = asyncio.create_task(self._send_loop(client))
+        self.active_connections[websocket] = client
 
     def disconnect(self, websocket: WebSocket):
-        # 연결 해제 처리
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        # 연결 해제 처리 (전송 태스크 정리, 여러 번 호출해도 안전)
+        client = self.active_connections.pop(websocket, None)
+        if client is None:
+            return
+        if client.sender is not None and client.sender is not asyncio.current_task():
+            client.sender.cancel()
 
     async def broadcast(self, message: Dict):
-        # 타임스탬프 추가 (없는 경우)
-        # 모든 활성 연결에 메시지 전송
-        for connection in self.active_connections:
+        # 모든 활성 연결의 대기열에 직렬화된 메시지를 넣음 (전송 완료를 기다리지 않음)
+        payload = json.dumps(message)
+        self.broadcasts += 1
+        for client in list(self.active_connections.values()):
+            if client.queue.full():
+                # 느린 클라이언트: 가장 오래된 메시지를 버리고 최신 메시지를 유지
+                client.queue.get_nowait()
+                client.dropped += 1
+                self.dropped += 1
+            client.queue.put_nowait(payload)
+
+    async def _send_loop(self, client: ClientConnection):
+        while True:
+            payload = await client.queue.get()
             try:
-                await connection.send_text(json.dumps(message))
+                await asyncio.wait_for(
+                    client.websocket.send_text(payload), timeout=self.send_timeout
+                )
+                client.sent += 1
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                print(f"메시지 전송 실패: {e}")
-                # 실패한 연결은 끊어진 것으로 간주하고 목록에서 제거 가능
-                # self.disconnect(connection)
+                # 전송 실패/시간 초과한 연결은 끊어진 것으로 간주하고 목록에서 제거
+                logger.warning(f"WebSocket 메시지 전송 실패, 연결 제거: {e!r}")
+                self.pruned += 1
+                self.disconnect(client.websocket)
+                await self._close(client.websocket)
+                return
+
+    @staticmethod
+    async def _close(websocket: WebSocket):
+        try:
+            await websocket.close()
+        except Exception:
+            pass
+
+    def stats(self) -> Dict:
+        return {
+            "connections": len(self.active_connections),
+            "queue_size": self.queue_size,
+            "send_timeout_sec": self.send_timeout,
+            "broadcasts": self.broadcasts,
+            "dropped": self.dropped,
+            "pruned": self.pruned,
+            "queued": sum(
+                client.queue.qsize() for client in self.active_connections.values()
+            ),
+        }
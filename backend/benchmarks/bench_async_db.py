@@ -0,0 +1,202 @@
+"""
+동기 Session과 AsyncSession의 동시 요청 처리량/이벤트 루프 지연 비교 벤치마크
+
+SQLite 파일 DB(동기: pysqlite, 비동기: aiosqlite)를 Postgres 대신 사용한다.
+- 이전 방식: async def 핸들러 안에서 동기 Session으로 쿼리 (쿼리 동안 이벤트 루프 정지)
+- 현재 방식: main.app의 /api/indicator-points 핸들러 (AsyncSession)
+두 방식 모두 같은 SELECT 문(indicator_points.series_query)으로 hour1 이동평균 전체를 읽는다.
+
+부하를 주는 동안 5ms마다 DB를 쓰지 않는 가벼운 엔드포인트(/api/cache/stats)를 호출하고
+예정보다 늦어진 시간(probe)을 재서 웹소켓 브로드캐스트 등 다른 요청이 얼마나 밀리는지
+(이벤트 루프 지연)를 함께 측정한다.
+네트워크 왕복이 있는 실제 Postgres에서는 쿼리 대기 시간이 길어 차이가 더 크게 난다.
+
+이전 방식은 기본 풀(5 + overflow 10)에서 동시 요청이 15개를 넘으면, 이벤트 루프가 풀 대기로
+멈춘 채 커넥션 반환(다른 요청의 정리 코드)도 실행하지 못해 pool_timeout(30초)까지 교착된다.
+비교를 위해 이전 방식에도 현재 풀 크기(DB_POOL_SIZE + DB_MAX_OVERFLOW)를 적용한다.
+
+실행: python benchmarks/bench_async_db.py
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+DB_PATH = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+os.environ["DB_PROFILE"] = "prod"  # 배포 환경과 같은 풀 크기, SQL 로깅 없음
+
+APP_DIR = Path(__file__).resolve().parents[1] / "app"
+sys.path.insert(0, str(APP_DIR))
+
+import httpx  # noqa: E402
+from alembic import command  # noqa: E402
+from alembic.config import Config  # noqa: E402
+from fastapi import Depends, FastAPI  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import Session, sessionmaker  # noqa: E402
+
+import main  # noqa: E402
+from database import DB_MAX_OVERFLOW, DB_POOL_SIZE  # noqa: E402
+from indicator_points import (  # noqa: E402
+    group_series,
+    series_query,
+    sorted_series_names,
+)
+from schemas import IndicatorPointResponse  # noqa: E402
+
+REQUESTS = 200
+CONCURRENCY = 20
+PROBE_INTERVAL_SEC = 0.005
+PERIODS = [3, 7, 25]
+POINTS_PER_PERIOD = 720
+
+ENDPOINT = "/api/indicator-points/moving_average/hour1"
+
+
+def build_legacy_app():
+    """async def 핸들러 + 동기 Session (이전 get_db 방식)"""
+    sync_engine = create_engine(
+        os.environ["DATABASE_URL"],
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+    )
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
+
+    def get_sync_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+
+    @app.get(ENDPOINT)
+    async def get_points(db: Session = Depends(get_sync_db)):
+        series = group_series(
+            db.execute(series_query("moving_average", ["hour1"])).all()
+        ).get("hour1", {})
+        return [
+            IndicatorPointResponse.model_validate(point, from_attributes=True)
+            for name in sorted_series_names(series)
+            for point in series[name]
+        ]
+
+    @app.get("/api/cache/stats")
+    async def get_cache_stats():
+        return main.indicator_cache.stats()
+
+    return app
+
+
+def seed(client_app):
+    start = datetime(2025, 1, 1)
+    ma_values = {
+        f"ma_{period}": [
+            {
+                "timestamp": (start + timedelta(hours=hour)).isoformat(),
+                "value": 100.0 + hour,
+                "price": 100.0 + hour,
+            }
+            for hour in range(POINTS_PER_PERIOD)
+        ]
+        for period in PERIODS
+    }
+    body = {
+        "type": "hour1",
+        "ma": 1.0,
+        "macd_short_period": 12,
+        "macd_long_period": 26,
+        "signal_period": 9,
+        "ma_values": ma_values,
+        "last_updated": datetime.now(timezone.utc).isoformat(),
+    }
+
+    async def post():
+        transport = httpx.ASGITransport(app=client_app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            response = await c.post("/api/moving-averages", json=body)
+            response.raise_for_status()
+
+    asyncio.run(post())
+
+
+async def run_load(app):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+        # 워밍업 (커넥션 풀, 직렬화 경로)
+        (await client.get(ENDPOINT)).raise_for_status()
+
+        queue = asyncio.Queue()
+        for _ in range(REQUESTS):
+            queue.put_nowait(None)
+        latencies = []
+        probe_latencies = []
+        done = asyncio.Event()
+
+        async def worker():
+            while not queue.empty():
+                queue.get_nowait()
+                started = time.perf_counter()
+                response = await client.get(ENDPOINT)
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        async def probe():
+            # 대기 시간 이후 가벼운 요청이 끝나기까지 예정보다 늦어진 시간 (이벤트 루프 지연)
+            while not done.is_set():
+                started = time.perf_counter()
+                await asyncio.sleep(PROBE_INTERVAL_SEC)
+                (await client.get("/api/cache/stats")).raise_for_status()
+                probe_latencies.append(
+                    time.perf_counter() - started - PROBE_INTERVAL_SEC
+                )
+
+        probe_task = asyncio.create_task(probe())
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await probe_task
+
+    return elapsed, latencies, probe_latencies
+
+
+def percentile(values, q):
+    return statistics.quantiles(values, n=100)[q - 1] * 1000
+
+
+def report(name, elapsed, latencies, probe_latencies):
+    print(
+        f"{name:<26} {REQUESTS / elapsed:8.1f} req/s  "
+        f"p50 {percentile(latencies, 50):7.1f} ms  "
+        f"p99 {percentile(latencies, 99):7.1f} ms  "
+        f"probe p50 {percentile(probe_latencies, 50):6.1f} ms  "
+        f"probe p99 {percentile(probe_latencies, 99):6.1f} ms  "
+        f"(probe {len(probe_latencies)}회)"
+    )
+
+
+def main_benchmark():
+    config = Config(str(APP_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(APP_DIR / "migrations"))
+    command.upgrade(config, "head")
+
+    seed(main.app)
+
+    print(
+        f"요청 {REQUESTS}개, 동시성 {CONCURRENCY}, "
+        f"응답당 포인트 {len(PERIODS) * POINTS_PER_PERIOD}개"
+    )
+    report("동기 Session (이전)", *asyncio.run(run_load(build_legacy_app())))
+    report("AsyncSession (현재)", *asyncio.run(run_load(main.app)))
+
+
+if __name__ == "__main__":
+    main_benchmark()
@@ -0,0 +1,120 @@
+"""
+백엔드 워커 콜드 스타트 시간 측정 벤치마크
+
+새 파이썬 프로세스에서 main을 import하고 첫 DB 조회 요청에 응답하기까지의 시간을 잰다.
+- 이전 방식: import 시점에 동기 엔진 생성 + Base.metadata.create_all (스키마 조회)
+  + 비동기 엔진 생성 (드라이버 로딩)
+- 현재 방식: import 시점에는 DB 작업 없음, 첫 요청에서 비동기 엔진 생성
+
+SQLite 파일 DB를 Postgres 대신 사용하며 스키마는 측정 전에 alembic upgrade head로 한 번만 만든다.
+Postgres에서는 create_all이 테이블마다 존재 여부를 네트워크로 조회하므로 차이가 더 크고,
+uvicorn --workers N이면 워커마다 이 비용을 치르며 동시에 DDL을 실행하다 충돌할 수 있다.
+
+실행: python benchmarks/bench_cold_start.py
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parents[1] / "app"
+
+RUNS = 10
+ENDPOINT = "/api/indicator-points/moving_average/hour1"
+
+
+def child(mode):
+    """새 프로세스에서 실행: import/첫 응답까지 걸린 시간을 JSON으로 출력"""
+    started = time.perf_counter()
+    sys.path.insert(0, str(APP_DIR))
+
+    import main
+
+    if mode == "legacy":
+        from sqlalchemy import create_engine
+
+        from database import Base, get_async_engine
+
+        Base.metadata.create_all(bind=create_engine(os.environ["DATABASE_URL"]))
+        get_async_engine()
+    imported = time.perf_counter()
+    driver_loaded = "aiosqlite" in sys.modules
+
+    import asyncio
+
+    import httpx
+
+    async def first_request():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            return (await c.get(ENDPOINT)).status_code
+
+    status = asyncio.run(first_request())
+    responded = time.perf_counter()
+
+    print(
+        json.dumps(
+            {
+                "import_ms": (imported - started) * 1000,
+                "first_response_ms": (responded - started) * 1000,
+                "driver_loaded_at_import": driver_loaded,
+                "status": status,
+            }
+        )
+    )
+
+
+def run(mode, env):
+    results = []
+    for _ in range(RUNS):
+        output = subprocess.run(
+            [sys.executable, __file__, "--child", mode],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+    return results
+
+
+def report(name, results):
+    import_ms = statistics.median(result["import_ms"] for result in results)
+    response_ms = statistics.median(result["first_response_ms"] for result in results)
+    print(
+        f"{name:<28} import {import_ms:7.1f} ms  첫 응답 {response_ms:7.1f} ms  "
+        f"import 시 드라이버 로딩 {results[0]['driver_loaded_at_import']}  "
+        f"(status {results[0]['status']})"
+    )
+
+
+def main_benchmark():
+    db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{db_path}",
+        "DB_ECHO": "false",
+    }
+    subprocess.run(
+        [sys.executable, "-m", "alembic", "upgrade", "head"],
+        cwd=APP_DIR,
+        env=env,
+        capture_output=True,
+        check=True,
+    )
+
+    print(f"프로세스 {RUNS}회 실행의 중앙값 (프로세스 시작 ~ import / 첫 DB 조회 응답)")
+    report("create_all at import (이전)", run("legacy", env))
+    report("lazy engine (현재)", run("current", env))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == "--child":
+        child(sys.argv[2])
+    else:
+        main_benchmark()
@@ -0,0 +1,166 @@
+"""
+JSON 응답 직렬화 (JSONResponse vs ORJSONResponse) 비교 벤치마크
+
+SQLite 파일 DB를 Postgres 대신 사용한다.
+4개 타임프레임에 보관 기간(720포인트)만큼 ma_values/RSI/MACD 시계열이 쌓인 지표를 저장한 뒤,
+응답 캐시를 거치지 않는 엔드포인트의 응답 시간을 비교한다.
+- GET /api/indicators/snapshot (모든 타임프레임의 ma_values 포함)
+- GET /api/indicator-points/moving_average/hour1
+
+같은 라우트를 JSONResponse(이전 기본값)로 다시 구성해 측정하고, 응답 본문 렌더링 단계만 따로 잰다.
+
+실행: python benchmarks/bench_json_response.py
+"""
+
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+DB_PATH = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+os.environ["DB_ECHO"] = "false"
+
+APP_DIR = Path(__file__).resolve().parents[1] / "app"
+sys.path.insert(0, str(APP_DIR))
+
+import httpx  # noqa: E402
+from alembic import command  # noqa: E402
+from alembic.config import Config  # noqa: E402
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse, ORJSONResponse  # noqa: E402
+from fastapi.routing import APIRoute, request_response  # noqa: E402
+
+import main  # noqa: E402
+
+TYPES = ["hour1", "hour4", "day", "week"]
+MA_PERIODS = [3, 7, 12, 25, 26, 50, 84]
+POINTS = 720
+REQUESTS = 30
+ENDPOINTS = [
+    "/api/indicators/snapshot",
+    "/api/indicator-points/moving_average/hour1",
+]
+
+
+def timestamps(count):
+    start = datetime(2025, 1, 1)
+    return [(start + timedelta(hours=index)).isoformat() for index in range(count)]
+
+
+def indicator_payloads(type, rng):
+    dates = timestamps(POINTS)
+    prices = [120_000_000 + rng.gauss(0, 2_000_000) for _ in dates]
+    now = datetime.now(timezone.utc).isoformat()
+    moving_average = {
+        "type": type,
+        "ma": prices[-1],
+        "macd_short_period": 12,
+        "macd_long_period": 26,
+        "signal_period": 9,
+        "ma_values": {
+            f"ma_{period}": [
+                {"timestamp": date, "value": round(price, 2), "price": price}
+                for date, price in zip(dates, prices)
+            ]
+            for period in MA_PERIODS
+        },
+        "last_updated": now,
+    }
+    rsi = {
+        "type": type,
+        "rsi_values": [rng.uniform(20, 80) for _ in dates],
+        "timestamps": dates,
+        "current_rsi": 50.0,
+        "last_updated": dates[-1],
+    }
+    macd = {
+        "type": type,
+        "dates": dates,
+        "macd_line": [rng.gauss(0, 1e6) for _ in dates],
+        "signal_line": [rng.gauss(0, 1e6) for _ in dates],
+        "histogram": [rng.gauss(0, 1e5) for _ in dates],
+        "last_updated": now,
+    }
+    return moving_average, rsi, macd
+
+
+def use_response_class(app, response_class):
+    """ENDPOINTS 라우트의 응답 클래스를 바꿔 요청 처리기를 다시 구성"""
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.path in ENDPOINTS:
+            route.response_class = response_class
+            route.app = request_response(route.get_route_handler())
+
+
+async def run(client, name):
+    bodies = {}
+    for endpoint in ENDPOINTS:
+        latencies = []
+        for _ in range(REQUESTS):
+            started = time.perf_counter()
+            response = await client.get(endpoint)
+            latencies.append((time.perf_counter() - started) * 1000)
+            response.raise_for_status()
+        bodies[endpoint] = response.json()
+        print(
+            f"  {name:<16} {endpoint:<44} p50 {statistics.median(latencies):7.2f} ms  "
+            f"({len(response.content) / 1024:6.1f} KB)"
+        )
+    return bodies
+
+
+def measure_render(content):
+    encoded = jsonable_encoder(content)
+    results = {}
+    for response_class in (JSONResponse, ORJSONResponse):
+        started = time.perf_counter()
+        for _ in range(REQUESTS):
+            response_class(encoded)
+        results[response_class.__name__] = (
+            (time.perf_counter() - started) / REQUESTS * 1000
+        )
+    return results
+
+
+async def main_benchmark():
+    config = Config(str(APP_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(APP_DIR / "migrations"))
+    command.upgrade(config, "head")
+
+    rng = random.Random(7)
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+        for type in TYPES:
+            moving_average, rsi, macd = indicator_payloads(type, rng)
+            for path, body in (
+                ("/api/moving-averages", moving_average),
+                ("/api/rsi", rsi),
+                ("/api/macd", macd),
+            ):
+                (await client.post(path, json=body)).raise_for_status()
+
+        print(f"타임프레임 {len(TYPES)}개 x 시계열 {POINTS}포인트, 요청 {REQUESTS}회")
+        use_response_class(main.app, JSONResponse)
+        legacy_bodies = await run(client, "JSONResponse")
+        use_response_class(main.app, ORJSONResponse)
+        current_bodies = await run(client, "ORJSONResponse")
+
+    assert legacy_bodies == current_bodies
+
+    print("응답 본문 렌더링만 (jsonable_encoder 이후)")
+    for endpoint, body in current_bodies.items():
+        render = measure_render(body)
+        print(
+            f"  {endpoint:<44} JSONResponse {render['JSONResponse']:6.2f} ms  "
+            f"ORJSONResponse {render['ORJSONResponse']:6.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main_benchmark())
@@ -0,0 +1,165 @@
+"""
+type별 최신 행 조회 (WHERE type = ? ORDER BY last_updated DESC LIMIT 1) 인덱스 전후 비교 벤치마크
+
+SQLite 파일 DB를 Postgres 대신 사용한다.
+1. alembic upgrade 0001 (type 단일 인덱스만 있는 기존 스키마)
+2. moving_averages/rsi/macd에 type별로 이력 행을 쌓음
+3. _latest_row(단건), _latest_rows_by_type(4개 type 한 번에), 이전 윈도 함수 방식을 측정
+4. alembic upgrade head ((type, last_updated DESC) 복합 인덱스) 후 다시 측정
+
+각 단계마다 단건 조회의 실행 계획(EXPLAIN QUERY PLAN)을 함께 출력한다.
+
+실행: python benchmarks/bench_latest_row_lookup.py
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+DB_PATH = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+os.environ["DB_ECHO"] = "false"
+
+APP_DIR = Path(__file__).resolve().parents[1] / "app"
+sys.path.insert(0, str(APP_DIR))
+
+from alembic import command  # noqa: E402
+from alembic.config import Config  # noqa: E402
+from sqlalchemy import create_engine, func, insert, select, text  # noqa: E402
+from sqlalchemy.dialects import sqlite  # noqa: E402
+
+import main  # noqa: E402
+from database import get_async_engine, get_session_factory  # noqa: E402
+from models import Macd, MovingAverage, Rsi  # noqa: E402
+
+TYPES = ["day", "week", "hour4", "hour1"]
+ROWS_PER_TYPE = 25_000
+REPEAT = 100
+BATCH_SIZE = 5_000
+
+
+def alembic_upgrade(revision):
+    config = Config(str(APP_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(APP_DIR / "migrations"))
+    command.upgrade(config, revision)
+
+
+def header_row(model, type, last_updated):
+    row = {"type": type, "last_updated": last_updated}
+    if model is MovingAverage:
+        row.update(
+            ma=1.0,
+            macd_short_period=12,
+            macd_long_period=26,
+            signal_period=9,
+            ma_values={},
+        )
+    elif model is Rsi:
+        row.update(rsi_values=[], timestamps=[], current_rsi=50.0)
+    else:
+        row.update(dates=[], macd_line=[], signal_line=[], histogram=[])
+    return row
+
+
+def seed():
+    """type이 섞인 순서로 이력 행을 쌓음 (실제 운영처럼 type별 갱신이 번갈아 일어남)"""
+    sync_engine = create_engine(os.environ["DATABASE_URL"])
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    with sync_engine.begin() as connection:
+        for model in (MovingAverage, Rsi, Macd):
+            rows = [
+                header_row(model, type, start + timedelta(minutes=index))
+                for index in range(ROWS_PER_TYPE)
+                for type in TYPES
+            ]
+            for offset in range(0, len(rows), BATCH_SIZE):
+                connection.execute(
+                    insert(model.__table__), rows[offset : offset + BATCH_SIZE]
+                )
+    sync_engine.dispose()
+
+
+async def latest_rows_by_window(db, model, types):
+    """이전 방식: 윈도 함수로 type별 순위를 매긴 뒤 1위만 조회"""
+    ranked = (
+        select(
+            model.id,
+            func.row_number()
+            .over(partition_by=model.type, order_by=model.last_updated.desc())
+            .label("row_number"),
+        )
+        .where(model.type.in_(types))
+        .subquery()
+    )
+    result = await db.execute(
+        select(model)
+        .join(ranked, model.id == ranked.c.id)
+        .where(ranked.c.row_number == 1)
+    )
+    return {row.type: row for row in result.scalars()}
+
+
+async def measure(call):
+    timings = []
+    async with get_session_factory()() as db:
+        await call(db)  # 워밍업
+        for _ in range(REPEAT):
+            started = time.perf_counter()
+            await call(db)
+            timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), statistics.quantiles(timings, n=100)[98]
+
+
+async def explain(model):
+    statement = (
+        select(model.id)
+        .where(model.type == "hour1")
+        .order_by(model.last_updated.desc())
+        .limit(1)
+    )
+    compiled = statement.compile(
+        dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    async with get_session_factory()() as db:
+        plan = await db.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))
+        return " / ".join(row[-1] for row in plan)
+
+
+async def run_stage(label):
+    print(f"\n[{label}]")
+    for model in (MovingAverage, Rsi, Macd):
+        print(f"{model.__tablename__}: {await explain(model)}")
+        cases = {
+            "_latest_row (hour1)": lambda db: main._latest_row(db, model, "hour1"),
+            "_latest_rows_by_type (4개)": lambda db: main._latest_rows_by_type(
+                db, model, TYPES
+            ),
+            "윈도 함수 (이전 방식)": lambda db: latest_rows_by_window(db, model, TYPES),
+        }
+        for name, call in cases.items():
+            p50, p99 = await measure(call)
+            print(f"  {name:<28} p50 {p50:8.3f} ms  p99 {p99:8.3f} ms")
+
+    # 다음 단계에서 마이그레이션 이전 스키마로 준비된 커넥션을 재사용하지 않도록 정리
+    await get_async_engine().dispose()
+
+
+def main_benchmark():
+    alembic_upgrade("0001")
+    seed()
+    print(
+        f"테이블당 행 {ROWS_PER_TYPE * len(TYPES)}개 (type별 {ROWS_PER_TYPE}개), 반복 {REPEAT}회"
+    )
+
+    asyncio.run(run_stage("type 단일 인덱스 (0001)"))
+    alembic_upgrade("head")
+    asyncio.run(run_stage("(type, last_updated DESC) 복합 인덱스 (head)"))
+
+
+if __name__ == "__main__":
+    main_benchmark()
@@ -0,0 +1,124 @@
+"""
+/api/logs 수신 지연 비교 벤치마크
+
+SQLite 파일 DB(aiosqlite)를 Postgres 대신 사용한다.
+- 이전 방식: 요청 안에서 SELECT -> UPDATE/INSERT -> commit -> refresh -> 브로드캐스트
+- 현재 방식: main.app (이벤트 버스에 넣고 바로 응답, 백그라운드에서 배치 upsert)
+
+모니터링 모듈 5개가 틱마다 로그를 보내는 상황을 흉내 내어 동시성 CONCURRENCY로
+REQUESTS개의 로그를 보내고, 응답 지연과 실행된 DB 쿼리 수를 비교한다.
+
+실행: python benchmarks/bench_log_ingest.py
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict
+
+DB_PATH = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+os.environ["DB_ECHO"] = "false"
+
+APP_DIR = Path(__file__).resolve().parents[1] / "app"
+sys.path.insert(0, str(APP_DIR))
+
+import httpx  # noqa: E402
+from alembic import command  # noqa: E402
+from alembic.config import Config  # noqa: E402
+from fastapi import Depends, FastAPI  # noqa: E402
+from sqlalchemy import select  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
+
+import main  # noqa: E402
+from database import get_db, statement_metrics  # noqa: E402
+from models import LatestLog  # noqa: E402
+
+REQUESTS = 500
+CONCURRENCY = 5
+MODULES = [f"module_{index}" for index in range(5)]
+
+
+def build_legacy_app():
+    """이전 receive_logs 구현 (DB 저장과 브로드캐스트를 요청 안에서 처리)"""
+    app = FastAPI()
+
+    @app.post("/api/logs")
+    async def receive_logs(log: Dict, db: AsyncSession = Depends(get_db)):
+        result = await db.execute(
+            select(LatestLog).where(LatestLog.module == log["module"])
+        )
+        existing_log = result.scalar_one_or_none()
+        timestamp = main._parse_point_timestamp(log["timestamp"])
+
+        if existing_log:
+            existing_log.message = log["message"]
+            existing_log.timestamp = timestamp
+            await db.commit()
+            await db.refresh(existing_log)
+        else:
+            log_obj = LatestLog(
+                module=log["module"], message=log["message"], timestamp=timestamp
+            )
+            db.add(log_obj)
+            await db.commit()
+            await db.refresh(log_obj)
+
+        await main.manager.broadcast(log)
+        return {"success": True}
+
+    return app
+
+
+async def run_load(app):
+    statement_metrics.reset()
+    await main.log_bus.start()
+    transport = httpx.ASGITransport(app=app)
+    latencies = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+
+        async def worker(offset):
+            for index in range(offset, REQUESTS, CONCURRENCY):
+                body = {
+                    "module": MODULES[index % len(MODULES)],
+                    "message": f"틱 {index} 처리 완료",
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                }
+                started = time.perf_counter()
+                (await client.post("/api/logs", json=body)).raise_for_status()
+                latencies.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(offset) for offset in range(CONCURRENCY)))
+        elapsed = time.perf_counter() - started
+    # 현재 방식은 남은 이벤트까지 저장한 뒤의 쿼리 수를 센다
+    await main.log_bus.stop()
+    return elapsed, latencies, statement_metrics.snapshot()["all"]["count"]
+
+
+def report(name, elapsed, latencies, queries):
+    print(
+        f"{name:<22} {REQUESTS / elapsed:8.1f} req/s  "
+        f"p50 {statistics.median(latencies):6.2f} ms  "
+        f"p99 {statistics.quantiles(latencies, n=100)[98]:6.2f} ms  "
+        f"DB 쿼리 {queries}개"
+    )
+
+
+def main_benchmark():
+    config = Config(str(APP_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(APP_DIR / "migrations"))
+    command.upgrade(config, "head")
+
+    print(f"로그 {REQUESTS}개, 동시성 {CONCURRENCY}, 모듈 {len(MODULES)}개")
+    report("요청 내 저장 (이전)", *asyncio.run(run_load(build_legacy_app())))
+    report("이벤트 버스 (현재)", *asyncio.run(run_load(main.app)))
+
+
+if __name__ == "__main__":
+    main_benchmark()
@@ -0,0 +1,119 @@
+"""
+WebSocket 로그 브로드캐스트 지연 비교 벤치마크
+
+실제 소켓 대신 전송 시간을 흉내 내는 가짜 WebSocket을 사용한다.
+- 일반 클라이언트 FAST_CLIENTS개 (전송 1ms)
+- 느린 클라이언트 1개 (전송 SLOW_SEND_SEC초, 백그라운드 탭/느린 네트워크)
+- 끊어진 클라이언트 1개 (전송 시 예외)
+
+이전 방식(클라이언트마다 순서대로 json.dumps + await send_text, 끊어진 소켓 유지)과
+현재 WsConnectionManager에서 broadcast 호출(= /api/logs POST 응답) 지연과
+일반 클라이언트가 모든 메시지를 받기까지 걸린 시간을 비교한다.
+
+실행: python benchmarks/bench_ws_broadcast.py
+"""
+
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
+
+from ws_connection_manager import WsConnectionManager  # noqa: E402
+
+FAST_CLIENTS = 50
+FAST_SEND_SEC = 0.001
+SLOW_SEND_SEC = 2.0
+MESSAGES = 10
+
+MESSAGE = {
+    "module": "trade_signal_monitoring",
+    "message": "hour1 이동평균 업데이트 완료 " * 4,
+    "timestamp": "2025-03-10T00:00:00+00:00",
+}
+
+
+class FakeWebSocket:
+    def __init__(self, send_delay: float, fail: bool = False):
+        self.send_delay = send_delay
+        self.fail = fail
+        self.received = 0
+        self.done = asyncio.Event()
+
+    async def accept(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def send_text(self, payload: str):
+        if self.fail:
+            raise ConnectionResetError("connection closed")
+        await asyncio.sleep(self.send_delay)
+        self.received += 1
+        if self.received == MESSAGES:
+            self.done.set()
+
+
+class LegacyConnectionManager:
+    """이전 broadcast 구현"""
+
+    def __init__(self):
+        self.active_connections = []
+
+    async def connect(self, websocket):
+        await websocket.accept()
+        self.active_connections.append(websocket)
+
+    async def broadcast(self, message):
+        for connection in self.active_connections:
+            try:
+                await connection.send_text(json.dumps(message))
+            except Exception:
+                pass
+
+
+async def run(manager):
+    fast = [FakeWebSocket(FAST_SEND_SEC) for _ in range(FAST_CLIENTS)]
+    for websocket in [*fast, FakeWebSocket(SLOW_SEND_SEC), FakeWebSocket(0, True)]:
+        await manager.connect(websocket)
+
+    started = time.perf_counter()
+    call_latencies = []
+    for _ in range(MESSAGES):
+        call_started = time.perf_counter()
+        await manager.broadcast(MESSAGE)
+        call_latencies.append((time.perf_counter() - call_started) * 1000)
+    await asyncio.gather(*(websocket.done.wait() for websocket in fast))
+    delivered = time.perf_counter() - started
+
+    connections = len(manager.active_connections)
+    if isinstance(manager, WsConnectionManager):
+        # 느린 클라이언트의 남은 전송 태스크 정리
+        for websocket in list(manager.active_connections):
+            manager.disconnect(websocket)
+    return call_latencies, delivered, connections
+
+
+def report(name, call_latencies, delivered, connections):
+    print(
+        f"{name:<22} broadcast p50 {statistics.median(call_latencies):8.2f} ms  "
+        f"max {max(call_latencies):8.2f} ms  "
+        f"일반 클라이언트 전체 수신 {delivered:6.2f} s  남은 연결 {connections}"
+    )
+
+
+def main_benchmark():
+    print(
+        f"일반 클라이언트 {FAST_CLIENTS}개 + 느린 1개 ({SLOW_SEND_SEC}s) "
+        f"+ 끊어진 1개, 메시지 {MESSAGES}개"
+    )
+    report("순차 전송 (이전)", *asyncio.run(run(LegacyConnectionManager())))
+    report("대기열 + 동시 전송 (현재)", *asyncio.run(run(WsConnectionManager())))
+
+
+if __name__ == "__main__":
+    main_benchmark()
@@ -1,14 +1,29 @@
-import requests
 from datetime import datetime, timezone
 
+from api.http_client import get_session
+from api.log_shipper import get_log_shipper
 from log_generator import set_logger
 
 logger = set_logger()
 
+# 최근 비트코인 시장에서 긍정적 요소가 부정적 요소보다 더 많습니까?
+VECTOR_STORE_PROMPT = """
+            You are a Bitcoin market expert. You must analyze recent Bitcoin news and market trends to evaluate the current situation.System instruction: You MUST search and refer to the stored recent Bitcoin news and market data to answer this question.
+
+            Question: Are there more positive factors than negative ones in the recent Bitcoin market?
+
+            Response requirements:
+            1. Answer with EXACTLY ONE of these three words only: YES / NO / NEUTRAL
+            2. Do NOT include any other words or sentences
+            3. Access the stored market data to inform your answer
+
+            Response format: [YES/NO/NEUTRAL]
+        """
+
 
 def get_moving_average(type):
     try:
-        response = requests.get(f"http://backend:8000/api/moving-averages/{type}")
+        response = get_session().get(f"http://backend:8000/api/moving-averages/{type}")
 
         response.raise_for_status()
         return response.json()
@@ -18,7 +33,7 @@ def get_moving_average(type):
 
 def get_rsi(type):
     try:
-        response = requests.get(f"http://backend:8000/api/rsi/{type}")
+        response = get_session().get(f"http://backend:8000/api/rsi/{type}")
 
         response.raise_for_status()
         return response.json()
@@ -28,7 +43,7 @@ def get_rsi(type):
 
 def put_rsi(type, body):
     try:
-        response = requests.put(
+        response = get_session().put(
             f"http://backend:8000/api/rsi/{type}",
             json=body,
         )
@@ -41,7 +56,7 @@ def put_rsi(type, body):
 
 def create_moving_average(body):
     try:
-        response = requests.post(
+        response = get_session().post(
             "http://backend:8000/api/moving-averages",
             json=body,
         )
@@ -54,7 +69,7 @@ def create_moving_average(body):
 
 def put_moving_average(type, body):
     try:
-        response = requests.put(
+        response = get_session().put(
             f"http://backend:8000/api/moving-averages/{type}",
             json=body,
         )
@@ -65,9 +80,22 @@ def put_moving_average(type, body):
         raise Exception(f"이동평균선 수정 호출 중 오류 발생: {e}") from e
 
 
+def patch_moving_average(type, body):
+    try:
+        response = get_session().patch(
+            f"http://backend:8000/api/moving-averages/{type}",
+            json=body,
+        )
+
+        response.raise_for_status()
+    except Exception as e:
+        logger.error(body)
+        raise Exception(f"이동평균선 델타 병합 호출 중 오류 발생: {e}") from e
+
+
 def create_rsi(body):
     try:
-        response = requests.post(
+        response = get_session().post(
             "http://backend:8000/api/rsi",
             json=body,
         )
@@ -79,9 +107,22 @@ def create_rsi(body):
         raise Exception(f"RSI 생성 호출 중 오류 발생: {e}") from e
 
 
+def patch_rsi(type, body):
+    try:
+        response = get_session().patch(
+            f"http://backend:8000/api/rsi/{type}",
+            json=body,
+        )
+
+        response.raise_for_status()
+    except Exception as e:
+        logger.error(body)
+        raise Exception(f"RSI 델타 병합 호출 중 오류 발생: {e}") from e
+
+
 def get_macd(type):
     try:
-        response = requests.get(f"http://backend:8000/api/macd/{type}")
+        response = get_session().get(f"http://backend:8000/api/macd/{type}")
 
         response.raise_for_status()
         return response.json()
@@ -91,7 +132,7 @@ def get_macd(type):
 
 def create_macd(body):
     try:
-        response = requests.post(
+        response = get_session().post(
             "http://backend:8000/api/macd",
             json=body,
         )
@@ -104,7 +145,7 @@ def create_macd(body):
 
 def put_macd(type, body):
     try:
-        response = requests.put(
+        response = get_session().put(
             f"http://backend:8000/api/macd/{type}",
             json=body,
         )
@@ -115,24 +156,55 @@ def put_macd(type, body):
         raise Exception(f"macd 수정 호출 중 오류 발생: {e}") from e
 
 
-def get_vector_store_similar_ai():
+def patch_macd(type, body):
     try:
-        # 최근 비트코인 시장에서 긍정적 요소가 부정적 요소보다 더 많습니까?
-        prompt = """
-            You are a Bitcoin market expert. You must analyze recent Bitcoin news and market trends to evaluate the current situation.System instruction: You MUST search and refer to the stored recent Bitcoin news and market data to answer this question.
+        response = get_session().patch(
+            f"http://backend:8000/api/macd/{type}",
+            json=body,
+        )
 
-            Question: Are there more positive factors than negative ones in the recent Bitcoin market?
+        response.raise_for_status()
+    except Exception as e:
+        logger.error(body)
+        raise Exception(f"macd 델타 병합 호출 중 오류 발생: {e}") from e
 
-            Response requirements:
-            1. Answer with EXACTLY ONE of these three words only: YES / NO / NEUTRAL
-            2. Do NOT include any other words or sentences
-            3. Access the stored market data to inform your answer
 
-            Response format: [YES/NO/NEUTRAL]
-        """
-        response = requests.post(
+def get_indicator_snapshot_api_call(
+    types, include_ma_values=True, include_rsi_values=True
+):
+    try:
+        response = get_session().get(
+            "http://backend:8000/api/indicators/snapshot",
+            params={
+                "timeframes": types,
+                "include_ma_values": str(include_ma_values).lower(),
+                "include_rsi_values": str(include_rsi_values).lower(),
+            },
+        )
+
+        response.raise_for_status()
+        return response.json()
+    except Exception as e:
+        raise Exception(f"지표 스냅샷 조회 호출 중 오류 발생: {e}") from e
+
+
+def create_indicator_archive(indicator, type, series):
+    try:
+        response = get_session().post(
+            "http://backend:8000/api/indicator-archive",
+            json={"indicator": indicator, "type": type, "series": series},
+        )
+
+        response.raise_for_status()
+    except Exception as e:
+        raise Exception(f"{indicator} 지표 이력 보관 호출 중 오류 발생: {e}") from e
+
+
+def get_vector_store_similar_ai():
+    try:
+        response = get_session().post(
             f"http://vector_rag:8000/vector-store/get-similar",
-            json={"question": prompt},
+            json={"question": VECTOR_STORE_PROMPT},
         )
 
         response.raise_for_status()
@@ -150,7 +222,7 @@ def get_candle_api_call(url, count):
         params = {"market": "KRW-BTC", "count": count, "to": formatted_date}
         headers = {"accept": "application/json"}
 
-        response = requests.get(url, params=params, headers=headers)
+        response = get_session().get(url, params=params, headers=headers)
 
         response.raise_for_status()
 
@@ -163,19 +235,31 @@ def get_trade_price_api_call():
     try:
         params = {"markets": "KRW-BTC"}
 
-        response = requests.get("https://api.upbit.com/v1/ticker", params=params)
+        response = get_session().get("https://api.upbit.com/v1/ticker", params=params)
         response.raise_for_status()
         return response.json()
     except Exception as e:
         raise Exception(f"업비트 현재가 호출 중 오류 발생: {e}") from e
 
 
-def get_trade_ticks_api_call(days_ago=0):
+def get_trade_ticks_api_call(days_ago=0, cursor=None, count=500):
+    """
+    업비트 체결 내역 조회 (최신순)
+
+    Args:
+        days_ago (int): 며칠 전 체결을 조회할지 (0이면 최근 체결)
+        cursor (int): 이 sequential_id 이전의 체결부터 조회 (페이지네이션)
+        count (int): 조회 개수 (최대 500)
+    """
     try:
         headers = {"accept": "application/json"}
+        params = {"market": "KRW-BTC", "count": count, "days_ago": days_ago}
+        if cursor is not None:
+            params["cursor"] = cursor
 
-        response = requests.get(
-            f"https://api.upbit.com/v1/trades/ticks?market=KRW-BTC&count=500&days_ago={days_ago}",
+        response = get_session().get(
+            "https://api.upbit.com/v1/trades/ticks",
+            params=params,
             headers=headers,
         )
         response.raise_for_status()
@@ -185,15 +269,20 @@ def get_trade_ticks_api_call(days_ago=0):
 
 
 def post_realtime_log(message):
+    """
+    실시간 로그를 백그라운드 발송기의 대기열에 추가
+
+    실제 전송(/api/logs/batch 배치 전송, 실패 시 재시도)은 발송기 스레드가 담당하므로
+    백엔드 응답을 기다리지 않으며, 로그 전송 문제로 모니터링 루프가 멈추지 않도록
+    예외를 던지지 않는다.
+    """
     try:
-        response_realtime_log = requests.post(
-            "http://backend:8000/api/logs",
-            json={
+        get_log_shipper().ship(
+            {
                 "message": message,
                 "module": "trade",
                 "timestamp": datetime.now(timezone.utc).isoformat(),
-            },
+            }
         )
-        response_realtime_log.raise_for_status()
     except Exception as e:
-        raise Exception(f"실시간 로그 전송 오류 발생: {e}") from e
+        logger.error(f"실시간 로그 대기열 추가 오류 발생: {e}")
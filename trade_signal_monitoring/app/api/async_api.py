@@ -0,0 +1,361 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+
+import httpx
+
+from api.api import VECTOR_STORE_PROMPT
+from log_generator import set_logger
+from utils import dumps_json
+
+logger = set_logger()
+
+# httpx는 요청마다 INFO 로그를 남기므로 경고 이상만 출력
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+# 동시에 진행할 최대 요청 수 (백엔드 커넥션 풀 크기와 맞춤)
+DEFAULT_MAX_CONCURRENCY = 6
+
+ASYNC_TIMEOUT = httpx.Timeout(10.0, connect=3.05)
+ASYNC_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=10)
+
+TIMEFRAMES = ["hour1", "hour4", "day", "week"]
+INDICATORS = ["moving_average", "rsi", "macd"]
+
+
+class JSONAsyncClient(httpx.AsyncClient):
+    """json= 본문을 표준 json 모듈 대신 orjson(dumps_json)으로 직렬화하는 클라이언트"""
+
+    def build_request(
+        self, method, url, *, json=None, content=None, headers=None, **kwargs
+    ):
+        if json is not None:
+            content = dumps_json(json)
+            headers = httpx.Headers(headers)
+            headers["Content-Type"] = "application/json"
+        return super().build_request(
+            method, url, content=content, headers=headers, **kwargs
+        )
+
+
+def create_async_client():
+    """keep-alive 커넥션 풀이 적용된 httpx.AsyncClient 생성"""
+    return JSONAsyncClient(timeout=ASYNC_TIMEOUT, limits=ASYNC_LIMITS)
+
+
+async def get_moving_average(client, type):
+    try:
+        response = await client.get(f"http://backend:8000/api/moving-averages/{type}")
+
+        response.raise_for_status()
+        return response.json()
+    except Exception as e:
+        raise Exception(f"이동평균선 조회 호출 중 오류 발생: {e}") from e
+
+
+async def get_rsi(client, type):
+    try:
+        response = await client.get(f"http://backend:8000/api/rsi/{type}")
+
+        response.raise_for_status()
+        return response.json()
+    except Exception as e:
+        raise Exception(f"RSI 조회 호출 중 오류 발생: {e}") from e
+
+
+async def put_rsi(client, type, body):
+    try:
+        response = await client.put(
+            f"http://backend:8000/api/rsi/{type}",
+            json=body,
+        )
+
+        response.raise_for_status()
+    except Exception as e:
+        logger.error(body)
+        raise Exception(f"RSI 수정 호출 중 오류 발생: {e}") from e
+
+
+async def create_moving_average(client, body):
+    try:
+        response = await client.post(
+            "http://backend:8000/api/moving-averages",
+            json=body,
+        )
+
+        response.raise_for_status()
+    except Exception as e:
+        logger.error(body)
+        raise Exception(f"이동평균선 생성 호출 중 오류 발생: {e}") from e
+
+
+async def put_moving_average(client, type, body):
+    try:
+        response = await client.put(
+            f"http://backend:8000/api/moving-averages/{type}",
+            json=body,
+        )
+
+        response.raise_for_status()
+    except Exception as e:
+        logger.error(body)
+        raise Exception(f"이동평균선 수정 호출 중 오류 발생: {e}") from e
+
+
+async def patch_moving_average(client, type, body):
+    try:
+        response = await client.patch(
+            f"http://backend:8000/api/moving-averages/{type}",
+            json=body,
+        )
+
+        response.raise_for_status()
+    except Exception as e:
+        logger.error(body)
+        raise Exception(f"이동평균선 델타 병합 호출 중 오류 발생: {e}") from e
+
+
+async def create_rsi(client, body):
+    try:
+        response = await client.post(
+            "http://backend:8000/api/rsi",
+            json=body,
+        )
+
+        response.raise_for_status()
+    except Exception as e:
+        logger.error(f"RSI 생성 실패: {e}")
+        logger.error(body)
+        raise Exception(f"RSI 생성 호출 중 오류 발생: {e}") from e
+
+
+async def patch_rsi(client, type, body):
+    try:
+        response = await client.patch(
+            f"http://backend:8000/api/rsi/{type}",
+            json=body,
+        )
+
+        response.raise_for_status()
+    except Exception as e:
+        logger.error(body)
+        raise Exception(f"RSI 델타 병합 호출 중 오류 발생: {e}") from e
+
+
+async def get_macd(client, type):
+    try:
+        response = await client.get(f"http://backend:8000/api/macd/{type}")
+
+        response.raise_for_status()
+        return response.json()
+    except Exception as e:
+        raise Exception(f"macd 조회 호출 중 오류 발생: {e}") from e
+
+
+async def create_macd(client, body):
+    try:
+        response = await client.post(
+            "http://backend:8000/api/macd",
+            json=body,
+        )
+
+        response.raise_for_status()
+    except Exception as e:
+        logger.error(body)
+        raise Exception(f"MACD 생성 호출 중 오류 발생: {e}") from e
+
+
+async def put_macd(client, type, body):
+    try:
+        response = await client.put(
+            f"http://backend:8000/api/macd/{type}",
+            json=body,
+        )
+
+        response.raise_for_status()
+    except Exception as e:
+        logger.error(body)
+        raise Exception(f"macd 수정 호출 중 오류 발생: {e}") from e
+
+
+async def patch_macd(client, type, body):
+    try:
+        response = await client.patch(
+            f"http://backend:8000/api/macd/{type}",
+            json=body,
+        )
+
+        response.raise_for_status()
+    except Exception as e:
+        logger.error(body)
+        raise Exception(f"macd 델타 병합 호출 중 오류 발생: {e}") from e
+
+
+async def create_indicator_archive(client, indicator, type, series):
+    try:
+        response = await client.post(
+            "http://backend:8000/api/indicator-archive",
+            json={"indicator": indicator, "type": type, "series": series},
+        )
+
+        response.raise_for_status()
+    except Exception as e:
+        raise Exception(f"{indicator} 지표 이력 보관 호출 중 오류 발생: {e}") from e
+
+
+async def get_vector_store_similar_ai(client):
+    try:
+        response = await client.post(
+            "http://vector_rag:8000/vector-store/get-similar",
+            json={"question": VECTOR_STORE_PROMPT},
+            timeout=httpx.Timeout(120.0, connect=3.05),
+        )
+
+        response.raise_for_status()
+
+        return response.json()
+    except Exception as e:
+        raise Exception(f"AI New Rag 호출 중 오류 발생: {e}") from e
+
+
+async def get_candle_api_call(client, url, count):
+    try:
+        now = datetime.now()
+        formatted_date = now.strftime("%Y-%m-%d %H:%M:%S")
+
+        params = {"market": "KRW-BTC", "count": count, "to": formatted_date}
+        headers = {"accept": "application/json"}
+
+        response = await client.get(url, params=params, headers=headers)
+
+        response.raise_for_status()
+
+        return response.json()
+    except Exception as e:
+        raise Exception(f"업비트 캔들 조회({url}) 호출 중 오류 발생: {e}") from e
+
+
+async def get_trade_price_api_call(client):
+    try:
+        params = {"markets": "KRW-BTC"}
+
+        response = await client.get("https://api.upbit.com/v1/ticker", params=params)
+        response.raise_for_status()
+        return response.json()
+    except Exception as e:
+        raise Exception(f"업비트 현재가 호출 중 오류 발생: {e}") from e
+
+
+async def get_trade_ticks_api_call(client, days_ago=0, cursor=None, count=500):
+    try:
+        headers = {"accept": "application/json"}
+        params = {"market": "KRW-BTC", "count": count, "days_ago": days_ago}
+        if cursor is not None:
+            params["cursor"] = cursor
+
+        response = await client.get(
+            "https://api.upbit.com/v1/trades/ticks",
+            params=params,
+            headers=headers,
+        )
+        response.raise_for_status()
+        return response.json()
+    except Exception as e:
+        raise Exception(f"업비트 체결가 호출 중 오류 발생: {e}") from e
+
+
+async def post_realtime_log(client, message):
+    try:
+        response_realtime_log = await client.post(
+            "http://backend:8000/api/logs",
+            json={
+                "message": message,
+                "module": "trade",
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            },
+        )
+        response_realtime_log.raise_for_status()
+    except Exception as e:
+        raise Exception(f"실시간 로그 전송 오류 발생: {e}") from e
+
+
+INDICATOR_FETCHERS = {
+    "moving_average": get_moving_average,
+    "rsi": get_rsi,
+    "macd": get_macd,
+}
+
+
+async def gather_bounded(coroutines, max_concurrency=DEFAULT_MAX_CONCURRENCY):
+    """
+    세마포어로 동시 실행 수를 제한하면서 코루틴들을 한 번에 실행
+
+    Args:
+        coroutines: 실행할 코루틴 리스트
+        max_concurrency: 동시에 실행할 최대 코루틴 수
+
+    Returns:
+        list: 입력 순서와 동일한 순서의 결과 리스트 (하나라도 실패하면 예외 발생)
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(coroutine):
+        async with semaphore:
+            return await coroutine
+
+    return await asyncio.gather(*(run(coroutine) for coroutine in coroutines))
+
+
+async def fetch_indicators(
+    client,
+    types=TIMEFRAMES,
+    indicators=INDICATORS,
+    max_concurrency=DEFAULT_MAX_CONCURRENCY,
+):
+    """
+    여러 타임프레임 x 지표 조회를 동시에 실행
+
+    Args:
+        client: httpx.AsyncClient
+        types: 조회할 타임프레임 리스트 (hour1, hour4, day, week)
+        indicators: 조회할 지표 리스트 (moving_average, rsi, macd)
+        max_concurrency: 동시에 진행할 최대 요청 수
+
+    Returns:
+        dict: {타임프레임: {지표: 응답 데이터}}
+    """
+    keys = [(type, indicator) for type in types for indicator in indicators]
+    results = await gather_bounded(
+        [INDICATOR_FETCHERS[indicator](client, type) for type, indicator in keys],
+        max_concurrency=max_concurrency,
+    )
+
+    fetched = {type: {} for type in types}
+    for (type, indicator), data in zip(keys, results):
+        fetched[type][indicator] = data
+
+    return fetched
+
+
+def run_fetch_indicators(
+    types=TIMEFRAMES,
+    indicators=INDICATORS,
+    max_concurrency=DEFAULT_MAX_CONCURRENCY,
+):
+    """
+    동기 코드에서 fetch_indicators를 호출하기 위한 래퍼
+
+    AsyncClient는 이벤트 루프에 묶이므로 호출마다 클라이언트를 만들고 닫는다.
+    한 번의 호출 안에서는 모든 요청이 같은 커넥션 풀을 공유한다.
+    """
+
+    async def run():
+        async with create_async_client() as client:
+            return await fetch_indicators(
+                client,
+                types=types,
+                indicators=indicators,
+                max_concurrency=max_concurrency,
+            )
+
+    return asyncio.run(run())
@@ -0,0 +1,99 @@
+import os
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils import dumps_json
+
+# (connect timeout, read timeout) 초 단위
+DEFAULT_TIMEOUT = (3.05, 10)
+
+# 호스트별 커넥션 풀 설정 (pool_maxsize: 호스트당 유지할 keep-alive 커넥션 수)
+HOST_POOL_SETTINGS = {
+    "http://backend:8000": {"pool_connections": 1, "pool_maxsize": 10},
+    # RAG 응답은 LLM 추론 시간이 포함되므로 read timeout을 길게 설정
+    "http://vector_rag:8000": {
+        "pool_connections": 1,
+        "pool_maxsize": 4,
+        "timeout": (3.05, 120),
+    },
+    "https://api.upbit.com": {"pool_connections": 1, "pool_maxsize": 10},
+}
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """timeout 인자가 없는 요청에 기본 타임아웃을 적용하는 어댑터"""
+
+    def __init__(self, *args, timeout=DEFAULT_TIMEOUT, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+class JSONSession(requests.Session):
+    """json= 본문을 표준 json 모듈 대신 orjson(dumps_json)으로 직렬화하는 세션"""
+
+    def request(self, method, url, **kwargs):
+        body = kwargs.pop("json", None)
+        if body is not None:
+            kwargs["data"] = dumps_json(body)
+            kwargs["headers"] = {
+                **(kwargs.get("headers") or {}),
+                "Content-Type": "application/json",
+            }
+        return super().request(method, url, **kwargs)
+
+
+# 스레드별 세션
+# requests.Session은 쿠키 저장소와 어댑터 상태를 공유하므로 스레드 안전하지 않음
+_local = threading.local()
+
+
+def _create_session():
+    session = JSONSession()
+    session.headers.update({"Connection": "keep-alive"})
+
+    for prefix, pool_settings in HOST_POOL_SETTINGS.items():
+        session.mount(prefix, TimeoutHTTPAdapter(**pool_settings))
+
+    # 설정되지 않은 호스트도 기본 타임아웃은 적용
+    session.mount("http://", TimeoutHTTPAdapter())
+    session.mount("https://", TimeoutHTTPAdapter())
+
+    return session
+
+
+def get_session():
+    """
+    현재 스레드에서 재사용하는 HTTP 세션 반환
+
+    모니터링 루프, asyncio.to_thread 작업 스레드, 로그 발송/체결 집계 백그라운드 스레드가
+    세션을 함께 쓰지 않도록 스레드마다 따로 생성한다.
+    multiprocessing으로 fork된 자식 프로세스는 부모의 소켓을 공유하면 안 되므로
+    pid가 바뀌면 새 세션을 생성한다.
+
+    Returns:
+        requests.Session: 커넥션 풀과 keep-alive가 적용된 세션
+    """
+    pid = os.getpid()
+    session = getattr(_local, "session", None)
+    if session is None or _local.pid != pid:
+        session = _create_session()
+        _local.session = session
+        _local.pid = pid
+
+    return session
+
+
+def close_session():
+    """현재 스레드의 세션과 커넥션 풀 정리"""
+    session = getattr(_local, "session", None)
+    if session is not None and _local.pid == os.getpid():
+        session.close()
+    _local.session = None
+    _local.pid = None
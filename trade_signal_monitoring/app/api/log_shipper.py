@@ -0,0 +1,190 @@
+import atexit
+import os
+import threading
+import time
+from collections import deque
+
+import requests
+
+from api.http_client import get_session
+from log_generator import set_logger
+
+logger = set_logger()
+
+LOG_BATCH_URL = "http://backend:8000/api/logs/batch"
+
+# 전송 대기 로그 최대 개수, 백엔드 장애로 쌓이면 가장 오래된 로그부터 버림
+LOG_SHIPPER_CAPACITY = 1000
+# 한 번에 보내는 최대 로그 수
+LOG_SHIPPER_BATCH_SIZE = 50
+# 첫 로그 이후 같은 틱의 로그를 모아 보내기 위해 기다리는 시간 (초)
+LOG_SHIPPER_LINGER_SEC = 0.2
+# 전송 실패 시 재시도 대기 시간 (초), 실패할 때마다 두 배씩 최대값까지 증가
+RETRY_BACKOFF_INITIAL_SEC = 0.5
+RETRY_BACKOFF_MAX_SEC = 30
+# 프로세스 종료 시 남은 로그 전송을 기다리는 최대 시간 (초)
+CLOSE_TIMEOUT_SEC = 5
+
+
+class RealtimeLogShipper:
+    """
+    실시간 로그를 백그라운드 스레드에서 배치로 전송하는 발송기
+
+    ship은 대기열에 넣기만 하므로 모니터링 루프는 백엔드 응답/장애를 기다리지 않는다.
+    """
+
+    def __init__(
+        self,
+        url=LOG_BATCH_URL,
+        capacity=LOG_SHIPPER_CAPACITY,
+        batch_size=LOG_SHIPPER_BATCH_SIZE,
+        linger=LOG_SHIPPER_LINGER_SEC,
+        backoff_initial=RETRY_BACKOFF_INITIAL_SEC,
+        backoff_max=RETRY_BACKOFF_MAX_SEC,
+    ):
+        self.url = url
+        self.batch_size = batch_size
+        self.linger = linger
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+
+        self._buffer = deque(maxlen=capacity)
+        self._condition = threading.Condition()
+        self._closing = threading.Event()
+        self._thread = None
+
+        self.sent = 0
+        self.dropped = 0
+        self.failed_attempts = 0
+
+    def ship(self, log):
+        """로그를 전송 대기열에 추가 (가득 차면 가장 오래된 로그를 버림)"""
+        with self._condition:
+            if len(self._buffer) == self._buffer.maxlen:
+                self.dropped += 1
+            self._buffer.append(log)
+            self._condition.notify()
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="realtime-log-shipper", daemon=True
+                )
+                self._thread.start()
+
+    def close(self, timeout=CLOSE_TIMEOUT_SEC):
+        """남은 로그를 보내고 전송 스레드 종료 (재시도 대기 중이면 남은 로그는 버림)"""
+        with self._condition:
+            self._closing.set()
+            self._condition.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _next_batch(self):
+        with self._condition:
+            while not self._buffer and not self._closing.is_set():
+                self._condition.wait()
+
+            deadline = time.monotonic() + self.linger
+            while len(self._buffer) < self.batch_size and not self._closing.is_set():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+
+            count = min(self.batch_size, len(self._buffer))
+            return [self._buffer.popleft() for _ in range(count)]
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch:
+                self._send_with_retry(batch)
+            elif self._closing.is_set():
+                return
+
+    def _send_with_retry(self, batch):
+        """
+        배치 전송, 연결 오류와 5xx 응답만 재시도
+
+        4xx 응답이나 직렬화 오류는 다시 보내도 같은 결과이므로 배치를 버리고 다음 로그로 넘어간다.
+        """
+        backoff = self.backoff_initial
+        dropped_before = self.dropped
+        while True:
+            try:
+                response = get_session().post(self.url, json=batch)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+            except Exception as e:
+                self.dropped += len(batch)
+                logger.error(f"실시간 로그 {len(batch)}개 전송 불가로 버림: {e}")
+                return
+            else:
+                if response.status_code < 400:
+                    self.sent += len(batch)
+                    return
+                if response.status_code < 500:
+                    self.dropped += len(batch)
+                    logger.error(
+                        f"실시간 로그 {len(batch)}개 거부되어 버림 "
+                        f"({response.status_code}): {response.text[:200]}"
+                    )
+                    return
+                error = f"{response.status_code} {response.reason}"
+
+            self.failed_attempts += 1
+            logger.warning(f"실시간 로그 전송 실패, {backoff}초 후 재시도: {error}")
+
+            # 종료 중이면 재시도하지 않음
+            if self._closing.wait(backoff):
+                self.dropped += len(batch)
+                return
+
+            # 재시도 대기 중 대기열이 넘쳤다면 이 배치가 가장 오래된 로그이므로 버림
+            with self._condition:
+                if self.dropped > dropped_before:
+                    self.dropped += len(batch)
+                    return
+
+            backoff = min(backoff * 2, self.backoff_max)
+
+    def stats(self):
+        with self._condition:
+            queued = len(self._buffer)
+        return {
+            "queued": queued,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "failed_attempts": self.failed_attempts,
+        }
+
+
+_shipper = None
+_shipper_pid = None
+_shipper_lock = threading.Lock()
+
+
+def get_log_shipper():
+    """
+    프로세스 단위로 공유되는 실시간 로그 발송기 반환
+
+    fork된 자식 프로세스에는 부모의 전송 스레드가 없으므로 pid가 바뀌면 새로 생성한다.
+
+    Returns:
+        RealtimeLogShipper: 백그라운드 스레드로 로그를 배치 전송하는 발송기
+    """
+    global _shipper, _shipper_pid
+
+    pid = os.getpid()
+    if _shipper is not None and _shipper_pid == pid:
+        return _shipper
+
+    with _shipper_lock:
+        if _shipper is None or _shipper_pid != pid:
+            _shipper = RealtimeLogShipper()
+            _shipper_pid = pid
+            # 정상 종료 시 대기 중인 로그를 최대한 전송
+            atexit.register(_shipper.close)
+
+    return _shipper
@@ -0,0 +1,195 @@
+import math
+from datetime import datetime, timezone
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from log_generator import set_logger
+from .moving_average import MA_PERIODS
+from .rsi import rsi_state_at
+
+logger = set_logger()
+
+RSI_PERIOD = 14
+
+
+def _ewm_mean(values, alpha, adjust):
+    """
+    pandas ewm(alpha=alpha, adjust=adjust).mean()과 같은 순서로 연산하는 지수 이동평균
+
+    앞쪽 NaN은 첫 관측값이 나올 때까지 건너뛴다. (pandas 결과와 비트 단위까지 같음)
+
+    Args:
+        values (list): 과거순 float 리스트
+        alpha (float): 평활 계수
+        adjust (bool): True면 가중 평균, False면 재귀식 y = (1 - α) * y + α * x
+
+    Returns:
+        list: values와 길이가 같은 평균 리스트
+    """
+    new_weight = 1.0 if adjust else alpha
+    old_weight_factor = 1 - alpha
+    old_weight = 1.0
+    weighted = math.nan
+    result = []
+    for value in values:
+        if math.isnan(weighted):
+            weighted = value
+        else:
+            old_weight *= old_weight_factor
+            if weighted != value:
+                weighted = old_weight * weighted + new_weight * value
+                weighted /= old_weight + new_weight
+            old_weight = old_weight + new_weight if adjust else 1.0
+        result.append(weighted)
+    return result
+
+
+def _moving_averages(type, timestamps, prices, closes):
+    type_periods = MA_PERIODS.get(type, {})
+    all_periods = set()
+    for value in type_periods.values():
+        if isinstance(value, list):
+            all_periods.update(value)
+        else:
+            all_periods.add(value)
+
+    result = {
+        "type": type,
+        "ma_values": {},
+        "last_updated": datetime.now(timezone.utc).isoformat(),
+        "macd_short_period": type_periods.get("macd_short"),
+        "macd_long_period": type_periods.get("macd_long"),
+        "signal_period": type_periods.get("signal"),
+    }
+
+    # 기간별 이동평균 (period - 1번째 캔들부터 값이 있음)
+    ma_arrays = {}
+    for period in sorted(all_periods):
+        if period > len(closes):
+            ma_arrays[period] = []
+            result["ma_values"][f"ma_{period}"] = []
+            continue
+
+        values = sliding_window_view(closes, period).mean(axis=1).round(2).tolist()
+        ma_arrays[period] = values
+        offset = period - 1
+        result["ma_values"][f"ma_{period}"] = [
+            {"timestamp": timestamp, "value": value, "price": price}
+            for timestamp, value, price in zip(
+                timestamps[offset:], values, prices[offset:]
+            )
+        ]
+        result[f"ma_{period}"] = values[-1]
+
+    # 기존 호환성을 위해 장기 이동평균도 ma 키에 저장
+    long_term_key = f"ma_{type_periods.get('long_term')}"
+    if long_term_key in result:
+        result["ma"] = result[long_term_key]
+
+    return result, ma_arrays
+
+
+def _macd(type, timestamps, ma_arrays):
+    short_period = MA_PERIODS[type]["macd_short"]
+    long_period = MA_PERIODS[type]["macd_long"]
+    signal_period = MA_PERIODS[type]["signal"]
+
+    # 두 이동평균이 모두 있는 구간 (장기 이동평균 시작 시점부터)
+    short_values = ma_arrays[short_period][long_period - short_period :]
+    long_values = ma_arrays[long_period]
+    macd_line = (np.array(short_values) - np.array(long_values)).tolist()
+    signal_line = _ewm_mean(macd_line, 2 / (signal_period + 1), adjust=False)
+    histogram = (np.array(macd_line) - np.array(signal_line)).tolist()
+
+    return {
+        "type": type,
+        "dates": [
+            datetime.fromisoformat(timestamp).isoformat()
+            for timestamp in timestamps[long_period - 1 :]
+        ],
+        "macd_line": macd_line,
+        "signal_line": signal_line,
+        "histogram": histogram,
+        "last_updated": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def _rsi(type, timestamps, prices, closes):
+    period = RSI_PERIOD
+    if len(closes) <= period:
+        return None  # 충분한 데이터가 없음
+
+    delta = np.diff(closes)
+    avg_gain = [math.nan] + _ewm_mean(
+        np.maximum(delta, 0).tolist(), 1 / period, adjust=True
+    )
+    avg_loss = [math.nan] + _ewm_mean(
+        np.maximum(-delta, 0).tolist(), 1 / period, adjust=True
+    )
+
+    # 가격 변화가 period개 이상인 캔들부터 RSI 계산 (평균 상승/하락폭이 모두 0이면 제외)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = np.array(avg_gain[period:]) / np.array(avg_loss[period:])
+        rsi_values = 100 - (100 / (1 + rs))
+    valid = ~np.isnan(rsi_values)
+    if not valid.any():
+        return None
+
+    valid_rsi = rsi_values[valid].tolist()
+    valid_timestamps = [
+        timestamp
+        for timestamp, is_valid in zip(timestamps[period:], valid.tolist())
+        if is_valid
+    ]
+
+    # 모니터링에서 다음 캔들부터 O(1)로 갱신하기 위한 상태 (마지막 캔들 반영 전 상태 포함)
+    last = len(closes) - 1
+    state = rsi_state_at(avg_gain, avg_loss, prices, timestamps, last, period)
+    state["prev"] = rsi_state_at(
+        avg_gain, avg_loss, prices, timestamps, last - 1, period
+    )
+
+    return {
+        "type": type,
+        "rsi_values": valid_rsi,
+        "timestamps": valid_timestamps,
+        "current_rsi": valid_rsi[-1],
+        "last_updated": valid_timestamps[-1],
+        "state": state,
+    }
+
+
+def calculate_indicators(candles, type):
+    """
+    캔들을 한 번만 배열로 변환해 이동평균/MACD/RSI 초기 데이터를 함께 계산하는 함수
+
+    moving_average, macd, rsi를 차례로 호출한 것과 같은 결과를 JSON으로 바로
+    보낼 수 있는 Python 기본 타입으로 반환한다.
+
+    Args:
+        candles (list): API에서 받아온 캔들 데이터 리스트 (최신순)
+        type (str): 캔들 타입 (day, week, hour4, hour1)
+
+    Returns:
+        dict: {"moving_average": 이동평균 결과, "macd": MACD 결과, "rsi": RSI 결과(데이터 부족 시 None)}
+    """
+    # 시간순으로 정렬 (과거 → 현재)
+    candles = sorted(candles, key=lambda candle: candle["candle_date_time_utc"])
+    timestamps = [candle["candle_date_time_utc"] for candle in candles]
+    prices = [candle["trade_price"] for candle in candles]
+    closes = np.array(prices, dtype=float)
+
+    moving_average_result, ma_arrays = _moving_averages(
+        type, timestamps, prices, closes
+    )
+    macd_result = _macd(type, timestamps, ma_arrays)
+    rsi_result = _rsi(type, timestamps, prices, closes)
+
+    logger.info(f"지표 초기 계산 완료. type: {type}, 캔들 {len(candles)}개")
+
+    return {
+        "moving_average": moving_average_result,
+        "macd": macd_result,
+        "rsi": rsi_result,
+    }
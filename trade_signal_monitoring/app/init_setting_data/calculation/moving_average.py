@@ -1,10 +1,41 @@
 import pandas as pd
 from datetime import datetime, timezone
 from log_generator import set_logger
-from utils import convert_numpy_types
 
 logger = set_logger()
 
+# 타임프레임별 기본 이동평균 기간 설정
+MA_PERIODS = {
+    "day": {
+        "long_term": 200,
+        "macd_long": 26,
+        "macd_short": 12,
+        "signal": 9,
+        "add_periods": [7, 25, 50, 100],
+    },
+    "week": {
+        "long_term": 52,
+        "macd_long": 26,
+        "macd_short": 12,
+        "signal": 9,
+        "add_periods": [7, 25, 50],
+    },
+    "hour4": {
+        "long_term": 90,  # 약 3개월로 조정
+        "macd_long": 26,
+        "macd_short": 12,
+        "signal": 9,
+        "add_periods": [7, 25, 50],
+    },
+    "hour1": {
+        "long_term": 84,  # 약 3.5일로 조정
+        "macd_long": 26,
+        "macd_short": 12,
+        "signal": 9,
+        "add_periods": [3, 7, 25],
+    },
+}
+
 
 def moving_average(candles, type):
     """
@@ -17,44 +48,12 @@ def moving_average(candles, type):
     Returns:
         dict: 여러 기간의 이동평균 결과와 메타데이터를 포함한 딕셔너리
     """
-    # 타임프레임별 기본 이동평균 기간 설정
-    periods = {
-        "day": {
-            "long_term": 200,
-            "macd_long": 26,
-            "macd_short": 12,
-            "signal": 9,
-            "add_periods": [7, 25, 50, 100],
-        },
-        "week": {
-            "long_term": 52,
-            "macd_long": 26,
-            "macd_short": 12,
-            "signal": 9,
-            "add_periods": [7, 25, 50],
-        },
-        "hour4": {
-            "long_term": 90,  # 약 3개월로 조정
-            "macd_long": 26,
-            "macd_short": 12,
-            "signal": 9,
-            "add_periods": [7, 25, 50],
-        },
-        "hour1": {
-            "long_term": 84,  # 약 3.5일로 조정
-            "macd_long": 26,
-            "macd_short": 12,
-            "signal": 9,
-            "add_periods": [3, 7, 25],
-        },
-    }
-
     # 모든 계산할 기간 추출
     all_periods = set()
     """
     {100, 7, 200, 9, 12, 50, 25, 26}
     """
-    type_periods = periods.get(type, {})
+    type_periods = MA_PERIODS.get(type, {})
     """
     {'long_term': 200, 'macd_long': 26, 'macd_short': 12, 'signal': 9, 'add_periods': [7, 25, 50, 100]}
     """
@@ -82,16 +81,16 @@ def moving_average(candles, type):
         # pandas의 rolling 함수로 이동평균 계산
         df[f"ma_{period}"] = df["trade_price"].rolling(window=period).mean().round(2)
 
-        # 결과를 딕셔너리 리스트로 변환
-        ma_values = []
-        for _, row in df[df[f"ma_{period}"].notna()].iterrows():
-            ma_values.append(
-                {
-                    "timestamp": row["candle_date_time_utc"],
-                    "value": row[f"ma_{period}"],
-                    "price": row["trade_price"],
-                }
+        # 결과를 딕셔너리 리스트로 변환 (tolist로 Python 기본 타입 사용)
+        valid = df[df[f"ma_{period}"].notna()]
+        ma_values = [
+            {"timestamp": timestamp, "value": value, "price": price}
+            for timestamp, value, price in zip(
+                valid["candle_date_time_utc"].tolist(),
+                valid[f"ma_{period}"].tolist(),
+                valid["trade_price"].tolist(),
             )
+        ]
 
         # 결과 저장
         result["ma_values"][f"ma_{period}"] = ma_values
@@ -105,15 +104,13 @@ def moving_average(candles, type):
     for period in sorted(all_periods):
         ma_key = f"ma_{period}"
         if not df.empty and pd.notna(df.iloc[-1].get(ma_key, None)):
-            result[ma_key] = df.iloc[-1][ma_key]
+            result[ma_key] = float(df.iloc[-1][ma_key])
 
     # 기존 호환성을 위해 장기 이동평균도 ma 키에 저장
     long_term_key = f"ma_{type_periods.get('long_term')}"
     if long_term_key in result:
         result["ma"] = result[long_term_key]
 
-    result = convert_numpy_types(result)
-
     logger.info(f"이동평균선 계산 완료. type: {type}")
 
     return result
@@ -4,6 +4,27 @@ from log_generator import set_logger
 logger = set_logger()
 
 
+def rsi_state_at(avg_gain, avg_loss, closes, timestamps, index, period=14):
+    """
+    index번째 캔들까지 반영한 Wilder RSI 증분 계산 상태 (인자는 과거순 리스트)
+
+    ewm(com=period-1)의 기본값 adjust=True는 가중 평균이므로 평균과 함께 가중치 합
+    (1 - (1 - α)^n) / α (α = 1 / period, n = 반영된 가격 변화 수)을 저장해야
+    이후 캔들을 O(1)로 추가해도 pandas 계산과 같은 값이 나온다.
+    """
+    alpha = 1 / period
+    count = index  # diff의 첫 값은 NaN이므로 index번째 캔들까지 가격 변화는 index개
+    return {
+        "period": period,
+        "avg_gain": float(avg_gain[index]),
+        "avg_loss": float(avg_loss[index]),
+        "weight": (1 - (1 - alpha) ** count) / alpha,
+        "count": count,
+        "last_close": float(closes[index]),
+        "timestamp": timestamps[index],
+    }
+
+
 def rsi(candles, type):
     """
     전체 캔들 데이터에 대해 RSI를 계산 (NaN 값 제거)
@@ -22,8 +43,12 @@ def rsi(candles, type):
     gains[gains < 0] = 0
     declines[declines > 0] = 0
 
-    gain = gains.ewm(com=(period - 1), min_periods=period).mean()
-    loss = declines.abs().ewm(com=(period - 1), min_periods=period).mean()
+    # min_periods 이전 구간도 계산 상태에는 필요하므로 평균은 그대로 두고 RSI만 가림
+    avg_gain = gains.ewm(com=(period - 1)).mean()
+    avg_loss = declines.abs().ewm(com=(period - 1)).mean()
+    observed = delta.notna().cumsum()
+    gain = avg_gain.where(observed >= period)
+    loss = avg_loss.where(observed >= period)
 
     RS = gain / loss
     rsi_series = pd.Series(100 - (100 / (1 + RS)), name="RSI")
@@ -38,6 +63,17 @@ def rsi(candles, type):
     if len(valid_rsi) == 0:
         return None  # 충분한 데이터가 없음
 
+    # 모니터링에서 다음 캔들부터 O(1)로 갱신하기 위한 상태 (마지막 캔들 반영 전 상태 포함)
+    avg_gain = avg_gain.tolist()
+    avg_loss = avg_loss.tolist()
+    closes = candles_df[price_col].tolist()
+    timestamps = candles_df["candle_date_time_utc"].tolist()
+    last = len(candles_df) - 1
+    state = rsi_state_at(avg_gain, avg_loss, closes, timestamps, last, period)
+    state["prev"] = rsi_state_at(
+        avg_gain, avg_loss, closes, timestamps, last - 1, period
+    )
+
     logger.info(f"RSI 계산 완료. type: {type}")
     # 반환 형식 (NaN 없는 값만 포함)
     return {
@@ -46,4 +82,5 @@ def rsi(candles, type):
         "timestamps": valid_timestamps,  # 해당하는 타임스탬프 (길이 동일)
         "current_rsi": float(valid_rsi[-1]),  # 현재 RSI
         "last_updated": valid_timestamps[-1],  # 마지막 업데이트 시간
+        "state": state,  # Wilder 평균 상승/하락폭, 마지막 종가
     }
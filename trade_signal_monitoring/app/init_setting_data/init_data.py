@@ -1,8 +1,6 @@
 import multiprocessing
 
-from .calculation.rsi import rsi
-from .calculation.macd import macd
-from .calculation.moving_average import moving_average
+from .calculation.indicator_engine import calculate_indicators
 from log_generator import set_logger
 from api.api import (
     get_candle_api_call,
@@ -25,13 +23,10 @@ def get_day_candle():
     candles = get_candle_api_call(url=day_url, count=200)
     if candles is None:
         return
-    moving_average_result = moving_average(candles=candles, type=type)
-    create_moving_average(moving_average_result)
-    macd_result = macd(type=type, ma_values_data=moving_average_result["ma_values"])
-    create_macd(macd_result)
-
-    rsi_result = rsi(candles, type)
-    create_rsi(rsi_result)
+    indicators = calculate_indicators(candles=candles, type=type)
+    create_moving_average(indicators["moving_average"])
+    create_macd(indicators["macd"])
+    create_rsi(indicators["rsi"])
 
 
 def get_week_candle():
@@ -40,13 +35,10 @@ def get_week_candle():
     candles = get_candle_api_call(url=week_url, count=52)
     if candles is None:
         return
-    moving_average_result = moving_average(candles=candles, type=type)
-    create_moving_average(moving_average_result)
-    macd_result = macd(type=type, ma_values_data=moving_average_result["ma_values"])
-    create_macd(macd_result)
-
-    rsi_result = rsi(candles, type)
-    create_rsi(rsi_result)
+    indicators = calculate_indicators(candles=candles, type=type)
+    create_moving_average(indicators["moving_average"])
+    create_macd(indicators["macd"])
+    create_rsi(indicators["rsi"])
 
 
 def get_hour_4_candle():
@@ -55,13 +47,10 @@ def get_hour_4_candle():
     candles = get_candle_api_call(url=hour_4_url, count=180)  # 30일치
     if candles is None:
         return
-    moving_average_result = moving_average(candles=candles, type=type)
-    create_moving_average(moving_average_result)
-    macd_result = macd(type=type, ma_values_data=moving_average_result["ma_values"])
-    create_macd(macd_result)
-
-    rsi_result = rsi(candles, type)
-    create_rsi(rsi_result)
+    indicators = calculate_indicators(candles=candles, type=type)
+    create_moving_average(indicators["moving_average"])
+    create_macd(indicators["macd"])
+    create_rsi(indicators["rsi"])
 
 
 def get_hour_1_candle():
@@ -70,13 +59,10 @@ def get_hour_1_candle():
     candles = get_candle_api_call(url=hour_1_url, count=168)  # 7일치
     if candles is None:
         return
-    moving_average_result = moving_average(candles=candles, type=type)
-    create_moving_average(moving_average_result)
-    macd_result = macd(type=type, ma_values_data=moving_average_result["ma_values"])
-    create_macd(macd_result)
-
-    rsi_result = rsi(candles, type)
-    create_rsi(rsi_result)
+    indicators = calculate_indicators(candles=candles, type=type)
+    create_moving_average(indicators["moving_average"])
+    create_macd(indicators["macd"])
+    create_rsi(indicators["rsi"])
 
 
 def start_get_candle_process():
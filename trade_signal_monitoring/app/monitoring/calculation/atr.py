@@ -1,4 +1,4 @@
-from api.api import get_candle_api_call
+from ..candle_repository import candle_repository
 from log_generator import set_logger
 
 logger = set_logger()
@@ -18,16 +18,9 @@ def get_atr(timeframe, period=14):
     # 필요한 캔들 수 = 기간 + 추가 여유
     required_candles = period + 30  # 충분한 데이터 확보
 
-    # 캔들 데이터 가져오기
+    # 캔들 데이터 가져오기 (틱 단위 캔들 버퍼 재사용)
     try:
-        timeframes = {
-            "hour1": "https://api.upbit.com/v1/candles/minutes/60",
-            "hour4": "https://api.upbit.com/v1/candles/minutes/240",
-            "day": "https://api.upbit.com/v1/candles/days",
-            "week": "https://api.upbit.com/v1/candles/weeks",
-        }
-
-        candles = get_candle_api_call(timeframes[timeframe], count=required_candles)
+        candles = candle_repository.get_candles(timeframe, required_candles)
 
         if not candles or len(candles) < period + 1:
             logger.warning(f"{timeframe} 타임프레임의 캔들 데이터가 충분하지 않습니다.")
@@ -1,10 +1,24 @@
+import threading
+from collections import deque
 from datetime import datetime, timezone
 import pandas as pd
 from log_generator import set_logger
-from api.api import get_macd
+from ..retention import get_retention
 
 logger = set_logger()
 
+# 단기/장기 이동평균 기간과 시그널 라인 계산 기간
+SHORT_PERIOD = 12
+LONG_PERIOD = 26
+SIGNAL_PERIOD = 9
+
+# 타임프레임별 MACD 상태
+# {type: {"signal": float, "prev_signal": float | None, "dates": deque, "macd_line": deque, ...}}
+# candle_monitoring은 모든 타임프레임을 한 프로세스에서 asyncio.to_thread로 동시에 갱신하므로
+# 상태는 타임프레임별 잠금 아래에서 읽고 바꾼다.
+_macd_states = {}
+_macd_state_locks = {}
+
 
 def macd(type, ma_values_data):
     """
@@ -17,19 +31,11 @@ def macd(type, ma_values_data):
     Returns:
         dict: MACD 계산 결과 (macd_line, signal_line, histogram, dates)
     """
-
-    # short_period (int): 단기 이동평균 기간 (기본값: 12)
-    short_period = 12
-
-    # long_period (int): 장기 이동평균 기간 (기본값: 26)
-    long_period = 26
-
-    # signal_period (int): 시그널 라인 계산 기간 (기본값: 9)
-    signal_period = 9
+    signal_period = SIGNAL_PERIOD
 
     # 필요한 MA 키 지정
-    short_key = f"ma_{short_period}"
-    long_key = f"ma_{long_period}"
+    short_key = f"ma_{SHORT_PERIOD}"
+    long_key = f"ma_{LONG_PERIOD}"
 
     # 필요한 데이터가 있는지 확인
     if short_key not in ma_values_data or long_key not in ma_values_data:
@@ -62,20 +68,20 @@ def macd(type, ma_values_data):
     # 히스토그램 계산
     merged_df["histogram"] = merged_df["macd"] - merged_df["signal"]
 
-    str_dates = merged_df["timestamp"].dt.strftime("%Y-%m-%d %H:%M:%S").tolist()
-    datetime_dates = [datetime.strptime(d, "%Y-%m-%d %H:%M:%S") for d in str_dates]
-
-    iso_dates = [dt.isoformat() for dt in datetime_dates]
+    iso_dates = merged_df["timestamp"].dt.strftime("%Y-%m-%dT%H:%M:%S").tolist()
 
     last_updated = datetime.now(timezone.utc).isoformat()
 
+    # 보관 기간만큼만 반환 (MACD는 아카이브된 이동평균으로 다시 계산할 수 있으므로 따로 보관하지 않음)
+    keep = get_retention("macd", type)
+
     # 결과 반환
     result = {
         "type": type,
-        "dates": iso_dates,
-        "macd_line": merged_df["macd"].tolist(),
-        "signal_line": merged_df["signal"].tolist(),
-        "histogram": merged_df["histogram"].tolist(),
+        "dates": iso_dates[-keep:],
+        "macd_line": merged_df["macd"].tolist()[-keep:],
+        "signal_line": merged_df["signal"].tolist()[-keep:],
+        "histogram": merged_df["histogram"].tolist()[-keep:],
         "last_updated": last_updated,
     }
 
@@ -84,8 +90,147 @@ def macd(type, ma_values_data):
     return result
 
 
-def macd_calc():
-    macd_data = get_macd("hour4")
+def _iso(timestamp):
+    return datetime.fromisoformat(timestamp).isoformat()
+
+
+def _is_next_point(state, short_values, long_values, new_date):
+    """프로세스 내 상태가 저장된 이동평균과 이어지는지 (재시작/초기화 시 어긋남) 확인"""
+    if not short_values or not long_values or not state["dates"]:
+        return False
+    if _iso(short_values[-1]["timestamp"]) != new_date:
+        return False
+    if _iso(long_values[-1]["timestamp"]) != new_date:
+        return False
+
+    last_date = state["dates"][-1]
+    if last_date == new_date:
+        return True
+    return (
+        len(short_values) >= 2
+        and len(long_values) >= 2
+        and _iso(short_values[-2]["timestamp"]) == last_date
+        and _iso(long_values[-2]["timestamp"]) == last_date
+    )
+
+
+def _state_from_result(type, result):
+    keep = get_retention("macd", type)
+    signal_line = result["signal_line"]
+    return {
+        "signal": signal_line[-1],
+        "prev_signal": signal_line[-2] if len(signal_line) >= 2 else None,
+        "dates": deque(result["dates"], maxlen=keep),
+        "macd_line": deque(result["macd_line"], maxlen=keep),
+        "signal_line": deque(signal_line, maxlen=keep),
+        "histogram": deque(result["histogram"], maxlen=keep),
+    }
+
+
+def update_macd(type, ma_values_data, new_timestamp):
+    """
+    새 캔들의 MACD 포인트 하나만 계산하여 이전 결과에 추가하는 함수
+
+    마지막 시그널 EMA(adjust=False)를 프로세스 내 상태로 유지하므로 갱신마다
+    이동평균 전체 시계열로 DataFrame을 다시 만들지 않는다. 상태가 없거나 저장된
+    이동평균과 이어지지 않으면 (재시작, 초기화 등) macd로 전체를 다시 계산한다.
+
+    Args:
+        type (str): 캔들 타입 (day, week, hour4, hour1)
+        ma_values_data (dict): update_moving_average 결과의 'ma_values'
+        new_timestamp (str): 이번에 추가(또는 교체)한 캔들 시각 (candle_date_time_utc)
+
+    Returns:
+        dict: MACD 계산 결과 (macd와 같은 형식, 시계열은 보관 개수만큼의 deque)
+    """
+    short_values = ma_values_data.get(f"ma_{SHORT_PERIOD}")
+    long_values = ma_values_data.get(f"ma_{LONG_PERIOD}")
+    new_date = _iso(new_timestamp)
+
+    with _macd_state_locks.setdefault(type, threading.Lock()):
+        state = _macd_states.get(type)
+        if state is None or not _is_next_point(
+            state, short_values, long_values, new_date
+        ):
+            result = macd(type, ma_values_data)
+            if result["dates"]:
+                _macd_states[type] = _state_from_result(type, result)
+            logger.info(f"{type} MACD 상태 구성: 포인트 {len(result['dates'])}개")
+            return result
+
+        # 진행 중이던 캔들과 같은 시각이면 그 캔들을 반영하기 전 시그널에서 다시 계산
+        if state["dates"][-1] == new_date:
+            for key in ("dates", "macd_line", "signal_line", "histogram"):
+                state[key].pop()
+            base_signal = state["prev_signal"]
+        else:
+            base_signal = state["signal"]
+
+        macd_value = short_values[-1]["value"] - long_values[-1]["value"]
+        if base_signal is None:
+            signal = macd_value
+        else:
+            alpha = 2 / (SIGNAL_PERIOD + 1)
+            signal = base_signal + alpha * (macd_value - base_signal)
+
+        state["prev_signal"] = base_signal
+        state["signal"] = signal
+        state["dates"].append(new_date)
+        state["macd_line"].append(macd_value)
+        state["signal_line"].append(signal)
+        state["histogram"].append(macd_value - signal)
+
+        return {
+            "type": type,
+            "dates": state["dates"],
+            "macd_line": state["macd_line"],
+            "signal_line": state["signal_line"],
+            "histogram": state["histogram"],
+            "last_updated": datetime.now(timezone.utc).isoformat(),
+        }
+
+
+def build_macd_delta(macd_data, since):
+    """
+    macd 결과에서 since 시각 이후 포인트만 추린 PATCH 요청 본문
+
+    시그널 라인은 과거 값을 바꾸지 않는 EMA(adjust=False)이므로
+    이번 캔들 시각 이후 포인트만 보내면 된다.
+
+    Args:
+        macd_data (Dict): macd 또는 update_macd 결과
+        since (str): 이번에 추가(또는 교체)한 캔들 시각 (candle_date_time_utc)
+
+    Returns:
+        Dict: 새 MACD 포인트 목록과 보관 시작 시각
+    """
+    since = datetime.fromisoformat(since)
+
+    # 새 포인트는 끝에 있으므로 뒤에서부터 since 이전 포인트를 만날 때까지만 확인
+    points = []
+    for date, macd_value, signal, hist in zip(
+        reversed(macd_data["dates"]),
+        reversed(macd_data["macd_line"]),
+        reversed(macd_data["signal_line"]),
+        reversed(macd_data["histogram"]),
+    ):
+        if datetime.fromisoformat(date) < since:
+            break
+        points.append(
+            {"timestamp": date, "macd": macd_value, "signal": signal, "histogram": hist}
+        )
+    points.reverse()
+
+    return {
+        "type": macd_data["type"],
+        "points": points,
+        "retain_from": macd_data["dates"][0] if macd_data["dates"] else None,
+        "last_updated": macd_data["last_updated"],
+    }
+
+
+def macd_calc(snapshot):
+    macd_data = snapshot.macd("hour4")
     latest_macd = (
         macd_data["macd_line"][-1]
         if isinstance(macd_data["macd_line"], list)
@@ -1,9 +1,99 @@
+import math
+import re
+import threading
+from collections import deque
 from datetime import datetime, timezone
+
+from ..candle_repository import MAX_CANDLES_PER_REQUEST, candle_repository
+from ..retention import enforce_series_retention, get_retention
 from log_generator import set_logger
-from api.api import get_moving_average
 
 logger = set_logger()
 
+# 누적 합계의 부동소수점 오차가 쌓이지 않도록 윈도우를 다시 합산하는 주기
+RESUM_INTERVAL = 1000
+
+
+class RollingMean:
+    """
+    고정 길이 윈도우의 합계를 누적 관리하는 이동평균
+
+    새 가격 추가와 마지막 가격 교체 모두 O(1)이며, RESUM_INTERVAL번 갱신마다
+    윈도우 전체를 다시 합산하여 누적 오차를 제거한다.
+    """
+
+    def __init__(self, period, prices=()):
+        self.period = period
+        self.window = deque(maxlen=period)
+        self.total = 0.0
+        self._updates = 0
+
+        for price in list(prices)[-period:]:
+            self.append(price)
+
+    def append(self, price):
+        if len(self.window) == self.period:
+            self.total -= self.window[0]
+        self.window.append(price)
+        self.total += price
+        self._tick()
+
+    def replace_last(self, price):
+        """아직 마감되지 않은 마지막 캔들의 가격을 새 값으로 교체"""
+        self.total += price - self.window[-1]
+        self.window[-1] = price
+        self._tick()
+
+    def _tick(self):
+        self._updates += 1
+        if self._updates >= RESUM_INTERVAL:
+            self.total = math.fsum(self.window)
+            self._updates = 0
+
+    def is_full(self):
+        return len(self.window) == self.period
+
+    def mean(self):
+        return self.total / self.period
+
+
+# 타임프레임별 이동평균 상태 {type: {"last_timestamp": str, "windows": {period: RollingMean}}}
+# candle_monitoring은 모든 타임프레임을 한 프로세스에서 asyncio.to_thread로 동시에 갱신하므로
+# 상태는 타임프레임별 잠금 아래에서 읽고 바꾼다.
+_ma_states = {}
+_ma_state_locks = {}
+
+
+def _last_ma_timestamp(ma_values):
+    timestamps = [values[-1]["timestamp"] for values in ma_values.values() if values]
+    return max(timestamps) if timestamps else None
+
+
+def _price_history(ma_values, type, required, last_timestamp):
+    """
+    저장된 ma_values의 모든 기간 목록을 합쳐 과거순 종가 목록 생성
+
+    짧은 기간의 목록일수록 더 과거부터 값이 있으므로 기간별 목록을 타임스탬프로 합친다.
+    그래도 가장 긴 윈도우를 채우지 못하면 캔들 버퍼에서 과거 종가를 보충한다.
+    버퍼에는 last_timestamp 이후의 캔들(진행 중 캔들 포함)도 있으므로 last_timestamp까지만
+    보충해야 새 캔들이 윈도우에 두 번 들어가지 않고, 마지막 원소가 last_timestamp의 종가가 된다.
+    """
+    prices = {}
+    for values in ma_values.values():
+        for item in values:
+            prices[item["timestamp"]] = item["price"]
+
+    if len(prices) < required:
+        try:
+            for candle in candle_repository.get_candles(type, MAX_CANDLES_PER_REQUEST):
+                timestamp = candle["candle_date_time_utc"]
+                if last_timestamp is None or timestamp <= last_timestamp:
+                    prices.setdefault(timestamp, candle["trade_price"])
+        except Exception as e:
+            logger.warning(f"{type} 이동평균 과거 종가 보충 실패: {e}")
+
+    return [prices[timestamp] for timestamp in sorted(prices)]
+
 
 def update_moving_average(prev_ma_data, new_candle, type):
     """
@@ -49,9 +139,10 @@ def update_moving_average(prev_ma_data, new_candle, type):
         },
     }
 
-    # 결과 초기화 (기존 데이터 복사)
+    # 결과 초기화 (ma_values 목록은 복사하지 않고 그대로 이어서 추가)
     result = prev_ma_data.copy()
     result["last_updated"] = datetime.now(timezone.utc).isoformat()
+    ma_values = result["ma_values"]
 
     # 모든 계산할 기간 추출
     all_periods = set()
@@ -66,33 +157,61 @@ def update_moving_average(prev_ma_data, new_candle, type):
     new_timestamp = new_candle["candle_date_time_utc"]
     new_price = new_candle["trade_price"]
 
-    # 각 이동평균 기간에 대해 업데이트
-    for period in sorted(all_periods):
-        ma_key = f"ma_{period}"
-
-        # 해당 기간의 이동평균 값 목록 가져오기
-        ma_values = result["ma_values"].get(ma_key, [])
-
-        # 충분한 데이터가 있으면 이동평균 업데이트
-        # 가장 오래된 데이터 제외하고 새 데이터 추가하는 방식으로 계산
-
-        # 이전 period 개의 가격 데이터 수집 (맨 뒤 period-1개 + 새 데이터)
-        prices = [item["price"] for item in ma_values[-(period - 1) :]]
-        prices.append(new_price)
-
-        # 새 이동평균 계산
-        new_ma_value = round(sum(prices) / period, 2)
-
-        # 새 이동평균 값 추가
-        ma_values.append(
-            {"timestamp": new_timestamp, "value": new_ma_value, "price": new_price}
-        )
-
-        # 최신 MA 값 업데이트
-        result[ma_key] = new_ma_value
-
-        # 결과 업데이트
-        result["ma_values"][ma_key] = ma_values
+    with _ma_state_locks.setdefault(type, threading.Lock()):
+        # 저장된 데이터와 프로세스 내 상태가 어긋나면 (재시작, 초기화 등) 윈도우를 다시 구성
+        last_timestamp = _last_ma_timestamp(ma_values)
+        state = _ma_states.get(type)
+        if state is None or state["last_timestamp"] != last_timestamp:
+            history = _price_history(ma_values, type, max(all_periods), last_timestamp)
+            state = {
+                "last_timestamp": last_timestamp,
+                "windows": {
+                    period: RollingMean(period, history) for period in all_periods
+                },
+            }
+            _ma_states[type] = state
+            logger.info(f"{type} 이동평균 윈도우 구성: 종가 {len(history)}개")
+
+        # 진행 중이던 캔들과 같은 시각이면 마지막 값을 교체, 아니면 새 캔들 추가
+        is_replacement = new_timestamp == last_timestamp
+
+        # 각 이동평균 기간에 대해 업데이트
+        for period in sorted(all_periods):
+            ma_key = f"ma_{period}"
+            window = state["windows"][period]
+
+            if is_replacement:
+                window.replace_last(new_price)
+            else:
+                window.append(new_price)
+
+            if not window.is_full():
+                logger.warning(
+                    f"{type} ma_{period} 윈도우 데이터 부족: {len(window.window)}/{period}"
+                )
+
+            # 새 이동평균 계산
+            new_ma_value = round(window.mean(), 2)
+            new_item = {
+                "timestamp": new_timestamp,
+                "value": new_ma_value,
+                "price": new_price,
+            }
+
+            values = ma_values.setdefault(ma_key, [])
+            if values and values[-1]["timestamp"] == new_timestamp:
+                values[-1] = new_item
+            else:
+                values.append(new_item)
+
+            # 최신 MA 값 업데이트
+            result[ma_key] = new_ma_value
+
+        state["last_timestamp"] = new_timestamp
+
+    # 보관 기간을 넘은 포인트는 아카이브로 이동 (가장 긴 윈도우보다 짧게 자르지 않음)
+    keep = max(get_retention("moving_average", type), max(all_periods))
+    enforce_series_retention("moving_average", type, ma_values, keep)
 
     # 기존 호환성을 위해 장기 이동평균도 ma 키에 저장
     long_term_key = f"ma_{type_periods.get('long_term')}"
@@ -105,19 +224,51 @@ def update_moving_average(prev_ma_data, new_candle, type):
     return result
 
 
-def calculate_trend_strength(current_price):
+def build_moving_average_delta(ma_data, timestamp):
+    """
+    update_moving_average 결과에서 이번 캔들로 바뀐 부분만 추린 PATCH 요청 본문
+
+    Args:
+        ma_data (Dict): update_moving_average 결과
+        timestamp (str): 이번에 추가(또는 교체)한 캔들 시각 (candle_date_time_utc)
+
+    Returns:
+        Dict: 최신 이동평균 값, 기간별 새 포인트, 기간별 보관 시작 시각
+    """
+    ma_values = ma_data["ma_values"]
+    return {
+        "type": ma_data["type"],
+        "values": {
+            key: value
+            for key, value in ma_data.items()
+            if re.fullmatch(r"ma(_\d+)?", key)
+        },
+        "points": {
+            key: values[-1]
+            for key, values in ma_values.items()
+            if values and values[-1]["timestamp"] == timestamp
+        },
+        # 보관 기간 밖으로 잘라낸 포인트를 백엔드에서도 삭제
+        "retain_from": {
+            key: values[0]["timestamp"] for key, values in ma_values.items() if values
+        },
+        "last_updated": ma_data["last_updated"],
+    }
+
+
+def calculate_trend_strength(current_price, snapshot):
     """
     여러 이동평균선을 활용한 추세 강도 측정
 
     Args:
         current_price: 현재 가격
-        ma_data: 이동평균 데이터
+        snapshot: 틱 단위 지표 스냅샷
 
     Returns:
         dict: 추세 강도 분석 결과와 점수
     """
     # 필요한 이동평균선 데이터 추출
-    hour4_ma = get_moving_average("hour4")
+    hour4_ma = snapshot.moving_average("hour4")
     ma_7 = hour4_ma["ma_7"]
     ma_25 = hour4_ma["ma_25"]
     ma_50 = hour4_ma["ma_50"]
@@ -226,10 +377,10 @@ def calculate_trend_strength(current_price):
     return score
 
 
-def analyze_multi_timeframes(current_price):
-    hour4_ma = get_moving_average("hour4")
-    hour1_ma = get_moving_average("hour1")
-    day_ma = get_moving_average("day")
+def analyze_multi_timeframes(current_price, snapshot):
+    hour4_ma = snapshot.moving_average("hour4")
+    hour1_ma = snapshot.moving_average("hour1")
+    day_ma = snapshot.moving_average("day")
 
     signals = {
         "hour1": {
@@ -265,8 +416,8 @@ def analyze_multi_timeframes(current_price):
     return alignment_score * 1.5  # 가중치 적용 (예: 1.5배)
 
 
-def ma_25_calc(current_price):
-    ma = get_moving_average("hour4")
+def ma_25_calc(current_price, snapshot):
+    ma = snapshot.moving_average("hour4")
     ma_25 = ma["ma_25"]
 
     price_above_ma = current_price > ma_25
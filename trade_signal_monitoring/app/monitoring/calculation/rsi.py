@@ -1,13 +1,76 @@
 from log_generator import set_logger
-from api.api import get_rsi
+from ..retention import archive_history, get_retention
 
 logger = set_logger()
 
 
+def _enforce_rsi_retention(result, type):
+    """보관 기간을 넘은 RSI 포인트를 아카이브로 옮기고 rsi_values/timestamps에서 제거"""
+    excess = len(result["rsi_values"]) - get_retention("rsi", type)
+    if excess <= 0:
+        return
+
+    points = [
+        {"timestamp": timestamp, "value": value}
+        for timestamp, value in zip(
+            result["timestamps"][:excess], result["rsi_values"][:excess]
+        )
+    ]
+    if archive_history("rsi", type, {"rsi": points}):
+        del result["rsi_values"][:excess]
+        del result["timestamps"][:excess]
+
+
+def advance_rsi_state(state, close, timestamp):
+    """
+    종가 하나를 반영한 다음 RSI 계산 상태 (O(1))
+
+    pandas ewm(com=period-1, adjust=True)의 재귀식:
+    weight' = 1 + (1 - α) * weight, avg' = avg + (x - avg) / weight'
+    가중치 합이 1/α로 수렴하면 Wilder 평활 (avg * (period - 1) + x) / period와 같아진다.
+
+    Args:
+        state (Dict): 이전 캔들까지의 상태 (prev 제외)
+        close (float): 새 캔들 종가
+        timestamp (str): 새 캔들 시각 (candle_date_time_utc)
+
+    Returns:
+        Dict: 새 캔들까지 반영한 상태
+    """
+    period = state["period"]
+    alpha = 1 / period
+    delta = close - state["last_close"]
+    gain = max(delta, 0.0)
+    loss = max(-delta, 0.0)
+
+    weight = 1 + (1 - alpha) * state["weight"]
+    return {
+        "period": period,
+        "avg_gain": state["avg_gain"] + (gain - state["avg_gain"]) / weight,
+        "avg_loss": state["avg_loss"] + (loss - state["avg_loss"]) / weight,
+        "weight": weight,
+        "count": state["count"] + 1,
+        "last_close": close,
+        "timestamp": timestamp,
+    }
+
+
+def rsi_from_state(state):
+    """상태의 평균 상승/하락폭으로 RSI 계산 (가격 변화가 period개 미만이면 None)"""
+    if state["count"] < state["period"]:
+        return None
+    if state["avg_loss"] == 0:
+        return 100.0
+    rs = state["avg_gain"] / state["avg_loss"]
+    return 100 - (100 / (1 + rs))
+
+
 def update_rsi(prev_rsi_data, new_candle, type):
     """
     기존 RSI 데이터에 새로운 캔들 하나를 추가하여 RSI 계산을 업데이트하는 함수
 
+    저장된 Wilder 계산 상태(평균 상승/하락폭, 마지막 종가)에서 O(1)로 다음 값을 계산한다.
+
     Args:
         prev_rsi_data (Dict): 이전에 저장된 RSI 데이터
         new_candle (Dict): API에서 새로 받아온 캔들 데이터 하나
@@ -16,6 +79,56 @@ def update_rsi(prev_rsi_data, new_candle, type):
     Returns:
         Dict: 업데이트된 RSI 결과와 메타데이터를 포함한 딕셔너리
     """
+    state = prev_rsi_data.get("state")
+    new_timestamp = new_candle["candle_date_time_utc"]
+
+    # 같은 캔들이 다시 들어오면 그 캔들을 반영하기 전 상태에서 다시 계산
+    is_duplicate = state is not None and state["timestamp"] == new_timestamp
+    base = state.get("prev") if is_duplicate else state
+    if base is None:
+        logger.warning(f"RSI 계산 상태가 없어 이전 RSI 값에서 역산합니다. type: {type}")
+        return _update_rsi_from_prev_value(prev_rsi_data, new_candle, type)
+
+    base = {key: value for key, value in base.items() if key != "prev"}
+    new_state = advance_rsi_state(base, new_candle["trade_price"], new_timestamp)
+    new_state["prev"] = base
+    new_rsi = rsi_from_state(new_state)
+    if new_rsi is None:
+        logger.warning(f"RSI 업데이트를 위한 충분한 데이터가 없습니다. type: {type}")
+        return prev_rsi_data
+
+    # 결과 초기화 (기존 데이터 복사)
+    result = prev_rsi_data.copy()
+    result["rsi_values"] = list(result["rsi_values"])
+    result["timestamps"] = list(result["timestamps"])
+    if result["timestamps"] and result["timestamps"][-1] == new_timestamp:
+        result["timestamps"].pop()
+        result["rsi_values"].pop()
+
+    # 새 RSI 값 추가
+    result["rsi_values"].append(new_rsi)
+    result["timestamps"].append(new_timestamp)
+
+    # 최신 RSI 값과 계산 상태 업데이트
+    result["current_rsi"] = new_rsi
+    result["last_updated"] = new_timestamp
+    result["state"] = new_state
+    _enforce_rsi_retention(result, type)
+
+    # 불필요한 필드 제거
+    result.pop("id", None)
+    result.pop("created_at", None)
+
+    logger.info(f"RSI 업데이트 완료. type: {type}, 현재 RSI: {new_rsi}")
+
+    return result
+
+
+def _update_rsi_from_prev_value(prev_rsi_data, new_candle, type):
+    """
+    계산 상태(state)가 없는 이전 데이터용: 마지막 RSI 값에서 평균 상승/하락폭을 역산하여 갱신
+    (근사값이므로 다음 초기 계산에서 상태가 저장되면 더 이상 사용하지 않음)
+    """
     period = 14  # RSI 기본 기간
 
     # 결과 초기화 (기존 데이터 복사)
@@ -76,6 +189,7 @@ def update_rsi(prev_rsi_data, new_candle, type):
             result["timestamps"].append(new_timestamp)
             result["current_rsi"] = new_rsi
             result["last_updated"] = new_timestamp
+            _enforce_rsi_retention(result, type)
 
             # 불필요한 필드 제거
             result.pop("id", None)
@@ -107,6 +221,7 @@ def update_rsi(prev_rsi_data, new_candle, type):
     # 최신 RSI 값 업데이트
     result["current_rsi"] = new_rsi
     result["last_updated"] = new_timestamp
+    _enforce_rsi_retention(result, type)
 
     # 불필요한 필드 제거
     result.pop("id", None)
@@ -117,10 +232,33 @@ def update_rsi(prev_rsi_data, new_candle, type):
     return result
 
 
-def rsi_calc():
+def build_rsi_delta(rsi_data):
+    """
+    update_rsi 결과에서 마지막 포인트만 추린 PATCH 요청 본문
+
+    Args:
+        rsi_data (Dict): update_rsi 결과
+
+    Returns:
+        Dict: 마지막 RSI 포인트, 현재 RSI, 보관 시작 시각
+    """
+    return {
+        "type": rsi_data["type"],
+        "point": {
+            "timestamp": rsi_data["timestamps"][-1],
+            "value": rsi_data["rsi_values"][-1],
+        },
+        "current_rsi": rsi_data["current_rsi"],
+        "retain_from": rsi_data["timestamps"][0],
+        "last_updated": rsi_data["last_updated"],
+        "state": rsi_data.get("state"),
+    }
+
+
+def rsi_calc(snapshot):
     # 두 타임프레임 RSI 모두 가져오기
-    hour1_rsi = get_rsi("hour1")["current_rsi"]
-    hour4_rsi = get_rsi("hour4")["current_rsi"]
+    hour1_rsi = snapshot.rsi("hour1")["current_rsi"]
+    hour4_rsi = snapshot.rsi("hour4")["current_rsi"]
 
     # Hour1 RSI 기반 기본 점수 (더 높은 가중치)
     if hour1_rsi <= 30:
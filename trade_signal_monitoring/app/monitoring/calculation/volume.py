@@ -1,12 +1,102 @@
-import time
-from datetime import datetime, timezone
+import math
+import numpy as np
 from log_generator import set_logger
 import statistics
-from api.api import get_trade_ticks_api_call
+from ..tick_store import TICKS_PER_REQUEST, tick_store
+from .volume_aggregator import MS_PER_HOUR, _ticks_to_columns
 
 logger = set_logger()
 
 
+def _daily_volume_metrics(day_num, ticks):
+    """
+    하루치 체결 데이터의 볼륨 지표 계산
+
+    Args:
+        day_num (int): 며칠 전 데이터인지 (day_ago_N의 N)
+        ticks (list): 비어 있지 않은 체결 데이터 리스트
+
+    Returns:
+        dict: 일별 볼륨 지표 (JSON 직렬화 가능한 파이썬 기본 타입)
+    """
+    timestamps, prices, volumes, is_bid = _ticks_to_columns(ticks)
+    count = len(volumes)
+
+    # 기본 통계 계산
+    total_volume = float(volumes.sum())
+    avg_volume = total_volume / count
+    median_volume = float(np.median(volumes))
+    max_volume = float(volumes.max())
+    volume_std = float(volumes.std(ddof=1)) if count > 1 else 0
+
+    # 대량 거래 식별 (평균의 3배 이상)
+    large_trade_count = int(np.count_nonzero(volumes > avg_volume * 3))
+
+    # 시간대별 볼륨 (UTC 1시간 단위로 집계, 키 순서는 처음 등장한 순서 유지)
+    hours = (timestamps // MS_PER_HOUR) % 24
+    hourly_totals = np.bincount(hours, weights=volumes, minlength=24)
+    hourly_counts = np.bincount(hours, minlength=24)
+    _, first_index = np.unique(hours, return_index=True)
+    hourly_stats = {
+        int(hour): {
+            "total": float(hourly_totals[hour]),
+            "count": int(hourly_counts[hour]),
+            "avg": float(hourly_totals[hour] / hourly_counts[hour]),
+        }
+        for hour in hours[np.sort(first_index)]
+    }
+
+    # 가격-볼륨 상관관계 (시간순으로 연속된 틱 간의 가격 변화와 볼륨 관계)
+    order = np.argsort(timestamps, kind="stable")
+    price_changes = np.diff(prices[order])
+    next_volumes = volumes[order][1:]
+
+    # 가격 상승/하락 시 볼륨 분석
+    up_volumes = next_volumes[price_changes > 0]
+    down_volumes = next_volumes[price_changes < 0]
+
+    up_avg = float(up_volumes.mean()) if up_volumes.size else 0
+    down_avg = float(down_volumes.mean()) if down_volumes.size else 0
+    volume_ratio = up_avg / down_avg if down_avg else float("inf")
+
+    return {
+        "day_num": day_num,
+        "total_volume": total_volume,
+        "avg_volume": avg_volume,
+        "median_volume": median_volume,
+        "max_volume": max_volume,
+        "volume_std": volume_std,
+        "large_trade_ratio": large_trade_count / count,
+        "large_trade_count": large_trade_count,
+        "buy_volume_ratio": (
+            float(volumes[is_bid].sum()) / total_volume if total_volume else 0
+        ),
+        "hourly_stats": hourly_stats,
+        "up_down_volume_ratio": volume_ratio,
+        "data_points": count,
+    }
+
+
+def _current_data(ticks):
+    timestamps, prices, volumes, _ = _ticks_to_columns(ticks)
+
+    # 가장 최근 체결 데이터 (동일 시각이면 먼저 나온 체결)
+    latest_tick = ticks[int(np.argmax(timestamps))]
+
+    return {
+        "trade_price": latest_tick["trade_price"],
+        "trade_volume": latest_tick["trade_volume"],
+        "acc_trade_volume_24h": float(volumes.sum()),
+        "acc_trade_price_24h": float(np.dot(prices, volumes)),
+        "timestamp": latest_tick["timestamp"],
+        "change": (
+            "RISE"
+            if latest_tick["change_price"] > 0
+            else "FALL" if latest_tick["change_price"] < 0 else "EVEN"
+        ),
+    }
+
+
 def analyze_volume_from_daily_ticks(daily_ticks_dict):
     """
     일별 체결 데이터를 분석하여 1단계 트레이딩 로직에 활용할 볼륨 분석 데이터 생성
@@ -23,27 +113,16 @@ def analyze_volume_from_daily_ticks(daily_ticks_dict):
     Returns:
         dict: 볼륨 분석 결과와 종합 점수를 포함한 데이터 인터페이스
     """
-
-    # 결과 저장용 딕셔너리
-    result = {
-        "volume_score": 0,  # 최종 볼륨 점수 (-4 ~ +4 범위)
-        "volume_signals": {},  # 감지된 볼륨 신호들
-        "volume_metrics": {},  # 주요 볼륨 지표
-        "volume_patterns": {},  # 식별된 볼륨 패턴
-        "data_quality": {  # 분석에 사용된 데이터 품질 정보
-            "days_count": len(daily_ticks_dict),
-            "total_ticks": sum(len(ticks) for ticks in daily_ticks_dict.values()),
-        },
+    data_quality = {
+        "days_count": len(daily_ticks_dict),
+        "total_ticks": sum(len(ticks) for ticks in daily_ticks_dict.values()),
+        "pages_consumed": sum(
+            math.ceil(len(ticks) / TICKS_PER_REQUEST)
+            for ticks in daily_ticks_dict.values()
+        ),
+        "ticks_consumed": sum(len(ticks) for ticks in daily_ticks_dict.values()),
     }
 
-    # 충분한 데이터가 없으면 기본값 반환
-    if (
-        not daily_ticks_dict
-        or sum(len(ticks) for ticks in daily_ticks_dict.values()) < 100
-    ):
-        result["volume_signals"]["insufficient_data"] = True
-        return result
-
     # 1. 일별 기본 볼륨 지표 계산
     daily_metrics = {}
     for day_key, ticks in daily_ticks_dict.items():
@@ -53,99 +132,48 @@ def analyze_volume_from_daily_ticks(daily_ticks_dict):
         # 날짜 추출 (day_ago_1 → 1로 변환)
         day_num = int(day_key.split("_")[-1])
 
-        # 볼륨 데이터 추출
-        volumes = [tick["trade_volume"] for tick in ticks]
-
-        # 매수 거래량만 추출 (매도 거래량은 사용되지 않음)
-        buy_volumes = [
-            tick["trade_volume"] for tick in ticks if tick["ask_bid"] == "BID"
-        ]
-
-        # 기본 통계 계산
-        total_volume = sum(volumes)
-        avg_volume = total_volume / len(volumes) if volumes else 0
-        median_volume = statistics.median(volumes) if volumes else 0
-        max_volume = max(volumes) if volumes else 0
-        volume_std = statistics.stdev(volumes) if len(volumes) > 1 else 0
-
-        # 대량 거래 식별 (평균의 3배 이상)
-        large_trades = [vol for vol in volumes if vol > avg_volume * 3]
-        large_trade_ratio = len(large_trades) / len(volumes) if volumes else 0
-
-        # 시간대별 볼륨 (1시간 단위로 집계)
-        hourly_volumes = {}
-        for tick in ticks:
-            tick_time = datetime.fromtimestamp(
-                tick["timestamp"] / 1000, tz=timezone.utc
-            )
-            hour = tick_time.hour
+        daily_metrics[day_key] = _daily_volume_metrics(day_num, ticks)
 
-            if hour not in hourly_volumes:
-                hourly_volumes[hour] = []
+    current_data = {}
+    if daily_metrics:
+        most_recent_day = max(
+            daily_metrics, key=lambda day_key: daily_metrics[day_key]["day_num"]
+        )
+        current_data[most_recent_day] = _current_data(daily_ticks_dict[most_recent_day])
 
-            hourly_volumes[hour].append(tick["trade_volume"])
+    return analyze_volume_from_daily_metrics(daily_metrics, data_quality, current_data)
 
-        hourly_stats = {
-            hour: {
-                "total": sum(vols),
-                "count": len(vols),
-                "avg": sum(vols) / len(vols) if vols else 0,
-            }
-            for hour, vols in hourly_volumes.items()
-        }
 
-        # 가격-볼륨 상관관계 (연속적인 틱 간의 가격 변화와 볼륨 관계)
-        price_changes = []
-        sorted_ticks = sorted(ticks, key=lambda x: x["timestamp"])
-        for i in range(1, len(sorted_ticks)):
-            prev_tick = sorted_ticks[i - 1]
-            curr_tick = sorted_ticks[i]
-
-            price_change = curr_tick["trade_price"] - prev_tick["trade_price"]
-            price_change_pct = (
-                price_change / prev_tick["trade_price"] * 100
-                if prev_tick["trade_price"]
-                else 0
-            )
+def analyze_volume_from_daily_metrics(daily_metrics, data_quality, current_data=None):
+    """
+    일별 볼륨 지표를 종합하여 볼륨 점수와 신호 생성
 
-            price_changes.append(
-                {
-                    "change": price_change,
-                    "change_pct": price_change_pct,
-                    "volume": curr_tick["trade_volume"],
-                    "direction": (
-                        "up"
-                        if price_change > 0
-                        else "down" if price_change < 0 else "stable"
-                    ),
-                }
-            )
+    일별 지표는 체결 리스트(_daily_volume_metrics)나 페이지 단위 스트리밍 집계
+    (DailyVolumeAggregator) 중 어느 쪽으로 계산해도 같은 형식이다.
 
-        # 가격 상승/하락 시 볼륨 분석
-        up_volumes = [pc["volume"] for pc in price_changes if pc["direction"] == "up"]
-        down_volumes = [
-            pc["volume"] for pc in price_changes if pc["direction"] == "down"
-        ]
-
-        up_avg = sum(up_volumes) / len(up_volumes) if up_volumes else 0
-        down_avg = sum(down_volumes) / len(down_volumes) if down_volumes else 0
-        volume_ratio = up_avg / down_avg if down_avg else float("inf")
-
-        # 결과 저장
-        daily_metrics[day_key] = {
-            "day_num": day_num,
-            "total_volume": total_volume,
-            "avg_volume": avg_volume,
-            "median_volume": median_volume,
-            "max_volume": max_volume,
-            "volume_std": volume_std,
-            "large_trade_ratio": large_trade_ratio,
-            "large_trade_count": len(large_trades),
-            "buy_volume_ratio": sum(buy_volumes) / total_volume if total_volume else 0,
-            "hourly_stats": hourly_stats,
-            "up_down_volume_ratio": volume_ratio,
-            "data_points": len(ticks),
-        }
+    Args:
+        daily_metrics (dict): {'day_ago_N': 일별 볼륨 지표}
+        data_quality (dict): 분석에 사용된 데이터 품질 정보 (days_count, total_ticks 등)
+        current_data (dict): {'day_ago_N': 해당 날짜의 마지막 체결 정보}
+
+    Returns:
+        dict: 볼륨 분석 결과와 종합 점수를 포함한 데이터 인터페이스
+    """
+    current_data = current_data or {}
+
+    # 결과 저장용 딕셔너리
+    result = {
+        "volume_score": 0,  # 최종 볼륨 점수 (-4 ~ +4 범위)
+        "volume_signals": {},  # 감지된 볼륨 신호들
+        "volume_metrics": {},  # 주요 볼륨 지표
+        "volume_patterns": {},  # 식별된 볼륨 패턴
+        "data_quality": data_quality,  # 분석에 사용된 데이터 품질 정보
+    }
+
+    # 충분한 데이터가 없으면 기본값 반환
+    if not daily_metrics or data_quality["total_ticks"] < 100:
+        result["volume_signals"]["insufficient_data"] = True
+        return result
 
     # 2. 일간 추세 및 패턴 분석
     # 날짜 순으로 정렬된 지표
@@ -317,33 +345,8 @@ def analyze_volume_from_daily_ticks(daily_ticks_dict):
     }
 
     # 1단계 트레이딩 로직에 필요한 현재 데이터 (가장 최근 날짜 기준)
-    if sorted_days:
-        most_recent_day = sorted_days[-1][0]
-        most_recent_ticks = daily_ticks_dict[most_recent_day]
-
-        if most_recent_ticks:
-            # 가장 최근 체결 데이터
-            latest_tick = sorted(
-                most_recent_ticks, key=lambda x: x["timestamp"], reverse=True
-            )[0]
-
-            result["current_data"] = {
-                "trade_price": latest_tick["trade_price"],
-                "trade_volume": latest_tick["trade_volume"],
-                "acc_trade_volume_24h": sum(
-                    tick["trade_volume"] for tick in most_recent_ticks
-                ),
-                "acc_trade_price_24h": sum(
-                    tick["trade_price"] * tick["trade_volume"]
-                    for tick in most_recent_ticks
-                ),
-                "timestamp": latest_tick["timestamp"],
-                "change": (
-                    "RISE"
-                    if latest_tick["change_price"] > 0
-                    else "FALL" if latest_tick["change_price"] < 0 else "EVEN"
-                ),
-            }
+    if sorted_days and sorted_days[-1][0] in current_data:
+        result["current_data"] = current_data[sorted_days[-1][0]]
 
     return result
 
@@ -351,6 +354,12 @@ def analyze_volume_from_daily_ticks(daily_ticks_dict):
 def enhanced_volume_signal(volume_analysis):
     """볼륨 데이터를 더 정교하게 분석하는 함수"""
 
+    # 재시작 직후 백그라운드 집계가 끝나기 전에는 일별 지표가 없으므로 중립 점수
+    if volume_analysis["volume_signals"].get("insufficient_data"):
+        logger.info("volume============")
+        logger.info("일별 볼륨 지표 부족 = 중립")
+        return 0
+
     # 기본 볼륨 점수
     base_score = volume_analysis["volume_score"]
 
@@ -391,12 +400,14 @@ def enhanced_volume_signal(volume_analysis):
 
 
 def volume_signal_calc():
-    result = {}
-    for i in range(7):
-        response = get_trade_ticks_api_call(i + 1)
-        result[f"day_ago_{i+1}"] = response
-        time.sleep(1)
-
-    voluem_analysis = analyze_volume_from_daily_ticks(result)
+    # 완료된 날짜의 일별 지표는 백그라운드에서 하루 전체 체결을 페이지 단위로 받아
+    # 스트리밍 집계해 두므로 여기서는 집계가 끝난 날짜만 읽음
+    daily_metrics, data_quality, current_data = tick_store.get_daily_volume_metrics(
+        days=7
+    )
+
+    voluem_analysis = analyze_volume_from_daily_metrics(
+        daily_metrics, data_quality, current_data
+    )
     score = enhanced_volume_signal(voluem_analysis)
     return score
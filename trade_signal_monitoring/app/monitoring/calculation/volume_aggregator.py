@@ -0,0 +1,231 @@
+import math
+
+import numpy as np
+
+MS_PER_HOUR = 3_600_000
+
+# 체결량 분포 히스토그램 (로그 스케일, 10^-9 ~ 10^4 BTC, 10배 구간당 40개 버킷)
+# 버킷 폭이 약 6%이므로 중앙값과 대량 거래 수는 이 정도 오차의 근사값이다.
+HISTOGRAM_MIN_EXP = -9
+HISTOGRAM_MAX_EXP = 4
+HISTOGRAM_BUCKETS_PER_DECADE = 40
+HISTOGRAM_BUCKET_WIDTH = 1 / HISTOGRAM_BUCKETS_PER_DECADE
+HISTOGRAM_BUCKETS = (
+    HISTOGRAM_MAX_EXP - HISTOGRAM_MIN_EXP
+) * HISTOGRAM_BUCKETS_PER_DECADE
+
+
+def _ticks_to_columns(ticks):
+    """
+    체결 딕셔너리 리스트를 컬럼별 NumPy 배열로 한 번만 변환
+
+    Returns:
+        tuple: (timestamp(ms), 체결가, 체결량, 매수 체결 여부) 배열
+    """
+    count = len(ticks)
+    timestamps = np.fromiter(
+        (tick["timestamp"] for tick in ticks), dtype=np.int64, count=count
+    )
+    prices = np.fromiter(
+        (tick["trade_price"] for tick in ticks), dtype=np.float64, count=count
+    )
+    volumes = np.fromiter(
+        (tick["trade_volume"] for tick in ticks), dtype=np.float64, count=count
+    )
+    is_bid = np.fromiter(
+        (tick["ask_bid"] == "BID" for tick in ticks), dtype=bool, count=count
+    )
+    return timestamps, prices, volumes, is_bid
+
+
+def _histogram_index(log_volumes):
+    index = np.floor(
+        (log_volumes - HISTOGRAM_MIN_EXP) * HISTOGRAM_BUCKETS_PER_DECADE
+    ).astype(np.int64)
+    return np.clip(index, 0, HISTOGRAM_BUCKETS - 1)
+
+
+class DailyVolumeAggregator:
+    """
+    하루치 체결을 페이지 단위로 받아 누적 카운터만으로 볼륨 지표를 계산하는 집계기
+
+    업비트 체결 API 응답 순서(최신순)대로 페이지를 넣어야 하며, 페이지를 처리한 뒤에는
+    체결 원본을 보관하지 않는다. 평균/표준편차/합계/시간대별 집계/상승·하락 볼륨은
+    정확한 값이고, 중앙값과 대량 거래 수는 로그 스케일 히스토그램으로 구한 근사값이다.
+    """
+
+    def __init__(self, day_num):
+        self.day_num = day_num
+        self.pages = 0
+        self.count = 0
+
+        # Welford 방식의 평균/분산 누적값
+        self.mean = 0.0
+        self.m2 = 0.0
+
+        self.total_volume = 0.0
+        self.buy_volume = 0.0
+        self.trade_value = 0.0
+        self.max_volume = 0.0
+
+        self.hourly_totals = np.zeros(24)
+        self.hourly_counts = np.zeros(24, dtype=np.int64)
+        self.hour_order = []
+
+        self.histogram = np.zeros(HISTOGRAM_BUCKETS, dtype=np.int64)
+
+        self.up_volume = 0.0
+        self.up_count = 0
+        self.down_volume = 0.0
+        self.down_count = 0
+
+        # 이전 페이지의 마지막(가장 오래된) 체결: 다음 페이지 첫 체결과의 가격 변화 계산용
+        self._carry_price = None
+        self._carry_volume = None
+
+        self.latest_tick = None
+
+    def add_page(self, ticks):
+        """
+        최신순 체결 한 페이지를 누적
+
+        Args:
+            ticks (list): 업비트 체결 API 응답 (최신순)
+        """
+        if not ticks:
+            return
+
+        timestamps, prices, volumes, is_bid = _ticks_to_columns(ticks)
+        page_count = len(volumes)
+
+        # 평균/분산 병합 (Chan et al. 병렬 분산 공식)
+        page_mean = float(volumes.mean())
+        page_m2 = float(((volumes - page_mean) ** 2).sum())
+        count = self.count + page_count
+        delta = page_mean - self.mean
+        self.mean += delta * page_count / count
+        self.m2 += page_m2 + delta * delta * self.count * page_count / count
+        self.count = count
+        self.pages += 1
+
+        self.total_volume += float(volumes.sum())
+        self.buy_volume += float(volumes[is_bid].sum())
+        self.trade_value += float(np.dot(prices, volumes))
+        self.max_volume = max(self.max_volume, float(volumes.max()))
+
+        # 시간대별 볼륨 (키 순서는 처음 등장한 순서 유지)
+        hours = (timestamps // MS_PER_HOUR) % 24
+        self.hourly_totals += np.bincount(hours, weights=volumes, minlength=24)
+        self.hourly_counts += np.bincount(hours, minlength=24)
+        _, first_index = np.unique(hours, return_index=True)
+        for hour in hours[np.sort(first_index)]:
+            if int(hour) not in self.hour_order:
+                self.hour_order.append(int(hour))
+
+        with np.errstate(divide="ignore"):
+            log_volumes = np.log10(volumes)
+        self.histogram += np.bincount(
+            _histogram_index(log_volumes), minlength=HISTOGRAM_BUCKETS
+        )
+
+        # 가격 변화: 최신순이므로 (더 최근 체결 가격 - 직전 체결 가격), 볼륨은 더 최근 체결
+        if self._carry_price is not None:
+            prices = np.concatenate(([self._carry_price], prices))
+            volumes = np.concatenate(([self._carry_volume], volumes))
+        price_changes = prices[:-1] - prices[1:]
+        newer_volumes = volumes[:-1]
+
+        up = price_changes > 0
+        down = price_changes < 0
+        self.up_volume += float(newer_volumes[up].sum())
+        self.up_count += int(np.count_nonzero(up))
+        self.down_volume += float(newer_volumes[down].sum())
+        self.down_count += int(np.count_nonzero(down))
+
+        self._carry_price = float(prices[-1])
+        self._carry_volume = float(volumes[-1])
+
+        latest_index = int(np.argmax(timestamps))
+        if (
+            self.latest_tick is None
+            or timestamps[latest_index] > self.latest_tick["timestamp"]
+        ):
+            self.latest_tick = ticks[latest_index]
+
+    def _approximate_median(self):
+        target = self.count / 2
+        cumulative = np.cumsum(self.histogram)
+        bucket = int(np.searchsorted(cumulative, target))
+        before = cumulative[bucket - 1] if bucket > 0 else 0
+        fraction = (target - before) / self.histogram[bucket]
+        exponent = HISTOGRAM_MIN_EXP + (bucket + fraction) * HISTOGRAM_BUCKET_WIDTH
+        return min(10**exponent, self.max_volume)
+
+    def _approximate_count_above(self, threshold):
+        if threshold <= 0:
+            return self.count
+
+        position = (math.log10(threshold) - HISTOGRAM_MIN_EXP) / HISTOGRAM_BUCKET_WIDTH
+        bucket = int(math.floor(position))
+        if bucket >= HISTOGRAM_BUCKETS:
+            return 0
+        if bucket < 0:
+            return self.count
+
+        # 임계값이 걸친 버킷은 로그 스케일에서 균등 분포로 가정
+        partial = self.histogram[bucket] * (bucket + 1 - position)
+        return int(round(self.histogram[bucket + 1 :].sum() + partial))
+
+    def metrics(self):
+        """
+        analyze_volume_from_daily_ticks의 daily_metrics와 같은 형식의 일별 지표
+
+        Returns:
+            dict: 일별 볼륨 지표 (JSON 직렬화 가능한 파이썬 기본 타입)
+        """
+        count = self.count
+        avg_volume = self.total_volume / count
+        large_trade_count = self._approximate_count_above(avg_volume * 3)
+
+        up_avg = self.up_volume / self.up_count if self.up_count else 0
+        down_avg = self.down_volume / self.down_count if self.down_count else 0
+
+        return {
+            "day_num": self.day_num,
+            "total_volume": self.total_volume,
+            "avg_volume": avg_volume,
+            "median_volume": self._approximate_median(),
+            "max_volume": self.max_volume,
+            "volume_std": math.sqrt(self.m2 / (count - 1)) if count > 1 else 0,
+            "large_trade_ratio": large_trade_count / count,
+            "large_trade_count": large_trade_count,
+            "buy_volume_ratio": (
+                self.buy_volume / self.total_volume if self.total_volume else 0
+            ),
+            "hourly_stats": {
+                hour: {
+                    "total": float(self.hourly_totals[hour]),
+                    "count": int(self.hourly_counts[hour]),
+                    "avg": float(self.hourly_totals[hour] / self.hourly_counts[hour]),
+                }
+                for hour in self.hour_order
+            },
+            "up_down_volume_ratio": up_avg / down_avg if down_avg else float("inf"),
+            "data_points": count,
+        }
+
+    def current_data(self):
+        """하루 중 가장 마지막 체결과 누적 거래량/거래대금"""
+        latest_tick = self.latest_tick
+        return {
+            "trade_price": latest_tick["trade_price"],
+            "trade_volume": latest_tick["trade_volume"],
+            "acc_trade_volume_24h": self.total_volume,
+            "acc_trade_price_24h": self.trade_value,
+            "timestamp": latest_tick["timestamp"],
+            "change": (
+                "RISE"
+                if latest_tick["change_price"] > 0
+                else "FALL" if latest_tick["change_price"] < 0 else "EVEN"
+            ),
+        }
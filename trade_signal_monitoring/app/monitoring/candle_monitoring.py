@@ -1,19 +1,22 @@
-from datetime import datetime
-import time
-import schedule
-from multiprocessing import Process, Event
+import asyncio
+from datetime import datetime, timedelta, timezone
+from multiprocessing import Process
 
 from api.api import (
     get_candle_api_call,
     get_moving_average,
     get_rsi,
-    put_macd,
-    put_moving_average,
-    put_rsi,
+    patch_macd,
+    patch_moving_average,
+    patch_rsi,
 )
-from .calculation.rsi import update_rsi
-from .calculation.macd import macd
-from .calculation.moving_average import update_moving_average
+from .calculation.rsi import build_rsi_delta, update_rsi
+from .calculation.macd import build_macd_delta, update_macd
+from .calculation.moving_average import (
+    build_moving_average_delta,
+    update_moving_average,
+)
+from .indicator_snapshot import invalidate_indicator_snapshot
 from log_generator import set_logger
 
 logger = set_logger()
@@ -24,126 +27,148 @@ hour_4_url = "https://api.upbit.com/v1/candles/minutes/240"
 hour_1_url = "https://api.upbit.com/v1/candles/minutes/60"
 
 
-def api_call_with_calc(type):
-    logger.info(f"{type} 타입의 api call 시작")
-    url = None
-    if type == "hour1":
-        url = hour_1_url
-    if type == "hour4":
-        url = hour_4_url
-    if type == "day":
-        url = day_url
-    if type == "week":
-        url = week_url
-    candle = get_candle_api_call(url=url, count=1)
+# 타임프레임별 캔들 API와 캔들 간격
+CANDLE_TIMEFRAMES = {
+    "hour1": {"url": hour_1_url, "interval": timedelta(hours=1)},
+    "hour4": {"url": hour_4_url, "interval": timedelta(hours=4)},
+    "day": {"url": day_url, "interval": timedelta(days=1)},
+    "week": {"url": week_url, "interval": timedelta(weeks=1)},
+}
+# 캔들 경계 기준 시각 (월요일 UTC 0시)
+# 업비트 캔들은 UTC 기준으로 4시간봉 0/4/8/12/16/20시, 일봉 0시(KST 9시), 주봉 월요일 0시에 시작
+CANDLE_ANCHOR = datetime(2024, 1, 1, tzinfo=timezone.utc)
+# 마감 후 새 캔들이 업비트 API에 반영되기를 기다리는 시간 (초)
+CANDLE_CLOSE_DELAY_SEC = 0.5
+# 마감 직후 새 캔들이 아직 조회되지 않으면 다시 조회하기까지 대기 시간 (초)
+NEW_CANDLE_POLL_SEC = 1
+# 갱신 실패 시 재시도 대기 시간 (초), 재시도할 때 그 사이 마감된 캔들까지 함께 반영
+RETRY_INTERVAL_SEC = 60
+# 업비트 캔들 API 1회 최대 조회 개수
+MAX_CANDLE_COUNT = 200
+
+
+def candle_open_time(type, now):
+    """now가 속한 (진행 중인) 캔들의 시작 시각"""
+    return now - (now - CANDLE_ANCHOR) % CANDLE_TIMEFRAMES[type]["interval"]
+
+
+def next_candle_close(type, now):
+    """now 이후 처음 마감되는 캔들 마감 시각"""
+    return candle_open_time(type, now) + CANDLE_TIMEFRAMES[type]["interval"]
+
+
+def _candle_open(candle):
+    return datetime.fromisoformat(candle["candle_date_time_utc"]).replace(
+        tzinfo=timezone.utc
+    )
+
+
+def calc_with_candle(type, candle):
+    """캔들 하나로 이동평균/MACD/RSI를 갱신하고 바뀐 포인트만 백엔드에 전송"""
     past_ma = get_moving_average(type)
     if past_ma is None:
-        logger.error(f"저장된 {type} 이동평균 데이터가 없어서 {type} 모니터링 종료")
+        logger.error(f"저장된 {type} 이동평균 데이터가 없어서 {type} 갱신 생략")
         return
-    fresh_ma = update_moving_average(
-        prev_ma_data=past_ma, new_candle=candle[0], type=type
+    fresh_ma = update_moving_average(prev_ma_data=past_ma, new_candle=candle, type=type)
+    # 전체 시계열 대신 이번 캔들로 추가(또는 교체)된 포인트만 전송
+    new_timestamp = candle["candle_date_time_utc"]
+    patch_moving_average(
+        type=type, body=build_moving_average_delta(fresh_ma, new_timestamp)
     )
-    put_moving_average(type=type, body=fresh_ma)
 
-    fresh_macd = macd(type=type, ma_values_data=fresh_ma["ma_values"])
-    put_macd(type=type, body=fresh_macd)
+    fresh_macd = update_macd(
+        type=type, ma_values_data=fresh_ma["ma_values"], new_timestamp=new_timestamp
+    )
+    patch_macd(type=type, body=build_macd_delta(fresh_macd, new_timestamp))
 
     past_rsi = get_rsi(type=type)
     if past_rsi is None:
-        logger.error(f"저장된 {type} RSI 데이터가 없어서 {type} 모니터링 종료")
+        logger.error(f"저장된 {type} RSI 데이터가 없어서 {type} RSI 갱신 생략")
         return
-    fresh_rsi = update_rsi(prev_rsi_data=past_rsi, new_candle=candle[0], type=type)
-    put_rsi(type=type, body=fresh_rsi)
-    logger.info(f"{type} 타입의 api call 종료")
-
-
-def update_ma(type, stop_event):
-    logger.info(f"{type} 모니터링 시작")
-
-    one_minute = 60
-    one_hour = 60
-    now = datetime.now()
-    current_minute = now.minute
-
-    if type == "hour1":
-        minute_interval = one_hour
-        left_time_sec = (minute_interval - current_minute) * 60 + one_minute
-    if type == "hour4":
-        minute_interval = one_hour * 4
-        current_hour = now.hour
-        next_target_hour = None
-        target_hours = [1, 5, 9, 13, 17, 21]
-        for hour in target_hours:
-            if hour > current_hour:
-                next_target_hour = hour
-                break
-            elif hour == current_hour:
-                if hour == 21:
-                    next_target_hour = 1
-                    break
-                next_target_hour = hour + 4
-                break
-            elif hour == 21:
-                next_target_hour = 1
-        if next_target_hour > current_hour:
-            left_minute = (next_target_hour * 60) - (current_hour * 60 + current_minute)
-            left_time_sec = left_minute * 60 + one_minute
-        else:
-            left_hour = 24 - current_hour
-            left_minute = (next_target_hour * 60) + (left_hour * 60) - current_minute
-            left_time_sec = left_minute * 60 + one_minute
-
-    logger.info(f"{type} 반복문 시작 전 {left_time_sec / 60}분 대기중..")
-    time.sleep(left_time_sec)
-    while True:
+    fresh_rsi = update_rsi(prev_rsi_data=past_rsi, new_candle=candle, type=type)
+    patch_rsi(type=type, body=build_rsi_delta(fresh_rsi))
+
+
+class CandleCloseScheduler:
+    """
+    타임프레임별 다음 캔들 마감 시각을 계산해 마감 직후 지표를 갱신하는 asyncio 스케줄러
+
+    모든 타임프레임을 하나의 이벤트 루프에서 처리하고, 갱신(HTTP 호출과 계산)은
+    asyncio.to_thread로 실행한다. 마지막으로 반영한 캔들 시각을 기억하므로 갱신 실패나
+    프로세스 정지(절전 등)로 놓친 마감이 있으면 다음 갱신에서 빠진 캔들을 과거순으로 모두 반영한다.
+    """
+
+    def __init__(self, timeframes=tuple(CANDLE_TIMEFRAMES)):
+        now = datetime.now(timezone.utc)
+        # 초기 데이터(init_setting_data)에 진행 중인 캔들까지 저장되어 있으므로 현재 캔들부터 시작
+        self.last_open = {type: candle_open_time(type, now) for type in timeframes}
+
+    async def run(self):
+        await asyncio.gather(*(self._run_timeframe(type) for type in self.last_open))
+
+    async def _run_timeframe(self, type):
+        logger.info(f"{type} 모니터링 시작")
+        while True:
+            now = datetime.now(timezone.utc)
+            if candle_open_time(type, now) > self.last_open[type]:
+                try:
+                    await asyncio.to_thread(self.update, type)
+                except Exception as e:
+                    logger.error(
+                        f"{type} 캔들 갱신 실패, {RETRY_INTERVAL_SEC}초 후 재시도: {e}"
+                    )
+                    await asyncio.sleep(RETRY_INTERVAL_SEC)
+                    continue
+
+                # 새 캔들이 아직 조회되지 않았으면 (마감된 캔들만 최종 값으로 교체됨) 잠시 후 다시 조회
+                if candle_open_time(type, now) > self.last_open[type]:
+                    await asyncio.sleep(NEW_CANDLE_POLL_SEC)
+                    continue
+
+            close_at = next_candle_close(type, now)
+            delay = (close_at - datetime.now(timezone.utc)).total_seconds()
+            logger.info(f"{type} 다음 캔들 마감 {close_at.isoformat()}까지 대기")
+            await asyncio.sleep(max(delay, 0) + CANDLE_CLOSE_DELAY_SEC)
+
+    def update(self, type):
+        """
+        마지막으로 반영한 캔들부터 현재 진행 중인 캔들까지 과거순으로 반영 (스레드에서 실행)
+
+        마지막으로 반영한 캔들은 마감된 최종 값으로 교체되고 이후 캔들은 새로 추가된다.
+        """
+        timeframe = CANDLE_TIMEFRAMES[type]
+        since = self.last_open[type]
+        open_time = candle_open_time(type, datetime.now(timezone.utc))
+        count = (open_time - since) // timeframe["interval"] + 1
+        if count > MAX_CANDLE_COUNT:
+            logger.warning(
+                f"{type} 놓친 캔들 {count - 1}개 중 최근 {MAX_CANDLE_COUNT}개만 반영"
+            )
+            count = MAX_CANDLE_COUNT
+        elif count > 2:
+            logger.warning(f"{type} 놓친 캔들 {count - 2}개 함께 반영")
+
+        logger.info(f"{type} 타입의 api call 시작")
+        candles = get_candle_api_call(url=timeframe["url"], count=count)
         try:
-            # 현재 시간 가져오기
-            now = datetime.now()
-
-            # 분만 추출하기
-            current_minute = now.minute
-
-            api_call_with_calc(type)
-
-            logger.info(f"{type} 업데이트 후 {minute_interval}분 대기중..")
-            time.sleep(minute_interval * 60)
-
-        except Exception as e:
-            stop_event.set()
-            logger.error(f"{type} 모니터링 에러: {e}")
-            break
+            # 업비트는 최신순으로 반환하므로 과거 캔들부터 반영
+            for candle in reversed(candles):
+                candle_open = _candle_open(candle)
+                if candle_open < since:
+                    continue
+                calc_with_candle(type, candle)
+                self.last_open[type] = candle_open
+        finally:
+            # 가격 모니터링 프로세스의 지표 스냅샷 무효화
+            invalidate_indicator_snapshot()
+        logger.info(f"{type} 타입의 api call 종료")
 
-    logger.error(f"{type} 모니터링 종료")
 
-
-def start_week_day_schedule(stop_event):
-    logger.info("week_day 모니터링 시작")
-    schedule.every().day.at("09:01").do(api_call_with_calc, "day")
-    schedule.every().monday.at("09:01").do(api_call_with_calc, "hour1")
-    while not stop_event.is_set():
-        schedule.run_pending()
-        time.sleep(60)
-
-    logger.info("week_day 모니터링 종료")
+def run_candle_scheduler():
+    asyncio.run(CandleCloseScheduler().run())
 
 
 def start_candle_monitoring():
-    stop_event = Event()
-    hour1_p = Process(
-        target=update_ma,
-        args=(
-            "hour1",
-            stop_event,
-        ),
-    )
-    hour4_p = Process(
-        target=update_ma,
-        args=(
-            "hour4",
-            stop_event,
-        ),
-    )
-    week_day_p = Process(target=start_week_day_schedule, args=(stop_event,))
-    hour1_p.start()
-    hour4_p.start()
-    week_day_p.start()
+    # 모든 타임프레임을 하나의 프로세스(이벤트 루프)에서 처리
+    candle_p = Process(target=run_candle_scheduler, name="candle-monitoring")
+    candle_p.start()
@@ -0,0 +1,116 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from api.api import get_candle_api_call
+from log_generator import set_logger
+
+logger = set_logger()
+
+CANDLE_URLS = {
+    "hour1": "https://api.upbit.com/v1/candles/minutes/60",
+    "hour4": "https://api.upbit.com/v1/candles/minutes/240",
+    "day": "https://api.upbit.com/v1/candles/days",
+    "week": "https://api.upbit.com/v1/candles/weeks",
+}
+
+CANDLE_INTERVALS = {
+    "hour1": timedelta(hours=1),
+    "hour4": timedelta(hours=4),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+}
+
+# 업비트 캔들 API 1회 요청 최대 개수
+MAX_CANDLES_PER_REQUEST = 200
+
+# 같은 틱 안의 반복 조회는 업비트를 다시 호출하지 않고 메모리에서 응답
+REFRESH_INTERVAL_SEC = 30
+
+
+def _candle_time(candle):
+    return datetime.fromisoformat(candle["candle_date_time_utc"]).replace(
+        tzinfo=timezone.utc
+    )
+
+
+class CandleRepository:
+    """
+    타임프레임별 롤링 캔들 버퍼
+
+    버퍼는 업비트 응답과 같은 최신순으로 보관하며, 갱신 시에는 보유한 가장 최신
+    캔들 이후의 캔들만 업비트에 요청한다. (진행 중인 최신 캔들은 새 값으로 교체)
+    """
+
+    def __init__(self):
+        self._buffers = {}
+        self._refreshed_at = {}
+        self._lock = threading.Lock()
+
+    def get_candles(self, timeframe, count):
+        """
+        최신순 캔들 count개 반환
+
+        Args:
+            timeframe (str): 'hour1', 'hour4', 'day', 'week'
+            count (int): 필요한 캔들 수 (최대 200)
+
+        Returns:
+            list: 업비트 캔들 응답과 동일한 형식의 최신순 캔들 리스트
+        """
+        count = min(count, MAX_CANDLES_PER_REQUEST)
+
+        with self._lock:
+            buffer = self._buffers.get(timeframe)
+
+            if buffer is None or len(buffer) < count:
+                buffer = self._load(timeframe, count)
+            elif (
+                time.monotonic() - self._refreshed_at[timeframe] > REFRESH_INTERVAL_SEC
+            ):
+                buffer = self._refresh(timeframe, buffer)
+
+            return buffer[:count]
+
+    def _load(self, timeframe, count):
+        candles = get_candle_api_call(CANDLE_URLS[timeframe], count=count)
+        self._store(timeframe, candles)
+        logger.info(f"{timeframe} 캔들 버퍼 초기화: {len(candles)}개")
+        return candles
+
+    def _refresh(self, timeframe, buffer):
+        latest_time = _candle_time(buffer[0])
+        elapsed = datetime.now(timezone.utc) - latest_time
+
+        # 진행 중이던 최신 캔들 + 그 이후 새로 열린 캔들 수
+        new_count = int(elapsed / CANDLE_INTERVALS[timeframe]) + 1
+        if new_count >= len(buffer) or new_count > MAX_CANDLES_PER_REQUEST:
+            return self._load(timeframe, len(buffer))
+
+        fresh = [
+            candle
+            for candle in get_candle_api_call(CANDLE_URLS[timeframe], count=new_count)
+            if _candle_time(candle) >= latest_time
+        ]
+        fresh_times = {candle["candle_date_time_utc"] for candle in fresh}
+        kept = [
+            candle
+            for candle in buffer
+            if candle["candle_date_time_utc"] not in fresh_times
+        ]
+
+        merged = (fresh + kept)[: len(buffer)]
+        self._store(timeframe, merged)
+        return merged
+
+    def _store(self, timeframe, candles):
+        self._buffers[timeframe] = candles
+        self._refreshed_at[timeframe] = time.monotonic()
+
+    def clear(self):
+        with self._lock:
+            self._buffers.clear()
+            self._refreshed_at.clear()
+
+
+candle_repository = CandleRepository()
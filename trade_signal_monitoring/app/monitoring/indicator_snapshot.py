@@ -0,0 +1,90 @@
+import multiprocessing
+import time
+
+from api.api import get_indicator_snapshot_api_call
+from api.async_api import INDICATORS, TIMEFRAMES, run_fetch_indicators
+from log_generator import set_logger
+
+logger = set_logger()
+
+# 버전 변경이 없더라도 스냅샷을 다시 불러오는 최대 보관 시간 (초)
+SNAPSHOT_MAX_AGE_SEC = 300
+
+# candle_monitoring 프로세스가 지표를 갱신할 때마다 증가하는 공유 버전
+# fork된 자식 프로세스와 같은 공유 메모리를 바라보므로 프로세스 간 무효화가 가능
+_indicator_version = multiprocessing.Value("i", 0)
+
+_snapshot = None
+
+
+class IndicatorSnapshot:
+    """한 번의 모니터링 틱 동안 모든 스코어러가 공유하는 MA/RSI/MACD 데이터"""
+
+    def __init__(self, indicators, version):
+        self._indicators = indicators
+        self.version = version
+        self.loaded_at = time.monotonic()
+
+    def moving_average(self, type):
+        return self._indicators[type]["moving_average"]
+
+    def rsi(self, type):
+        return self._indicators[type]["rsi"]
+
+    def macd(self, type):
+        return self._indicators[type]["macd"]
+
+    def is_stale(self):
+        return (
+            self.version != _indicator_version.value
+            or time.monotonic() - self.loaded_at > SNAPSHOT_MAX_AGE_SEC
+        )
+
+
+def load_indicator_snapshot():
+    """
+    모든 타임프레임의 MA/RSI/MACD를 한 번에 조회하여 스냅샷 생성
+
+    스코어러는 이동평균의 최신 값만 사용하므로 ma_values 시계열은 받지 않는다.
+    (RSI 시계열은 다이버전스 분석에 필요) 벌크 엔드포인트 호출이 실패하면
+    지표별 개별 조회를 동시에 실행하는 방식으로 대체한다.
+    """
+    version = _indicator_version.value
+    try:
+        indicators = get_indicator_snapshot_api_call(
+            TIMEFRAMES, include_ma_values=False, include_rsi_values=True
+        )
+    except Exception as e:
+        logger.warning(f"벌크 지표 스냅샷 조회 실패, 개별 조회로 대체: {e}")
+        indicators = run_fetch_indicators(types=TIMEFRAMES, indicators=INDICATORS)
+
+    for type in TIMEFRAMES:
+        missing = [name for name in INDICATORS if not indicators[type].get(name)]
+        if missing:
+            raise Exception(f"{type} 타입의 지표 데이터가 없습니다: {missing}")
+
+    logger.info(f"지표 스냅샷 로드 완료. version: {version}")
+    return IndicatorSnapshot(indicators, version)
+
+
+def get_indicator_snapshot():
+    """
+    캐시된 지표 스냅샷 반환
+
+    candle_monitoring이 새 값을 저장했거나 보관 시간이 지난 경우에만 다시 조회한다.
+
+    Returns:
+        IndicatorSnapshot: 현재 유효한 지표 스냅샷
+    """
+    global _snapshot
+
+    if _snapshot is None or _snapshot.is_stale():
+        _snapshot = load_indicator_snapshot()
+
+    return _snapshot
+
+
+def invalidate_indicator_snapshot():
+    """지표가 갱신되었음을 모든 프로세스에 알림"""
+    with _indicator_version.get_lock():
+        _indicator_version.value += 1
@@ -0,0 +1,78 @@
+import os
+
+from api.api import create_indicator_archive
+from log_generator import set_logger
+
+logger = set_logger()
+
+# 지표/타임프레임별로 JSON 컬럼에 유지할 최대 시계열 포인트 수
+# hour1 30일, hour4 90일, day 400일, week 3년
+# 환경 변수 HISTORY_RETENTION_<지표>_<타입> (예: HISTORY_RETENTION_RSI_HOUR1=1000)으로 변경 가능
+DEFAULT_HISTORY_RETENTION = {
+    "moving_average": {"hour1": 720, "hour4": 540, "day": 400, "week": 156},
+    "rsi": {"hour1": 720, "hour4": 540, "day": 400, "week": 156},
+    "macd": {"hour1": 720, "hour4": 540, "day": 400, "week": 156},
+}
+
+
+def get_retention(indicator, type):
+    """
+    지표/타임프레임의 보관 포인트 수 조회
+
+    Args:
+        indicator (str): 'moving_average', 'rsi', 'macd'
+        type (str): 'hour1', 'hour4', 'day', 'week'
+
+    Returns:
+        int: JSON 컬럼에 유지할 최대 포인트 수
+    """
+    env_value = os.getenv(f"HISTORY_RETENTION_{indicator}_{type}".upper())
+    if env_value:
+        return int(env_value)
+    return DEFAULT_HISTORY_RETENTION[indicator][type]
+
+
+def archive_history(indicator, type, series):
+    """
+    보관 기간을 넘은 포인트를 백엔드 아카이브 테이블로 이동
+
+    이후 지표 갱신이 실패해 같은 포인트를 다시 보내도 백엔드는 시리즈 시작 시각 기준으로
+    기존 행을 갱신하므로 중복 저장되지 않는다.
+
+    Args:
+        indicator (str): 'moving_average', 'rsi', 'macd'
+        type (str): 'hour1', 'hour4', 'day', 'week'
+        series (dict): {시리즈 이름: [포인트 딕셔너리 리스트]}
+
+    Returns:
+        bool: 아카이브 저장 성공 여부 (실패하면 포인트를 잘라내지 않고 다음 주기에 재시도)
+    """
+    try:
+        create_indicator_archive(indicator=indicator, type=type, series=series)
+    except Exception as e:
+        logger.warning(f"{type} {indicator} 이력 보관 실패, 다음 갱신 시 재시도: {e}")
+        return False
+
+    point_count = sum(len(points) for points in series.values())
+    logger.info(f"{type} {indicator} 이력 {point_count}개 보관 완료")
+    return True
+
+
+def enforce_series_retention(indicator, type, series, keep):
+    """
+    시리즈별 리스트를 마지막 keep개만 남기고 잘라낸 앞부분은 아카이브
+
+    Args:
+        indicator (str): 'moving_average', 'rsi', 'macd'
+        type (str): 'hour1', 'hour4', 'day', 'week'
+        series (dict): {시리즈 이름: [포인트 딕셔너리 리스트]} (제자리에서 수정)
+        keep (int): 시리즈별로 유지할 포인트 수
+    """
+    archived = {
+        name: points[:-keep] for name, points in series.items() if len(points) > keep
+    }
+    if not archived or not archive_history(indicator, type, archived):
+        return
+
+    for name, points in archived.items():
+        del series[name][: len(points)]
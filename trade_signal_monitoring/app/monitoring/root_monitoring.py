@@ -1,6 +1,7 @@
 from init_setting_data.init_data import start_get_candle_process
 from .price_monitoring import trade_price_monitoring
 from .candle_monitoring import start_candle_monitoring
+from .tick_store import tick_store
 from log_generator import set_logger
 
 logger = set_logger()
@@ -13,4 +14,6 @@ def init_data():
 def start_update_monitoring():
     init_data()
     start_candle_monitoring()
+    # 지난 날짜 체결 집계는 현재가 모니터링 루프를 막지 않도록 백그라운드에서 진행
+    tick_store.start_background_refresh()
     trade_price_monitoring()
@@ -6,6 +6,7 @@ from ..calculation.moving_average import (
     ma_25_calc,
 )
 from ..calculation.rsi import rsi_calc
+from ..indicator_snapshot import get_indicator_snapshot
 from log_generator import set_logger
 
 logger = set_logger()
@@ -76,15 +77,17 @@ def normalize_scores(
 
 
 def first_step(current_price):
-    ts_score = calculate_trend_strength(current_price)
+    snapshot = get_indicator_snapshot()
 
-    mtf_score = analyze_multi_timeframes(current_price)
+    ts_score = calculate_trend_strength(current_price, snapshot)
 
-    ma_25_score = ma_25_calc(current_price)
+    mtf_score = analyze_multi_timeframes(current_price, snapshot)
 
-    rsi_score = rsi_calc()
+    ma_25_score = ma_25_calc(current_price, snapshot)
 
-    macd_score = macd_calc()
+    rsi_score = rsi_calc(snapshot)
+
+    macd_score = macd_calc(snapshot)
 
     volume_score = volume_signal_calc()
 
@@ -1,13 +1,9 @@
 import time
-from api.api import (
-    get_macd,
-    get_moving_average,
-    get_rsi,
-    get_trade_price_api_call,
-    get_candle_api_call,
-)
+from api.api import get_trade_price_api_call
 from ..calculation.atr import get_atr
 from ..calculation.volume import volume_signal_calc
+from ..candle_repository import candle_repository
+from ..indicator_snapshot import get_indicator_snapshot
 from log_generator import set_logger
 from collections import defaultdict
 
@@ -16,6 +12,9 @@ logger = set_logger()
 # 2단계 분석 진입을 위한 임계값
 FINAL_THRESHOLD = 8.0  # 3단계로 진행하기 위한 최소 점수
 
+# 타임프레임별 분석에 사용할 캔들 수
+CANDLE_COUNTS = {"hour1": 100, "hour4": 120, "day": 200, "week": 52}
+
 
 class SecondStepAnalysis:
     def __init__(self, first_step_signal, current_price):
@@ -35,21 +34,15 @@ class SecondStepAnalysis:
         self.details = {}
         self.timeframes = ["hour1", "hour4", "day", "week"]
 
+        # 캔들 버퍼에서 조회 (새로 열린 캔들만 업비트에 요청)
         self.candle_data = {
-            "hour1": get_candle_api_call(
-                "https://api.upbit.com/v1/candles/minutes/60", count=100
-            ),
-            "hour4": get_candle_api_call(
-                "https://api.upbit.com/v1/candles/minutes/240", count=120
-            ),
-            "day": get_candle_api_call(
-                "https://api.upbit.com/v1/candles/days", count=200
-            ),
-            "week": get_candle_api_call(
-                "https://api.upbit.com/v1/candles/weeks", count=52
-            ),
+            tf: candle_repository.get_candles(tf, count)
+            for tf, count in CANDLE_COUNTS.items()
         }
 
+        # 1단계와 같은 틱의 지표 스냅샷 공유 (candle_monitoring 갱신 시에만 재조회)
+        self.snapshot = get_indicator_snapshot()
+
         # 추가 데이터 로드
         self.atr_data = {tf: get_atr(tf) for tf in ["hour4", "day"]}
         self.volume_profile = volume_signal_calc()
@@ -83,7 +76,7 @@ class SecondStepAnalysis:
         price_to_ma_score = 0
         try:
             for tf in self.timeframes:
-                ma_data = get_moving_average(tf)
+                ma_data = self.snapshot.moving_average(tf)
 
                 # 골든/데드 크로스 감지 - 안전하게 개선
                 ma_25 = ma_data.get("ma_25")
@@ -179,7 +172,7 @@ class SecondStepAnalysis:
         rsi_details = {}
 
         for tf in self.timeframes:
-            rsi_data = get_rsi(tf)
+            rsi_data = self.snapshot.rsi(tf)
             rsi_value = rsi_data["current_rsi"]
             rsi_details[tf] = rsi_value
 
@@ -205,7 +198,7 @@ class SecondStepAnalysis:
         macd_details = {}
 
         for tf in ["hour4", "day"]:
-            macd_data = get_macd(tf)
+            macd_data = self.snapshot.macd(tf)
 
             latest_macd = (
                 macd_data["macd_line"][-1]
@@ -618,7 +611,7 @@ class SecondStepAnalysis:
                         sr_score -= 1  # 저항선 아래에 있음
 
         # 2. 주요 이동평균선 지지/저항 분석
-        ma_data = get_moving_average("hour4")
+        ma_data = self.snapshot.moving_average("hour4")
         key_mas = [
             ma_data.get(f"ma_{period}")
             for period in [50, 100, 200]
@@ -669,11 +662,11 @@ class SecondStepAnalysis:
             closes = [c["trade_price"] for c in candles[-20:]]
 
             # RSI 데이터 가져오기
-            rsi_data = get_rsi(tf)
+            rsi_data = self.snapshot.rsi(tf)
             rsi_values = rsi_data.get("rsi_values", [])
 
             # MACD 데이터 가져오기
-            macd_data = get_macd(tf)
+            macd_data = self.snapshot.macd(tf)
             macd_line = macd_data.get("macd_line", [])
 
             # 충분한 데이터가 있는지 확인
@@ -0,0 +1,289 @@
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from api.api import get_trade_ticks_api_call
+from log_generator import set_logger
+from .calculation.volume_aggregator import DailyVolumeAggregator
+
+logger = set_logger()
+
+TICK_STORE_PATH = "./tick_store"
+TICK_STORE_FILE_PREFIX = "volume-"
+
+# 업비트 체결 API 1회 요청 최대 개수
+TICKS_PER_REQUEST = 500
+
+# 업비트 체결 API 연속 호출 간격 (초, 시세 조회 API 초당 10회 제한)
+PAGE_INTERVAL_SEC = 0.15
+
+# 하루 페이지 수 상한 (500 x 2000 = 100만 체결)
+MAX_PAGES_PER_DAY = int(os.getenv("MAX_TICK_PAGES_PER_DAY", "2000"))
+
+# 업비트 체결 API는 최대 7일 전까지만 조회 가능
+MAX_DAYS_AGO = 7
+
+# 날짜가 바뀐 뒤(UTC 자정) 지난 날짜 집계를 시작하기까지 기다리는 시간 (초)
+REFRESH_DELAY_SEC = 60
+# 집계 실패/누락 날짜가 있을 때 다시 시도하는 간격 (초)
+REFRESH_RETRY_SEC = 300
+
+
+def iter_trade_tick_pages(days_ago, max_pages=MAX_PAGES_PER_DAY):
+    """
+    하루 전체 체결을 최신순 페이지로 반환하는 제너레이터
+
+    각 페이지의 마지막(가장 오래된) 체결의 sequential_id를 다음 요청의 cursor로 사용한다.
+
+    Args:
+        days_ago (int): 며칠 전 체결을 조회할지 (1 ~ 7)
+        max_pages (int): 최대 페이지 수
+
+    Yields:
+        list: 최신순 체결 데이터 리스트 (최대 500개)
+    """
+    cursor = None
+    for page_num in range(max_pages):
+        if page_num:
+            time.sleep(PAGE_INTERVAL_SEC)
+
+        page = get_trade_ticks_api_call(
+            days_ago, cursor=cursor, count=TICKS_PER_REQUEST
+        )
+        if not page:
+            return
+
+        yield page
+
+        if len(page) < TICKS_PER_REQUEST:
+            return
+        cursor = page[-1]["sequential_id"]
+
+
+class TickStore:
+    """
+    완료된 날짜의 일별 볼륨 지표를 날짜별 파일로 보관하는 저장소
+
+    지난 날짜의 체결은 바뀌지 않으므로 하루 전체 체결을 한 번만 페이지 단위로 받아
+    DailyVolumeAggregator로 집계하고, 체결 원본 대신 집계 결과만 저장한다.
+    하루 전체 페이지 조회는 수 분이 걸리므로 백그라운드 스레드(start_background_refresh)에서
+    미리 집계하고, 모니터링 루프는 집계가 끝난 날짜만 읽는다.
+    """
+
+    def __init__(self, path=TICK_STORE_PATH, max_pages=MAX_PAGES_PER_DAY):
+        self.path = path
+        self.max_pages = max_pages
+        self._memory = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        os.makedirs(self.path, exist_ok=True)
+
+    def _file_path(self, date):
+        return os.path.join(
+            self.path, f"{TICK_STORE_FILE_PREFIX}{date.isoformat()}.json"
+        )
+
+    def _load_day(self, date):
+        if date in self._memory:
+            return self._memory[date]
+
+        file_path = self._file_path(date)
+        if not os.path.exists(file_path):
+            return None
+
+        try:
+            with open(file_path, encoding="utf-8") as f:
+                summary = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"체결 캐시 파일 읽기 실패({file_path}): {e}")
+            return None
+
+        # JSON 객체 키는 문자열이므로 시간대 키를 정수로 복원
+        hourly_stats = summary["metrics"]["hourly_stats"]
+        summary["metrics"]["hourly_stats"] = {
+            int(hour): stats for hour, stats in hourly_stats.items()
+        }
+
+        self._memory[date] = summary
+        return summary
+
+    def _save_day(self, date, summary):
+        self._memory[date] = summary
+
+        # 페이지 상한에서 잘린 날짜는 메모리에만 두고 파일로 남기지 않음
+        # (재시작 시 상한을 늘려 다시 집계할 수 있도록)
+        if summary["truncated"]:
+            return
+
+        # 임시 파일에 쓴 뒤 교체하여 중간에 종료되어도 깨진 파일이 남지 않도록 함
+        file_path = self._file_path(date)
+        tmp_path = f"{file_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(summary, f)
+        os.replace(tmp_path, file_path)
+
+    def _prune(self, oldest_date):
+        for date in [date for date in self._memory if date < oldest_date]:
+            del self._memory[date]
+
+        for file_name in os.listdir(self.path):
+            if not file_name.endswith(".json"):
+                continue
+            try:
+                date = datetime.strptime(
+                    file_name[len(TICK_STORE_FILE_PREFIX) : -5], "%Y-%m-%d"
+                ).date()
+            except ValueError:
+                # 이전 형식(체결 원본)의 캐시 파일
+                date = None
+            if date is None or date < oldest_date:
+                os.remove(os.path.join(self.path, file_name))
+
+    def _aggregate_day(self, days_ago):
+        aggregator = DailyVolumeAggregator(day_num=days_ago)
+        last_page_size = 0
+        started_at = time.monotonic()
+
+        for page in iter_trade_tick_pages(days_ago, max_pages=self.max_pages):
+            aggregator.add_page(page)
+            last_page_size = len(page)
+
+        if not aggregator.count:
+            return None
+
+        truncated = (
+            aggregator.pages >= self.max_pages and last_page_size == TICKS_PER_REQUEST
+        )
+        logger.info(
+            f"day_ago_{days_ago} 체결 집계 완료: {aggregator.pages}페이지, "
+            f"{aggregator.count}건, {time.monotonic() - started_at:.1f}초"
+            + (" (페이지 상한 도달)" if truncated else "")
+        )
+
+        return {
+            "metrics": aggregator.metrics(),
+            "current_data": aggregator.current_data(),
+            "pages": aggregator.pages,
+            "ticks": aggregator.count,
+            "truncated": truncated,
+        }
+
+    def refresh(self, days=MAX_DAYS_AGO):
+        """
+        아직 집계하지 않은 지난 날짜의 체결을 받아 집계 결과를 저장
+
+        페이지 조회 동안에는 잠금을 잡지 않으므로 get_daily_volume_metrics는 기다리지 않는다.
+
+        Args:
+            days (int): 집계할 일수 (1 ~ 7)
+
+        Returns:
+            int: 집계하지 못한 날짜 수 (체결 없음 또는 조회 실패)
+        """
+        today = datetime.now(timezone.utc).date()
+        missing = 0
+
+        for days_ago in range(1, days + 1):
+            date = today - timedelta(days=days_ago)
+            with self._lock:
+                if self._load_day(date) is not None:
+                    continue
+
+            try:
+                summary = self._aggregate_day(days_ago)
+            except Exception as e:
+                logger.warning(f"day_ago_{days_ago} 체결 집계 실패: {e}")
+                summary = None
+
+            if summary is None:
+                missing += 1
+                continue
+
+            with self._lock:
+                self._save_day(date, summary)
+
+        with self._lock:
+            self._prune(today - timedelta(days=MAX_DAYS_AGO))
+
+        return missing
+
+    def _run(self, days):
+        while True:
+            missing = self.refresh(days)
+
+            if missing:
+                wait = REFRESH_RETRY_SEC
+            else:
+                # 다음 UTC 자정 이후 새로 완료된 날짜 집계
+                now = datetime.now(timezone.utc)
+                next_day = datetime.combine(
+                    now.date() + timedelta(days=1), datetime.min.time(), timezone.utc
+                )
+                wait = (next_day - now).total_seconds() + REFRESH_DELAY_SEC
+            time.sleep(wait)
+
+    def start_background_refresh(self, days=MAX_DAYS_AGO):
+        """지난 날짜 체결 집계를 백그라운드 스레드에서 시작 (이미 실행 중이면 무시)"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, args=(days,), name="tick-store-refresh", daemon=True
+            )
+            self._thread.start()
+
+    def get_daily_volume_metrics(self, days=MAX_DAYS_AGO):
+        """
+        최근 완료된 날짜들의 일별 볼륨 지표 반환
+
+        집계가 끝난 날짜만 포함하며 체결 API는 호출하지 않는다.
+
+        Args:
+            days (int): 조회할 일수 (1 ~ 7)
+
+        Returns:
+            tuple: (daily_metrics, data_quality, current_data)
+                daily_metrics: {'day_ago_N': 일별 볼륨 지표}
+                data_quality: days_count, total_ticks, pages_consumed, ticks_consumed,
+                              truncated_days, missing_days
+                current_data: {'day_ago_N': 해당 날짜의 마지막 체결 정보}
+        """
+        today = datetime.now(timezone.utc).date()
+        daily_metrics = {}
+        current_data = {}
+        data_quality = {
+            "days_count": days,
+            "total_ticks": 0,
+            "pages_consumed": 0,
+            "ticks_consumed": 0,
+            "truncated_days": [],
+            "missing_days": [],
+        }
+
+        with self._lock:
+            for days_ago in range(1, days + 1):
+                day_key = f"day_ago_{days_ago}"
+                date = today - timedelta(days=days_ago)
+
+                summary = self._load_day(date)
+                if summary is None:
+                    # 아직 백그라운드 집계 전인 날짜
+                    data_quality["missing_days"].append(day_key)
+                    continue
+
+                # 같은 지표라도 날짜 기준 위치(day_num)는 조회 시점에 따라 달라짐
+                daily_metrics[day_key] = {**summary["metrics"], "day_num": days_ago}
+                current_data[day_key] = summary["current_data"]
+
+                data_quality["total_ticks"] += summary["ticks"]
+                data_quality["pages_consumed"] += summary["pages"]
+                data_quality["ticks_consumed"] += summary["ticks"]
+                if summary["truncated"]:
+                    data_quality["truncated_days"].append(day_key)
+
+        return daily_metrics, data_quality, current_data
+
+
+tick_store = TickStore()
@@ -1,28 +1,62 @@
+import math
+from collections import deque
+
 import numpy as np
+import orjson
+
+# NumPy 스칼라/배열을 변환 없이 직렬화
+JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
 
+def _json_default(obj):
+    # update_macd 결과처럼 deque로 보관하는 시계열
+    if isinstance(obj, deque):
+        return list(obj)
+    raise TypeError(f"JSON으로 직렬화할 수 없는 타입: {type(obj).__name__}")
+
+
+def _find_non_finite(obj):
+    """NaN/Infinity 값의 위치를 찾는 함수 (없으면 None, 경로는 찾은 뒤에만 구성)"""
+    if isinstance(obj, (float, np.floating)):
+        return None if math.isfinite(obj) else ""
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            found = _find_non_finite(value)
+            if found is not None:
+                return f".{key}{found}"
+    elif isinstance(obj, (list, tuple, deque)):
+        for index, value in enumerate(obj):
+            found = _find_non_finite(value)
+            if found is not None:
+                return f"[{index}]{found}"
+    elif isinstance(obj, np.ndarray) and np.issubdtype(obj.dtype, np.floating):
+        if not np.isfinite(obj).all():
+            return ""
+    return None
 
-def convert_numpy_types(obj):
+
+def dumps_json(obj):
     """
-    NumPy 타입을 Python 기본 타입으로 변환하는 재귀 함수
+    지표 계산 결과를 백엔드로 보낼 JSON 바이트로 직렬화하는 함수
+
+    NumPy 타입을 Python 기본 타입으로 바꾸는 재귀 변환 없이 orjson이 바로 직렬화한다.
+    orjson은 NaN/Infinity를 null로 바꾸지만 백엔드 스키마는 float이므로,
+    requests의 json.dumps(allow_nan=False)처럼 보내기 전에 거부한다.
+    NaN/Infinity가 있으면 결과에 null이 생기므로 null이 있을 때만 원본을 순회해 확인한다.
 
     Args:
-        obj: 변환할 객체 (딕셔너리, 리스트, NumPy 값 등)
+        obj: 직렬화할 객체 (딕셔너리, 리스트, NumPy 값 등)
 
     Returns:
-        변환된 객체
-    """
+        bytes: UTF-8 JSON
 
-    if isinstance(obj, dict):
-        return {key: convert_numpy_types(value) for key, value in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_numpy_types(item) for item in obj]
-    elif isinstance(obj, (np.integer, np.int64, np.int32)):
-        return int(obj)
-    elif isinstance(obj, (np.floating, np.float64, np.float32)):
-        return float(obj)
-    elif isinstance(obj, np.ndarray):
-        return convert_numpy_types(obj.tolist())
-    elif isinstance(obj, np.bool_):
-        return bool(obj)
-    else:
-        return obj
+    Raises:
+        ValueError: NaN/Infinity 값이 있는 경우
+    """
+    data = orjson.dumps(obj, default=_json_default, option=JSON_OPTIONS)
+    if b"null" in data:
+        path = _find_non_finite(obj)
+        if path is not None:
+            location = path.lstrip(".") or "최상위 값"
+            raise ValueError(f"JSON으로 보낼 수 없는 NaN/Infinity 값: {location}")
+    return data
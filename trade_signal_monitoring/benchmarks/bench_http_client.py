@@ -0,0 +1,112 @@
+"""
+모니터링 1틱(first_step + SecondStepAnalysis)에서 발생하는 HTTP 호출 시간 벤치마크
+
+로컬 HTTP/1.1 서버를 띄워 1틱 동안의 호출 패턴을 그대로 재현하고,
+매 호출마다 새 커넥션을 여는 requests.get 방식과 공유 세션(keep-alive) 방식을 비교한다.
+TLS 핸드셰이크가 포함되는 업비트 호출은 실제 환경에서 차이가 더 크게 난다.
+
+실행: python benchmarks/bench_http_client.py
+"""
+
+import json
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
+
+from api.http_client import close_session, get_session  # noqa: E402
+
+TICKS = 20
+
+# 1틱 동안의 호출 패턴 (메서드, 경로)
+TICK_CALLS = (
+    # first_step
+    [("GET", "/api/moving-averages/hour4")] * 3
+    + [("GET", "/api/moving-averages/hour1"), ("GET", "/api/moving-averages/day")]
+    + [("GET", "/api/rsi/hour1"), ("GET", "/api/rsi/hour4"), ("GET", "/api/macd/hour4")]
+    + [("GET", "/v1/trades/ticks")] * 7
+    # SecondStepAnalysis
+    + [("GET", "/v1/ticker")]
+    + [("GET", "/v1/candles")] * 6
+    + [("GET", "/v1/trades/ticks")] * 7
+    + [("GET", "/api/moving-averages/tf")] * 5
+    + [("GET", "/api/rsi/tf")] * 6
+    + [("GET", "/api/macd/tf")] * 4
+    # 실시간 로그
+    + [("POST", "/api/logs")] * 5
+)
+
+PAYLOAD = json.dumps(
+    {"ma_values": {"ma_7": [{"value": 1.0, "price": 1.0}] * 200}}
+).encode()
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # 헤더/본문 분할 전송 시 Nagle + delayed ACK 지연이 측정에 섞이지 않도록 비활성화
+    disable_nagle_algorithm = True
+
+    def _reply(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(PAYLOAD)
+
+    do_GET = _reply
+    do_POST = _reply
+
+    def log_message(self, *args):
+        pass
+
+
+def run_tick(base_url, client):
+    for method, path in TICK_CALLS:
+        if method == "GET":
+            response = client.get(base_url + path)
+        else:
+            response = client.post(base_url + path, json={"message": "bench"})
+        response.raise_for_status()
+
+
+def measure(base_url, client):
+    samples = []
+    for _ in range(TICKS):
+        start = time.perf_counter()
+        run_tick(base_url, client)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    before = measure(base_url, requests)
+    after = measure(base_url, get_session())
+    close_session()
+    server.shutdown()
+
+    print(f"1틱 호출 수: {len(TICK_CALLS)}, 반복: {TICKS}")
+    for name, samples in (
+        ("requests.get (before)", before),
+        ("세션 풀 (after)", after),
+    ):
+        print(
+            f"{name:<24} median {statistics.median(samples):8.2f} ms  "
+            f"p95 {sorted(samples)[int(len(samples) * 0.95) - 1]:8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
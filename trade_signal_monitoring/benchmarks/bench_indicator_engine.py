@@ -0,0 +1,134 @@
+"""
+init_setting_data 초기 지표 계산 벤치마크
+
+타임프레임별 초기 데이터 캔들 수만큼 캔들을 만들어 기존 방식(moving_average → macd → rsi,
+지표마다 DataFrame 생성 + convert_numpy_types)과 calculate_indicators(캔들을 한 번만
+배열로 변환)의 결과가 같은지 확인하고 타임프레임별 초기 계산 시간을 비교한다.
+
+실행: python benchmarks/bench_indicator_engine.py
+"""
+
+import json
+import logging
+import math
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
+
+from init_setting_data.calculation.indicator_engine import (  # noqa: E402
+    calculate_indicators,
+)
+from init_setting_data.calculation.macd import macd  # noqa: E402
+from init_setting_data.calculation.moving_average import (  # noqa: E402
+    moving_average,
+)
+from init_setting_data.calculation.rsi import rsi  # noqa: E402
+
+# (캔들 간격, init_data의 초기 데이터 캔들 수)
+TIMEFRAMES = {
+    "day": (timedelta(days=1), 200),
+    "week": (timedelta(weeks=1), 52),
+    "hour4": (timedelta(hours=4), 180),
+    "hour1": (timedelta(hours=1), 168),
+}
+RUNS = 50
+TOLERANCE = 0.011  # 이동평균 round(2) 경계 차이 허용
+
+
+def make_candles(count, interval, seed=7):
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1)
+    price = 120_000_000.0
+    candles = []
+    for i in range(count):
+        price = max(1_000_000.0, price + rng.gauss(0, 400_000))
+        candles.append(
+            {
+                "candle_date_time_utc": (start + interval * i).isoformat(),
+                "candle_date_time_kst": (
+                    start + interval * i + timedelta(hours=9)
+                ).isoformat(),
+                "trade_price": round(price, -3),
+            }
+        )
+    # 업비트 응답과 같은 최신순
+    return candles[::-1]
+
+
+def legacy_indicators(candles, type):
+    moving_average_result = moving_average(candles=candles, type=type)
+    return {
+        "moving_average": moving_average_result,
+        "macd": macd(type=type, ma_values_data=moving_average_result["ma_values"]),
+        "rsi": rsi(candles, type),
+    }
+
+
+def max_difference(got, want, path="", ignore=("last_updated",)):
+    """두 결과의 구조/타입이 같은지 확인하고 숫자 값의 최대 차이 반환"""
+    assert type(got) is type(want), (path, type(got), type(want))
+    if isinstance(want, dict):
+        assert got.keys() == want.keys(), (path, got.keys() ^ want.keys())
+        return max(
+            (
+                max_difference(got[key], want[key], f"{path}.{key}")
+                for key in want
+                if key not in ignore
+            ),
+            default=0.0,
+        )
+    if isinstance(want, list):
+        assert len(got) == len(want), (path, len(got), len(want))
+        return max(
+            (
+                max_difference(g, w, f"{path}[{i}]")
+                for i, (g, w) in enumerate(zip(got, want))
+            ),
+            default=0.0,
+        )
+    if isinstance(want, float):
+        if math.isnan(want):
+            assert math.isnan(got), path
+            return 0.0
+        return abs(got - want)
+    assert got == want, (path, got, want)
+    return 0.0
+
+
+def measure(function, candles, type):
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        function(candles, type)
+    return (time.perf_counter() - start) / RUNS * 1000
+
+
+def main():
+    # 계산마다 남기는 로그(파일/콘솔 출력)가 계산 시간보다 커서 측정에서 제외
+    logging.disable(logging.WARNING)
+
+    print(f"타임프레임별 초기 계산 시간 (평균 {RUNS}회)")
+    for type, (interval, count) in TIMEFRAMES.items():
+        candles = make_candles(count, interval)
+
+        got = calculate_indicators(candles, type)
+        want = legacy_indicators(candles, type)
+        difference = max_difference(got, want)
+        assert difference <= TOLERANCE, difference
+        # 변환 없이 바로 JSON 직렬화 가능
+        json.dumps(got)
+
+        legacy_ms = measure(legacy_indicators, candles, type)
+        engine_ms = measure(calculate_indicators, candles, type)
+        print(
+            f"{type:<6} 캔들 {count:>3}개  기존 {legacy_ms:7.2f} ms  "
+            f"엔진 {engine_ms:6.2f} ms  ({legacy_ms / engine_ms:5.1f}배)  "
+            f"최대 차이 {difference:.2e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
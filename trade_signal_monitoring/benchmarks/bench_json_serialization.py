@@ -0,0 +1,136 @@
+"""
+백엔드로 보내는 이동평균 페이로드 직렬화 벤치마크
+
+타임프레임별 보관 기간(monitoring.retention)만큼 ma_values가 쌓인 이동평균 페이로드를
+만들고, 이전 방식(convert_numpy_types 재귀 변환 + requests의 json.dumps)과
+dumps_json(orjson, NumPy 타입 직접 직렬화)의 직렬화 시간을 비교한다.
+이전 pandas 계산처럼 값이 NumPy 스칼라인 페이로드와 Python 기본 타입 페이로드를 모두 측정한다.
+
+실행: python benchmarks/bench_json_serialization.py
+"""
+
+import json
+import logging
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
+
+from init_setting_data.calculation.indicator_engine import (  # noqa: E402
+    calculate_indicators,
+)
+from init_setting_data.calculation.moving_average import MA_PERIODS  # noqa: E402
+from monitoring.retention import get_retention  # noqa: E402
+from utils import dumps_json  # noqa: E402
+
+TIMEFRAMES = {
+    "hour1": timedelta(hours=1),
+    "hour4": timedelta(hours=4),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+}
+RUNS = 50
+
+
+def make_candles(count, interval, seed=7):
+    rng = random.Random(seed)
+    start = datetime(2020, 1, 1)
+    price = 120_000_000.0
+    candles = []
+    for i in range(count):
+        price = max(1_000_000.0, price + rng.gauss(0, 400_000))
+        candles.append(
+            {
+                "candle_date_time_utc": (start + interval * i).isoformat(),
+                "candle_date_time_kst": (
+                    start + interval * i + timedelta(hours=9)
+                ).isoformat(),
+                "trade_price": round(price, -3),
+            }
+        )
+    return candles[::-1]
+
+
+def convert_numpy_types(obj):
+    """이전 utils.convert_numpy_types"""
+    if isinstance(obj, dict):
+        return {key: convert_numpy_types(value) for key, value in obj.items()}
+    elif isinstance(obj, list):
+        return [convert_numpy_types(item) for item in obj]
+    elif isinstance(obj, (np.integer, np.int64, np.int32)):
+        return int(obj)
+    elif isinstance(obj, (np.floating, np.float64, np.float32)):
+        return float(obj)
+    elif isinstance(obj, np.ndarray):
+        return convert_numpy_types(obj.tolist())
+    elif isinstance(obj, np.bool_):
+        return bool(obj)
+    else:
+        return obj
+
+
+def legacy_dumps(payload):
+    # requests는 json= 본문을 json.dumps(allow_nan=False)로 직렬화
+    return json.dumps(convert_numpy_types(payload), allow_nan=False).encode()
+
+
+def with_numpy_scalars(payload):
+    """이전 pandas 계산(iterrows)처럼 숫자 값을 NumPy 스칼라로 바꾼 페이로드"""
+    result = dict(payload)
+    result["ma_values"] = {
+        key: [
+            {
+                "timestamp": point["timestamp"],
+                "value": np.float64(point["value"]),
+                "price": np.float64(point["price"]),
+            }
+            for point in points
+        ]
+        for key, points in payload["ma_values"].items()
+    }
+    return result
+
+
+def measure(function, payload):
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        function(payload)
+    return (time.perf_counter() - start) / RUNS * 1000
+
+
+def main():
+    logging.disable(logging.WARNING)
+
+    print(f"이동평균 페이로드 직렬화 시간 (평균 {RUNS}회)")
+    for type, interval in TIMEFRAMES.items():
+        periods = MA_PERIODS[type]
+        longest = max(periods["long_term"], *periods["add_periods"])
+        count = get_retention("moving_average", type) + longest - 1
+        payload = calculate_indicators(make_candles(count, interval), type)[
+            "moving_average"
+        ]
+        numpy_payload = with_numpy_scalars(payload)
+
+        assert json.loads(dumps_json(numpy_payload)) == json.loads(
+            legacy_dumps(numpy_payload)
+        )
+        points = sum(len(points) for points in payload["ma_values"].values())
+        size_kb = len(dumps_json(payload)) / 1024
+
+        print(f"{type:<6} 포인트 {points:>5}개 ({size_kb:6.1f} KB)")
+        for name, data in (("NumPy 스칼라", numpy_payload), ("Python 타입", payload)):
+            legacy_ms = measure(legacy_dumps, data)
+            current_ms = measure(dumps_json, data)
+            print(
+                f"  {name:<10} 변환+json.dumps {legacy_ms:7.2f} ms  "
+                f"dumps_json {current_ms:6.2f} ms  ({legacy_ms / current_ms:5.1f}배)"
+            )
+
+
+if __name__ == "__main__":
+    main()
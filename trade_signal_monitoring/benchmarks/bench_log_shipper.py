@@ -0,0 +1,151 @@
+"""
+모니터링 1틱에서 실시간 로그 5개를 보내는 데 걸리는 시간 벤치마크
+
+로컬 HTTP/1.1 서버를 백엔드로 띄우고 응답 지연(BACKEND_DELAY_SEC)을 준 상태에서
+매 로그마다 동기 POST /api/logs를 보내던 방식과 RealtimeLogShipper(대기열 + 배치 전송)를 비교한다.
+백엔드가 내려간 경우(연결 거부)에는 이전 방식은 예외로 모니터링 루프가 멈추고,
+현재 방식은 대기열에만 쌓이고 바로 반환되는지 확인한다.
+백엔드가 4xx로 거부한 배치는 버리고 다음 로그를 보내며, 5xx 응답만 재시도하는지도 확인한다.
+
+실행: python benchmarks/bench_log_shipper.py
+"""
+
+import statistics
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
+
+from api.http_client import close_session, get_session  # noqa: E402
+from api.log_shipper import RealtimeLogShipper  # noqa: E402
+
+TICKS = 20
+LOGS_PER_TICK = 5
+BACKEND_DELAY_SEC = 0.03
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    requests = 0
+    # 앞에서부터 꺼내 응답할 상태 코드 (비어 있으면 200)
+    statuses = []
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        time.sleep(BACKEND_DELAY_SEC)
+        Handler.requests += 1
+        self.send_response(Handler.statuses.pop(0) if Handler.statuses else 200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+def log_body(index):
+    return {
+        "message": f"1단계 분석 결과 {index}",
+        "module": "trade",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def legacy_post(base_url, index):
+    """이전 post_realtime_log (로그마다 동기 POST, 실패 시 예외)"""
+    response = get_session().post(f"{base_url}/api/logs", json=log_body(index))
+    response.raise_for_status()
+
+
+def measure(send):
+    samples = []
+    for _ in range(TICKS):
+        start = time.perf_counter()
+        for index in range(LOGS_PER_TICK):
+            send(index)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(name, samples, requests):
+    print(
+        f"{name:<24} median {statistics.median(samples):8.2f} ms  "
+        f"max {max(samples):8.2f} ms  백엔드 요청 {requests}개"
+    )
+
+
+def check_status_handling(base_url):
+    """4xx 배치는 버리고 다음 배치를 보내며, 5xx는 재시도해서 보내는지 확인"""
+    for status, sent, dropped in ((422, 1, 1), (503, 2, 0)):
+        Handler.statuses = [status]
+        shipper = RealtimeLogShipper(
+            url=f"{base_url}/api/logs/batch", batch_size=1, backoff_initial=0.01
+        )
+        shipper.ship(log_body(0))
+        shipper.ship(log_body(1))
+        deadline = time.monotonic() + 5
+        while shipper.sent + shipper.dropped < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        shipper.close()
+        stats = shipper.stats()
+        assert (stats["sent"], stats["dropped"]) == (sent, dropped), (status, stats)
+        print(
+            f"백엔드 {status} 응답 시: 전송 {stats['sent']}개, 버림 {stats['dropped']}개, "
+            f"재시도 {stats['failed_attempts']}회"
+        )
+
+
+def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    print(
+        f"1틱 로그 {LOGS_PER_TICK}개, 반복 {TICKS}회, "
+        f"백엔드 응답 지연 {BACKEND_DELAY_SEC * 1000:.0f} ms"
+    )
+
+    report(
+        "동기 POST (이전)",
+        measure(lambda index: legacy_post(base_url, index)),
+        Handler.requests,
+    )
+
+    Handler.requests = 0
+    shipper = RealtimeLogShipper(url=f"{base_url}/api/logs/batch")
+    samples = measure(lambda index: shipper.ship(log_body(index)))
+    shipper.close()
+    report("발송기 대기열 (현재)", samples, Handler.requests)
+
+    check_status_handling(base_url)
+
+    server.shutdown()
+    server.server_close()
+    close_session()
+
+    # 백엔드 중단 (연결 거부)
+    try:
+        legacy_post(base_url, 0)
+        print("백엔드 중단 시 이전 방식: 예외 없음")
+    except Exception as e:
+        print(f"백엔드 중단 시 이전 방식: {type(e).__name__} (모니터링 루프 종료)")
+
+    shipper = RealtimeLogShipper(url=f"{base_url}/api/logs/batch")
+    samples = measure(lambda index: shipper.ship(log_body(index)))
+    print(
+        f"백엔드 중단 시 현재 방식: 1틱 median {statistics.median(samples):.3f} ms, "
+        f"대기 {shipper.stats()['queued']}개"
+    )
+    shipper.close(timeout=0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+update_macd 증분 계산 검증 및 벤치마크
+
+이동평균 이력 길이(200, 1만, 10만)별로 ma_12/ma_26 시계열을 만든 뒤 캔들을 하나씩
+추가하면서 update_macd(마지막 시그널 EMA에서 포인트 하나만 추가)와 매번 전체 이력으로
+DataFrame을 다시 만드는 macd 전체 재계산의 1회 갱신 시간(PATCH 본문 생성 포함)을 비교한다.
+진행 중 캔들이 같은 시각의 새 값으로 교체되는 경우도 함께 갱신하고, 마지막에 전체 이력에
+대한 pandas ewm(adjust=False) 결과와 부동소수점 오차 이내로 같은지 확인한다.
+
+실행: python benchmarks/bench_macd_engine.py
+"""
+
+import logging
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
+
+from monitoring.calculation import macd as macd_module  # noqa: E402
+from monitoring.calculation.macd import (  # noqa: E402
+    build_macd_delta,
+    macd,
+    update_macd,
+)
+
+TYPE = "hour1"
+HISTORY_LENGTHS = [200, 10_000, 100_000]
+UPDATES = 300
+FULL_RECOMPUTE_RUNS = {200: 50, 10_000: 10, 100_000: 3}
+TOLERANCE = 1e-6
+
+
+def make_ma_points(count, seed=7):
+    """종가 랜덤 워크의 12/26 이동평균 포인트 (round(2), MA 모듈과 같은 형식)"""
+    rng = random.Random(seed)
+    start = datetime(2010, 1, 1)
+    price = 120_000_000.0
+    prices = []
+    points = {"ma_12": [], "ma_26": []}
+    for i in range(count + 26):
+        price = max(1_000_000.0, price + rng.gauss(0, 400_000))
+        prices.append(round(price, -3))
+        if len(prices) < 26:
+            continue
+        timestamp = (start + timedelta(hours=i)).isoformat()
+        for period in (12, 26):
+            points[f"ma_{period}"].append(
+                {
+                    "timestamp": timestamp,
+                    "value": round(sum(prices[-period:]) / period, 2),
+                    "price": prices[-1],
+                }
+            )
+    return {key: values[:count] for key, values in points.items()}
+
+
+def legacy_build_macd_delta(macd_data, since):
+    """이전 build_macd_delta (보관 중인 모든 포인트의 시각을 파싱)"""
+    since = datetime.fromisoformat(since)
+    return [
+        date for date in macd_data["dates"] if datetime.fromisoformat(date) >= since
+    ]
+
+
+def run(history_length):
+    series = make_ma_points(history_length + UPDATES)
+    ma_values = {key: values[:history_length] for key, values in series.items()}
+    last_timestamp = ma_values["ma_12"][-1]["timestamp"]
+
+    # 전체 재계산 (이전 방식: 갱신마다 macd + 전체 포인트 시각 파싱)
+    runs = FULL_RECOMPUTE_RUNS[history_length]
+    start = time.perf_counter()
+    for _ in range(runs):
+        legacy_build_macd_delta(macd(TYPE, ma_values), last_timestamp)
+    full_sec = (time.perf_counter() - start) / runs
+
+    # 상태가 없으므로 첫 호출은 전체 재계산으로 상태 구성
+    macd_module._macd_states.clear()
+    update_macd(TYPE, ma_values, last_timestamp)
+
+    incremental_sec = 0.0
+    for i in range(history_length, history_length + UPDATES):
+        short_point = series["ma_12"][i]
+        long_point = series["ma_26"][i]
+        timestamp = short_point["timestamp"]
+
+        # 진행 중 캔들 값으로 먼저 추가된 뒤 같은 시각의 최종 값으로 교체되는 경우
+        if i % 5 == 0:
+            ma_values["ma_12"].append(
+                {**short_point, "value": short_point["value"] + 5e5}
+            )
+            ma_values["ma_26"].append(long_point)
+            update_macd(TYPE, ma_values, timestamp)
+            ma_values["ma_12"][-1] = short_point
+        else:
+            ma_values["ma_12"].append(short_point)
+            ma_values["ma_26"].append(long_point)
+
+        start = time.perf_counter()
+        result = update_macd(TYPE, ma_values, timestamp)
+        delta = build_macd_delta(result, timestamp)
+        incremental_sec += time.perf_counter() - start
+        assert [point["timestamp"] for point in delta["points"]] == [timestamp]
+
+    expected = macd(TYPE, ma_values)
+    assert list(result["dates"]) == expected["dates"]
+    max_error = max(
+        abs(got - want)
+        for key in ("macd_line", "signal_line", "histogram")
+        for got, want in zip(result[key], expected[key])
+    )
+    assert max_error <= TOLERANCE, max_error
+
+    print(f"이동평균 이력 {history_length:>7,}개")
+    print(f"  전체 재계산 최대 오차 : {max_error:.3e}")
+    print(f"  전체 재계산 1회       : {full_sec * 1e3:10.3f} ms")
+    print(f"  증분 갱신 1회         : {incremental_sec / UPDATES * 1e3:10.3f} ms")
+
+
+def main():
+    # 갱신마다 남기는 로그(파일/콘솔 출력)가 계산 시간보다 커서 측정에서 제외
+    logging.disable(logging.WARNING)
+
+    print(f"{TYPE}: 증분 갱신 {UPDATES}회 (5회마다 진행 중 캔들 교체 포함)")
+    for history_length in HISTORY_LENGTHS:
+        run(history_length)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+update_moving_average 증분 계산 검증 및 벤치마크
+
+init_setting_data의 pandas 이동평균으로 초기 데이터를 만든 뒤 캔들을 하나씩
+update_moving_average로 추가하면서, 매 단계의 최신 MA 값이 전체 캔들에 대한
+pandas rolling().mean() 결과와 같은지 확인한다. 진행 중 캔들이 같은 시각의 새 값으로
+교체되는 경우도 함께 검증하고, 1회 갱신 시간을 pandas 전체 재계산과 비교한다.
+재시작 직후처럼 윈도우 상태가 없을 때 캔들 버퍼로 과거 종가를 보충해 윈도우를 다시
+구성하는 경로도 검증한다. (버퍼에 저장된 마지막 포인트 이후의 진행 중 캔들이 있는 경우)
+
+실행: python benchmarks/bench_moving_average.py
+"""
+
+import random
+import sys
+
+import pandas as pd
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
+
+from init_setting_data.calculation.moving_average import (  # noqa: E402
+    moving_average,
+)
+from monitoring.calculation import moving_average as moving_average_module  # noqa: E402
+from monitoring.calculation.moving_average import update_moving_average  # noqa: E402
+
+TIMEFRAMES = {"hour1": (168, timedelta(hours=1)), "hour4": (180, timedelta(hours=4))}
+# 초기 데이터 캔들 수 = 가장 긴 윈도우라서 저장된 ma_values만으로 윈도우를 채우지 못하는 타임프레임
+REBUILD_TIMEFRAMES = {"day": (200, timedelta(days=1)), "week": (52, timedelta(weeks=1))}
+UPDATES = 500
+TOLERANCE = 0.011  # round(2) 경계 차이 허용
+
+
+def make_candles(count, interval, seed=7):
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1)
+    price = 120_000_000.0
+    candles = []
+    for i in range(count):
+        price = max(1_000_000.0, price + rng.gauss(0, 400_000))
+        candles.append(
+            {
+                "candle_date_time_utc": (start + interval * i).isoformat(),
+                "trade_price": round(price, -3),
+            }
+        )
+    return candles
+
+
+class BufferedCandles:
+    """candle_repository 대신 최신순 캔들 버퍼를 돌려주는 저장소"""
+
+    def __init__(self, candles):
+        self.candles = candles
+
+    def get_candles(self, timeframe, count):
+        return self.candles[::-1][:count]
+
+
+def expected_means(candles, periods):
+    prices = pd.Series([candle["trade_price"] for candle in candles])
+    return {
+        period: prices.rolling(window=period).mean().round(2).tolist()
+        for period in periods
+    }
+
+
+def check_rebuild():
+    """윈도우 상태 없이 진행 중 캔들 → 마감 값 → 다음 캔들 순서로 갱신"""
+    original_repository = moving_average_module.candle_repository
+    try:
+        for type, (init_count, interval) in REBUILD_TIMEFRAMES.items():
+            candles = make_candles(init_count + 2, interval)
+            ma_data = moving_average(candles[:init_count][::-1], type)
+            periods = [int(key[3:]) for key in ma_data["ma_values"]]
+            expected = expected_means(candles, periods)
+
+            new_candle = candles[init_count]
+            open_candle = {**new_candle, "trade_price": new_candle["trade_price"] + 5e5}
+            # 업비트 버퍼에는 저장된 마지막 포인트 이후의 진행 중 캔들까지 들어 있음
+            moving_average_module.candle_repository = BufferedCandles(
+                candles[:init_count] + [open_candle]
+            )
+
+            max_error = 0.0
+            steps = [
+                (
+                    open_candle,
+                    init_count,
+                    expected_means(candles[:init_count] + [open_candle], periods),
+                ),
+                (new_candle, init_count, expected),
+                (candles[init_count + 1], init_count + 1, expected),
+            ]
+            moving_average_module._ma_states.clear()
+            for candle, index, want in steps:
+                ma_data = update_moving_average(ma_data, candle, type)
+                for period in periods:
+                    error = abs(ma_data[f"ma_{period}"] - want[period][index])
+                    max_error = max(max_error, error)
+                    assert error <= TOLERANCE, (type, index, period, error)
+
+            print(
+                f"{type}: 윈도우 재구성 후 진행 중/마감/다음 캔들 갱신, 최대 오차 {max_error:.4f}"
+            )
+    finally:
+        moving_average_module.candle_repository = original_repository
+
+
+def main():
+    check_rebuild()
+
+    for type, (init_count, interval) in TIMEFRAMES.items():
+        candles = make_candles(init_count + UPDATES, interval)
+
+        # init_setting_data와 같이 최신순으로 전달
+        ma_data = moving_average(candles[:init_count][::-1], type)
+        periods = [int(key[3:]) for key in ma_data["ma_values"]]
+
+        # 전체 캔들에 대한 pandas rolling 결과 (init_setting_data와 같은 방식)
+        expected = expected_means(candles, periods)
+
+        incremental_sec = 0.0
+        max_error = 0.0
+        for i in range(init_count, init_count + UPDATES):
+            candle = candles[i]
+
+            # 진행 중 캔들 값으로 먼저 저장된 뒤 같은 시각의 최종 값으로 교체되는 경우
+            if i % 5 == 0:
+                open_candle = {**candle, "trade_price": candle["trade_price"] + 5e5}
+                ma_data = update_moving_average(ma_data, open_candle, type)
+
+            start = time.perf_counter()
+            ma_data = update_moving_average(ma_data, candle, type)
+            incremental_sec += time.perf_counter() - start
+
+            for period in periods:
+                error = abs(ma_data[f"ma_{period}"] - expected[period][i])
+                max_error = max(max_error, error)
+                assert error <= TOLERANCE, (type, i, period)
+
+        start = time.perf_counter()
+        moving_average(candles[::-1], type)
+        pandas_sec = time.perf_counter() - start
+
+        lengths = {len(values) for values in ma_data["ma_values"].values()}
+        print(f"{type}: {UPDATES}회 갱신, 최대 오차 {max_error:.4f}")
+        print(f"  증분 갱신 1회       : {incremental_sec / UPDATES * 1e6:9.1f} us")
+        print(f"  pandas 전체 재계산  : {pandas_sec * 1e6:9.1f} us")
+        print(f"  ma_values 길이 범위 : {min(lengths)} ~ {max(lengths)}")
+
+
+if __name__ == "__main__":
+    main()
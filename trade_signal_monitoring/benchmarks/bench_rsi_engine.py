@@ -0,0 +1,99 @@
+"""
+update_rsi 증분 계산 검증 및 벤치마크
+
+init_setting_data의 pandas RSI(ewm(com=13))로 초기 데이터와 계산 상태를 만든 뒤
+캔들을 하나씩 update_rsi로 추가하면서, 매 단계의 RSI가 전체 캔들에 대한 pandas 결과와
+부동소수점 오차 이내로 같은지 확인한다. 진행 중 캔들이 같은 시각의 새 값으로 교체되는
+경우도 함께 검증하고, 이전 방식(마지막 RSI 값에서 평균 상승/하락폭 역산)의 오차와
+1회 갱신 시간을 pandas 전체 재계산과 비교한다.
+
+실행: python benchmarks/bench_rsi_engine.py
+"""
+
+import logging
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
+
+from init_setting_data.calculation.rsi import rsi  # noqa: E402
+from monitoring.calculation.rsi import update_rsi  # noqa: E402
+
+TYPE = "hour1"
+INIT_COUNT = 200
+UPDATES = 500
+TOLERANCE = 1e-9
+
+
+def make_candles(count, seed=7):
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1)
+    price = 120_000_000.0
+    candles = []
+    for i in range(count):
+        price = max(1_000_000.0, price + rng.gauss(0, 400_000))
+        timestamp = (start + timedelta(hours=i)).isoformat()
+        candles.append(
+            {
+                "candle_date_time_utc": timestamp,
+                "candle_date_time_kst": timestamp,
+                "trade_price": round(price, -3),
+            }
+        )
+    return candles
+
+
+def main():
+    # 갱신마다 남기는 로그(파일/콘솔 출력)가 계산 시간보다 커서 측정에서 제외
+    logging.disable(logging.WARNING)
+
+    candles = make_candles(INIT_COUNT + UPDATES)
+    expected = rsi(candles, TYPE)
+    expected_by_timestamp = dict(zip(expected["timestamps"], expected["rsi_values"]))
+
+    rsi_data = rsi(candles[:INIT_COUNT], TYPE)
+    legacy_data = {**rsi_data, "state": None}
+    legacy_data["rsi_values"] = list(legacy_data["rsi_values"])
+    legacy_data["timestamps"] = list(legacy_data["timestamps"])
+
+    incremental_sec = 0.0
+    max_error = 0.0
+    legacy_max_error = 0.0
+    for i in range(INIT_COUNT, INIT_COUNT + UPDATES):
+        candle = candles[i]
+        want = expected_by_timestamp[candle["candle_date_time_utc"]]
+
+        # 진행 중 캔들 값으로 먼저 저장된 뒤 같은 시각의 최종 값으로 교체되는 경우
+        if i % 5 == 0:
+            open_candle = {**candle, "trade_price": candle["trade_price"] + 5e5}
+            rsi_data = update_rsi(rsi_data, open_candle, TYPE)
+
+        start = time.perf_counter()
+        rsi_data = update_rsi(rsi_data, candle, TYPE)
+        incremental_sec += time.perf_counter() - start
+
+        error = abs(rsi_data["current_rsi"] - want)
+        max_error = max(max_error, error)
+        assert error <= TOLERANCE, (i, rsi_data["current_rsi"], want)
+
+        # 이전 방식: 캔들 prev_closing_price 대신 trade_price * 0.99를 이전 종가로 사용
+        legacy_data["state"] = None
+        legacy_data = update_rsi(legacy_data, candle, TYPE)
+        legacy_max_error = max(legacy_max_error, abs(legacy_data["current_rsi"] - want))
+
+    start = time.perf_counter()
+    rsi(candles, TYPE)
+    pandas_sec = time.perf_counter() - start
+
+    print(f"{TYPE}: {UPDATES}회 갱신")
+    print(f"  상태 기반 최대 오차   : {max_error:.3e}")
+    print(f"  이전 방식(역산) 최대 오차: {legacy_max_error:.2f}")
+    print(f"  증분 갱신 1회         : {incremental_sec / UPDATES * 1e6:9.1f} us")
+    print(f"  pandas 전체 재계산    : {pandas_sec * 1e6:9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
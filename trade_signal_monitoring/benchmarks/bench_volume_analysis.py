@@ -0,0 +1,198 @@
+"""
+analyze_volume_from_daily_ticks 벤치마크
+
+7일 x 500틱(현재 업비트 1회 조회 분량)과 7일 x 50,000틱(하루 전체에 가까운 분량)의
+합성 체결 데이터로, 체결 딕셔너리를 파이썬 리스트로 순회하던 기존 일별 지표 계산과
+컬럼형 NumPy 배열 기반 계산을 비교하고 두 결과가 같은지 확인한다.
+재시작 직후처럼 집계가 끝난 날짜가 없는 체결 저장소에서 volume_signal_calc가
+중립 점수(0)를 반환하는지도 확인한다.
+
+실행: python benchmarks/bench_volume_analysis.py
+"""
+
+import math
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
+
+from monitoring.calculation import volume as volume_module  # noqa: E402
+from monitoring.calculation.volume import (  # noqa: E402
+    _daily_volume_metrics,
+    analyze_volume_from_daily_ticks,
+    volume_signal_calc,
+)
+from monitoring.tick_store import TickStore  # noqa: E402
+
+DAYS = 7
+REPEAT = 5
+DAY_MS = 86_400_000
+
+
+def make_daily_ticks(ticks_per_day, seed=42):
+    rng = random.Random(seed)
+    start = int(datetime(2025, 3, 1, tzinfo=timezone.utc).timestamp() * 1000)
+    price = 120_000_000.0
+    daily_ticks = {}
+
+    for day in range(1, DAYS + 1):
+        day_start = start - day * DAY_MS
+        ticks = []
+        for _ in range(ticks_per_day):
+            price += rng.choice((-1000.0, 0.0, 1000.0))
+            ticks.append(
+                {
+                    "timestamp": day_start + rng.randrange(DAY_MS),
+                    "trade_price": price,
+                    "trade_volume": rng.lognormvariate(-5, 1.5),
+                    "ask_bid": rng.choice(("ASK", "BID")),
+                    "change_price": rng.choice((-1000.0, 0.0, 1000.0)),
+                }
+            )
+        # 업비트 응답과 같은 최신순
+        ticks.sort(key=lambda tick: tick["timestamp"], reverse=True)
+        daily_ticks[f"day_ago_{day}"] = ticks
+
+    return daily_ticks
+
+
+def legacy_daily_volume_metrics(day_num, ticks):
+    """NumPy 적용 이전의 일별 지표 계산 (비교 기준)"""
+    volumes = [tick["trade_volume"] for tick in ticks]
+    buy_volumes = [tick["trade_volume"] for tick in ticks if tick["ask_bid"] == "BID"]
+
+    total_volume = sum(volumes)
+    avg_volume = total_volume / len(volumes)
+    large_trades = [vol for vol in volumes if vol > avg_volume * 3]
+
+    hourly_volumes = {}
+    for tick in ticks:
+        hour = datetime.fromtimestamp(tick["timestamp"] / 1000, tz=timezone.utc).hour
+        hourly_volumes.setdefault(hour, []).append(tick["trade_volume"])
+
+    price_changes = []
+    sorted_ticks = sorted(ticks, key=lambda x: x["timestamp"])
+    for i in range(1, len(sorted_ticks)):
+        prev_tick = sorted_ticks[i - 1]
+        curr_tick = sorted_ticks[i]
+        price_change = curr_tick["trade_price"] - prev_tick["trade_price"]
+        price_changes.append(
+            {
+                "change": price_change,
+                "change_pct": price_change / prev_tick["trade_price"] * 100,
+                "volume": curr_tick["trade_volume"],
+                "direction": (
+                    "up"
+                    if price_change > 0
+                    else "down" if price_change < 0 else "stable"
+                ),
+            }
+        )
+
+    up_volumes = [pc["volume"] for pc in price_changes if pc["direction"] == "up"]
+    down_volumes = [pc["volume"] for pc in price_changes if pc["direction"] == "down"]
+    up_avg = sum(up_volumes) / len(up_volumes) if up_volumes else 0
+    down_avg = sum(down_volumes) / len(down_volumes) if down_volumes else 0
+
+    return {
+        "day_num": day_num,
+        "total_volume": total_volume,
+        "avg_volume": avg_volume,
+        "median_volume": statistics.median(volumes),
+        "max_volume": max(volumes),
+        "volume_std": statistics.stdev(volumes) if len(volumes) > 1 else 0,
+        "large_trade_ratio": len(large_trades) / len(volumes),
+        "large_trade_count": len(large_trades),
+        "buy_volume_ratio": sum(buy_volumes) / total_volume if total_volume else 0,
+        "hourly_stats": {
+            hour: {
+                "total": sum(vols),
+                "count": len(vols),
+                "avg": sum(vols) / len(vols),
+            }
+            for hour, vols in hourly_volumes.items()
+        },
+        "up_down_volume_ratio": up_avg / down_avg if down_avg else float("inf"),
+        "data_points": len(ticks),
+    }
+
+
+def assert_close(expected, actual, path="metrics"):
+    if isinstance(expected, dict):
+        assert list(expected) == list(actual), f"{path}: 키 불일치"
+        for key in expected:
+            assert_close(expected[key], actual[key], f"{path}.{key}")
+    elif isinstance(expected, float):
+        assert type(actual) in (float, int), f"{path}: 타입 {type(actual)}"
+        assert math.isclose(
+            expected, actual, rel_tol=1e-9
+        ), f"{path}: {expected} != {actual}"
+    else:
+        assert expected == actual and type(expected) is type(actual), path
+
+
+def best_of(func, *args):
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run_legacy(daily_ticks):
+    for day_key, ticks in daily_ticks.items():
+        legacy_daily_volume_metrics(int(day_key.split("_")[-1]), ticks)
+
+
+def run_vectorized(daily_ticks):
+    for day_key, ticks in daily_ticks.items():
+        _daily_volume_metrics(int(day_key.split("_")[-1]), ticks)
+
+
+def check_empty_store():
+    """집계가 끝난 날짜가 없는 체결 저장소(재시작 직후)에서 중립 점수를 반환하는지 확인"""
+    original_store = volume_module.tick_store
+    try:
+        with tempfile.TemporaryDirectory() as path:
+            volume_module.tick_store = TickStore(path=path)
+            score = volume_signal_calc()
+    finally:
+        volume_module.tick_store = original_store
+
+    assert score == 0, score
+    print(f"빈 체결 저장소: 볼륨 점수 {score}")
+
+
+def main():
+    check_empty_store()
+
+    for ticks_per_day in (500, 50_000):
+        daily_ticks = make_daily_ticks(ticks_per_day)
+
+        for day_key, ticks in daily_ticks.items():
+            day_num = int(day_key.split("_")[-1])
+            assert_close(
+                legacy_daily_volume_metrics(day_num, ticks),
+                _daily_volume_metrics(day_num, ticks),
+                day_key,
+            )
+
+        legacy = best_of(run_legacy, daily_ticks)
+        vectorized = best_of(run_vectorized, daily_ticks)
+        full = best_of(analyze_volume_from_daily_ticks, daily_ticks)
+
+        print(f"{DAYS} x {ticks_per_day:,} ticks")
+        print(f"  일별 지표 (기존 파이썬 순회): {legacy * 1000:9.2f} ms")
+        print(f"  일별 지표 (NumPy)           : {vectorized * 1000:9.2f} ms")
+        print(f"  analyze_volume 전체         : {full * 1000:9.2f} ms")
+        print(f"  속도 향상                   : {legacy / vectorized:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
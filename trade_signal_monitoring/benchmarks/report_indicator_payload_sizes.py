@@ -0,0 +1,109 @@
+"""
+지표 이력 보관 기간 적용 전후의 GET/PUT 페이로드 크기 리포트
+
+보관 기간 없이 DAYS일 동안 캔들마다 포인트가 쌓인 이동평균/RSI/MACD 데이터를
+init_setting_data 계산으로 만들고, monitoring.retention의 보관 기간을 적용했을 때의
+JSON 직렬화 크기와 비교한다.
+
+실행: python benchmarks/report_indicator_payload_sizes.py [DAYS]
+"""
+
+import json
+import random
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
+
+from init_setting_data.calculation.macd import macd  # noqa: E402
+from init_setting_data.calculation.moving_average import (  # noqa: E402
+    moving_average,
+)
+from init_setting_data.calculation.rsi import rsi  # noqa: E402
+from monitoring.retention import get_retention  # noqa: E402
+
+DAYS = int(sys.argv[1]) if len(sys.argv) > 1 else 180
+
+# (캔들 간격, 초기 데이터 캔들 수)
+TIMEFRAMES = {
+    "hour1": (timedelta(hours=1), 168),
+    "hour4": (timedelta(hours=4), 180),
+    "day": (timedelta(days=1), 200),
+    "week": (timedelta(weeks=1), 52),
+}
+
+
+def make_candles(count, interval, seed=11):
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    price = 60_000_000.0
+    candles = []
+    for i in range(count):
+        price = max(1_000_000.0, price + rng.gauss(0, 300_000))
+        candles.append(
+            {
+                "candle_date_time_utc": (start + interval * i).isoformat(),
+                "candle_date_time_kst": (
+                    start + interval * i + timedelta(hours=9)
+                ).isoformat(),
+                "trade_price": round(price, -3),
+            }
+        )
+    # 업비트 응답과 같은 최신순
+    return candles[::-1]
+
+
+def apply_retention(type, ma_data, rsi_data, macd_data):
+    longest_period = max(int(key[3:]) for key in ma_data["ma_values"])
+    ma_keep = max(get_retention("moving_average", type), longest_period)
+    rsi_keep = get_retention("rsi", type)
+    macd_keep = get_retention("macd", type)
+
+    ma_data = {
+        **ma_data,
+        "ma_values": {
+            key: values[-ma_keep:] for key, values in ma_data["ma_values"].items()
+        },
+    }
+    rsi_data = {
+        **rsi_data,
+        "rsi_values": rsi_data["rsi_values"][-rsi_keep:],
+        "timestamps": rsi_data["timestamps"][-rsi_keep:],
+    }
+    macd_data = {
+        key: value[-macd_keep:] if isinstance(value, list) else value
+        for key, value in macd_data.items()
+    }
+    return ma_data, rsi_data, macd_data
+
+
+def payload_size(body):
+    return len(json.dumps(body, default=str).encode())
+
+
+def main():
+    print(f"보관 기간 없이 {DAYS}일 운영했을 때의 페이로드 크기 (KB)")
+    print(f"{'type':6} {'지표':15} {'적용 전':>10} {'적용 후':>10} {'감소율':>8}")
+
+    for type, (interval, init_count) in TIMEFRAMES.items():
+        count = init_count + int(timedelta(days=DAYS) / interval)
+        candles = make_candles(count, interval)
+
+        ma_data = moving_average(candles, type)
+        rsi_data = rsi(candles, type)
+        macd_data = macd(type, ma_data["ma_values"])
+        before = {"moving_average": ma_data, "rsi": rsi_data, "macd": macd_data}
+        after = dict(zip(before, apply_retention(type, ma_data, rsi_data, macd_data)))
+
+        for indicator in before:
+            before_kb = payload_size(before[indicator]) / 1024
+            after_kb = payload_size(after[indicator]) / 1024
+            print(
+                f"{type:6} {indicator:15} {before_kb:10.1f} {after_kb:10.1f} "
+                f"{(1 - after_kb / before_kb) * 100:7.1f}%"
+            )
+
+
+if __name__ == "__main__":
+    main()